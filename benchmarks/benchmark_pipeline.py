@@ -0,0 +1,326 @@
+"""
+Suite de benchmarks del pipeline completo (sin red y reproducible).
+
+Mide cada etapa con datos sintéticos y semillas fijas:
+
+    difuso_individual      SistemaDifusoSiembra.evaluar (skfuzzy, un día por llamada)
+    difuso_lote            SistemaDifusoSiembra.evaluar_lote (motor vectorizado)
+    aptitud_lote           calcular_aptitud_lote (aptitud del optimizador)
+    puntuacion_ventanas    Tablas (perfil × día de siembra) de todos los perfiles
+    paisaje_sitios         Paisajes de muchos sitios en una llamada
+    ag / pso               Una optimización completa con cada backend
+    carga_csv / carga_npy  Lectura del pronóstico por bloques (CSV y binario)
+    ventanas_dataset       crear_dataset_ia (ventanas deslizantes de entrenamiento)
+    pronostico_recursivo   predecir_recursivamente con un modelo lineal de NumPy
+                           en lugar de la LSTM (no requiere TensorFlow)
+
+Cada caso guarda tiempos (mediana y mínimo de varias repeticiones), el
+rendimiento (elementos/s) y un valor de verificación que debe ser idéntico
+entre corridas. El resultado es JSON para compararlo entre commits:
+
+    python benchmarks/benchmark_pipeline.py --salida base.json
+    python benchmarks/benchmark_pipeline.py --comparar base.json --tolerancia 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Agregamos la ruta del proyecto
+RUTA_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RUTA_PROYECTO)
+
+SEMILLA = 2026
+VERSION_FORMATO = 1
+
+
+# --- DATOS SINTÉTICOS ---
+
+def clima_sintetico(n_dias: int, semilla: int = SEMILLA, sitios: int = None):
+    """
+    Temperatura y lluvia diarias con estacionalidad tipo Mixteca (temporada
+    de lluvias de junio a septiembre). Retorna (temps, lluvias) 1-D, o 2-D
+    (sitios × días) si se indica `sitios`.
+    """
+    rng = np.random.default_rng(semilla)
+    forma = (n_dias,) if sitios is None else (sitios, n_dias)
+    dia = np.arange(n_dias) % 365
+    temps = 21 + 5 * np.sin(2 * np.pi * (dia - 80) / 365) + rng.normal(0, 2, forma)
+    prob_lluvia = 0.1 + 0.6 * np.exp(-((dia - 215) / 50.0) ** 2)
+    lluvias = np.where(rng.random(forma) < prob_lluvia, rng.gamma(2.0, 4.0, forma), 0.0)
+    return temps, lluvias
+
+
+class ModeloLinealSintetico:
+    """Sustituto de la LSTM: predict(x) = promedio ponderado de la ventana."""
+
+    def __init__(self, ventana: int, semilla: int = SEMILLA):
+        rng = np.random.default_rng(semilla)
+        pesos = rng.random(ventana)
+        self.pesos = pesos / pesos.sum()
+
+    def predict(self, x, verbose=0):
+        return np.einsum('bvf,v->bf', x[:, :, :2], self.pesos)
+
+
+# --- MEDICIÓN ---
+
+def medir(funcion, repeticiones: int = 5, elementos: int = None, calentamiento: int = 1):
+    """
+    Corre `funcion` varias veces. Retorna (estadisticas, ultimo_valor).
+    """
+    for _ in range(calentamiento):
+        valor = funcion()
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        valor = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    estadisticas = {
+        "mediana_s": float(np.median(tiempos)),
+        "min_s": float(np.min(tiempos)),
+        "repeticiones": repeticiones,
+    }
+    if elementos:
+        estadisticas["elementos"] = int(elementos)
+        estadisticas["elementos_por_s"] = float(elementos / np.median(tiempos))
+    return estadisticas, valor
+
+
+def _verificacion(valor) -> float:
+    """Resumen numérico estable de la salida de un caso."""
+    return float(np.round(np.nansum(np.asarray(valor, dtype=float)), 6))
+
+
+# --- CASOS ---
+
+def casos_difusos(repeticiones: int):
+    from src.fuzzy.fuzzy_system import SistemaDifusoSiembra, calcular_aptitud_lote
+
+    sistema = SistemaDifusoSiembra()
+    temps, lluvias = clima_sintetico(100_000)
+    resultados = {}
+
+    # Siempre el mismo bloque, así la verificación no depende de
+    # --repeticiones. skfuzzy guarda en caché las entradas ya vistas: se
+    # vacía al inicio de cada repetición para medir inferencias y no aciertos
+    n = 200
+
+    def individual():
+        sistema.simulacion.reset()
+        return [sistema.evaluar(t, p)["score_amplitud"]
+                for t, p in zip(temps[:n], lluvias[:n])]
+
+    est, valor = medir(individual, repeticiones, elementos=n)
+    resultados["difuso_individual"] = dict(est, verificacion=_verificacion(valor))
+
+    est, valor = medir(lambda: sistema.evaluar_lote(temps, lluvias)[0],
+                       repeticiones, elementos=temps.size)
+    resultados["difuso_lote"] = dict(est, verificacion=_verificacion(valor))
+
+    est, valor = medir(lambda: calcular_aptitud_lote(lluvias, temps)[0],
+                       repeticiones, elementos=temps.size)
+    resultados["aptitud_lote"] = dict(est, verificacion=_verificacion(valor))
+    return resultados
+
+
+def casos_puntuacion(repeticiones: int):
+    from src.optimization.motor_puntuacion import MotorPuntuacion
+    from src.optimization.panorama import paisaje_aptitud
+    from src.optimization.perfiles_cultivo import PERFILES
+
+    temps, lluvias = clima_sintetico(365)
+    motor = MotorPuntuacion.desde_clima(temps, lluvias)
+    resultados = {}
+
+    def tablas():
+        # Motor nuevo en cada repetición para no medir la caché de tablas
+        return MotorPuntuacion(motor.aptitud).tabla_perfiles(PERFILES.values())[1]
+
+    est, valor = medir(tablas, repeticiones, elementos=len(PERFILES))
+    resultados["puntuacion_ventanas"] = dict(est, verificacion=_verificacion(valor))
+
+    rng = np.random.default_rng(SEMILLA)
+    aptitud_sitios = motor.aptitud + rng.normal(0, 1, (500, motor.n_dias))
+    est, valor = medir(lambda: paisaje_aptitud(aptitud_sitios, PERFILES.values())[1],
+                       repeticiones, elementos=500)
+    resultados["paisaje_sitios"] = dict(est, verificacion=_verificacion(valor))
+    return resultados, motor
+
+
+def casos_optimizacion(motor, repeticiones: int):
+    from src.optimization import algoritmo_genetico, algoritmo_pso
+
+    resultados = {}
+    for nombre, modulo in (("ag", algoritmo_genetico), ("pso", algoritmo_pso)):
+        est, valor = medir(lambda: modulo.optimizar("maiz_120", motor=motor, semilla=SEMILLA),
+                           repeticiones)
+        resultados[nombre] = dict(est, verificacion=float(valor.aptitud),
+                                  mejor_dia=valor.mejor_dia,
+                                  evaluaciones=valor.evaluaciones,
+                                  motivo_paro=valor.motivo_paro)
+    return resultados
+
+
+def casos_pronostico(repeticiones: int, directorio: str):
+    from src.neural.gestor_climatico import (NOMBRES_COLUMNAS, guardar_pronostico_binario,
+                                             iterar_pronostico)
+
+    n_dias = 365 * 20
+    temps, lluvias = clima_sintetico(n_dias)
+    fechas = pd.date_range("2026-01-01", periods=n_dias, freq="D")
+    columnas = {v: k for k, v in NOMBRES_COLUMNAS.items()}
+    ruta_csv = os.path.join(directorio, "pronostico_sintetico.csv")
+    ruta_npy = os.path.join(directorio, "pronostico_sintetico.npy")
+    pd.DataFrame({"Fecha": fechas, columnas['temp']: temps,
+                  columnas['lluvia']: lluvias}).to_csv(ruta_csv, index=False)
+    guardar_pronostico_binario(ruta_csv, ruta_npy)
+
+    def leer(ruta):
+        return sum(float(np.sum(t)) for _, t, _ in iterar_pronostico(ruta))
+
+    resultados = {}
+    est, valor = medir(lambda: leer(ruta_csv), repeticiones, elementos=n_dias)
+    resultados["carga_csv"] = dict(est, verificacion=round(valor, 2))
+    est, valor = medir(lambda: leer(ruta_npy), repeticiones, elementos=n_dias)
+    resultados["carga_npy"] = dict(est, verificacion=round(valor, 2))
+    return resultados
+
+
+def casos_red_neuronal(repeticiones: int):
+    from src.neural.generar_pronostico import N_FEATURES, predecir_recursivamente
+    from src.neural.preparacion_datos import VENTANA_DIAS, crear_dataset_ia
+
+    resultados = {}
+    n_dias = 2000
+    temps, lluvias = clima_sintetico(n_dias)
+    dia = np.arange(n_dias) % 365 + 1
+    df = pd.DataFrame({
+        'Temp_Norm': (temps - temps.min()) / np.ptp(temps),
+        'Lluvia_Norm': lluvias / lluvias.max(),
+        'Dia_Sin': np.sin(2 * np.pi * dia / 365.0),
+        'Dia_Cos': np.cos(2 * np.pi * dia / 365.0),
+    })
+    est, valor = medir(lambda: crear_dataset_ia(df, VENTANA_DIAS).to_numpy(),
+                       repeticiones, elementos=n_dias - VENTANA_DIAS)
+    resultados["ventanas_dataset"] = dict(est, verificacion=_verificacion(valor))
+
+    entrada = df.to_numpy()[:VENTANA_DIAS].reshape(1, VENTANA_DIAS, N_FEATURES)
+    modelo = ModeloLinealSintetico(VENTANA_DIAS)
+    dias = 365
+    est, valor = medir(lambda: predecir_recursivamente(entrada, None, pd.Timestamp("2025-12-31"),
+                                                       modelo=modelo, dias=dias)[0],
+                       repeticiones, elementos=dias)
+    resultados["pronostico_recursivo"] = dict(est, verificacion=_verificacion(valor))
+    return resultados
+
+
+# --- EJECUCIÓN Y COMPARACIÓN ---
+
+def _commit_actual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RUTA_PROYECTO,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def correr_benchmarks(repeticiones: int = 5, casos=None):
+    """Corre la suite completa (o los grupos en `casos`). Retorna el reporte (dict)."""
+    grupos = casos or ["difuso", "puntuacion", "optimizacion", "pronostico", "red"]
+    resultados = {}
+
+    with tempfile.TemporaryDirectory() as directorio:
+        if "difuso" in grupos:
+            resultados.update(casos_difusos(repeticiones))
+        if "puntuacion" in grupos or "optimizacion" in grupos:
+            puntuacion, motor = casos_puntuacion(repeticiones)
+            if "puntuacion" in grupos:
+                resultados.update(puntuacion)
+            if "optimizacion" in grupos:
+                resultados.update(casos_optimizacion(motor, repeticiones))
+        if "pronostico" in grupos:
+            resultados.update(casos_pronostico(repeticiones, directorio))
+        if "red" in grupos:
+            resultados.update(casos_red_neuronal(repeticiones))
+
+    return {
+        "version": VERSION_FORMATO,
+        "semilla": SEMILLA,
+        "commit": _commit_actual(),
+        "entorno": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(actual, base, tolerancia: float = 0.25):
+    """
+    Compara dos reportes. Una regresión es un caso cuya mediana empeora más
+    de `tolerancia` (fracción) o cuya verificación cambia.
+
+    Returns:
+        list: Mensajes de regresión (vacía si no hay).
+    """
+    regresiones = []
+    for caso, medicion in actual["resultados"].items():
+        previo = base["resultados"].get(caso)
+        if previo is None:
+            continue
+        cambio = medicion["mediana_s"] / previo["mediana_s"] - 1
+        print(f" {caso:<22} {previo['mediana_s'] * 1e3:>10.2f} ms → "
+              f"{medicion['mediana_s'] * 1e3:>10.2f} ms ({cambio:+.0%})")
+        if cambio > tolerancia:
+            regresiones.append(f"{caso}: {cambio:+.0%} más lento")
+        if not np.isclose(medicion["verificacion"], previo["verificacion"], rtol=1e-9, atol=1e-6):
+            regresiones.append(f"{caso}: verificación {previo['verificacion']} → "
+                               f"{medicion['verificacion']}")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del pipeline de siembra")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el reporte")
+    parser.add_argument("--comparar", help="Reporte JSON base contra el cual comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="Fracción de empeoramiento tolerada (default: 0.25)")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--casos", nargs="+",
+                        choices=["difuso", "puntuacion", "optimizacion", "pronostico", "red"])
+    args = parser.parse_args(argv)
+
+    reporte = correr_benchmarks(args.repeticiones, args.casos)
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(texto)
+        print(f"✅ Reporte guardado en: {args.salida}")
+    else:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            base = json.load(f)
+        regresiones = comparar(reporte, base, args.tolerancia)
+        for mensaje in regresiones:
+            print(f"❌ {mensaje}")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Arnés de exactitud vs. velocidad de los motores difusos.
+
+Cualquier evaluador más rápido tiene que seguir siendo fiel a la referencia
+skfuzzy (`SistemaDifusoSiembra.evaluar`, un día por llamada). Este script
+compara cada motor del registro (src/fuzzy/motores.py) contra la referencia en:
+
+    rejilla     Barrido denso de todo el dominio (5–45 °C × 0–45 mm). Los
+                nodos no coinciden con la rejilla del memo ni con la del
+                motor tabulado, para medir el peor caso de la aproximación.
+    real        Los días del pronóstico (data/processed/Pronostico_2026_IA.csv).
+    sintetico_* Años sintéticos con semilla fija (ver benchmark_pipeline.py).
+
+y reporta, por motor:
+
+    - Desviación absoluta máxima y media del score.
+    - Tasa de cambio de categoría (EXCELENTE/BUENO/REGULAR/MALO).
+    - Rendimiento (días/s) sobre la rejilla.
+    - El día óptimo de cada perfil de cultivo en los años de referencia, que
+      debe ser IDÉNTICO al de la referencia, y la aptitud que se perdería.
+
+Uso:
+
+    python benchmarks/fidelidad_motores.py --salida fidelidad.json
+    python benchmarks/fidelidad_motores.py --motores vectorizado tabulado --max-desviacion 0.5
+
+Termina con código 1 si algún motor supera las tolerancias o cambia un día óptimo.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+# Agregamos la ruta del proyecto
+RUTA_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RUTA_PROYECTO)
+
+from benchmarks.benchmark_pipeline import SEMILLA, clima_sintetico  # noqa: E402
+from src.fuzzy.motor_vectorizado import RANGO_LLUVIA, RANGO_TEMPERATURA  # noqa: E402
+from src.fuzzy.motores import MOTORES as MOTORES_DIFUSOS, crear_motor  # noqa: E402
+
+
+# --- MOTORES ---
+# Cada fábrica recibe el SistemaDifusoSiembra de referencia y devuelve una
+# función (temps, lluvias) -> scores con la semántica de `evaluar`
+# (score redondeado a 2 decimales y valores fijos si no se activa ninguna regla).
+
+def _motor_referencia(sistema):
+    def evaluar(temps, lluvias):
+        sistema.desactivar_memo()
+        return np.array([sistema.evaluar(t, p)["score_amplitud"]
+                         for t, p in zip(temps, lluvias)])
+    return evaluar
+
+
+def _motor_registrado(nombre):
+    def fabrica(sistema):
+        motor = crear_motor(nombre, sistema)
+        return lambda temps, lluvias: np.round(motor.evaluar_lote(temps, lluvias)[0], 2)
+    return fabrica
+
+
+# La referencia es la API pública `evaluar`; el resto sale del registro de
+# src/fuzzy/motores.py (su "skfuzzy" es el adaptador por lotes de la referencia)
+REFERENCIA = "referencia"
+MOTORES = {REFERENCIA: _motor_referencia,
+           **{nombre: _motor_registrado(nombre) for nombre in MOTORES_DIFUSOS}}
+
+
+# --- CONJUNTOS DE DATOS ---
+
+def rejilla_densa(puntos_temperatura: int = 73, puntos_lluvia: int = 67):
+    """Rejilla regular de todo el dominio válido, aplanada a (temps, lluvias)."""
+    malla_t, malla_p = np.meshgrid(np.linspace(*RANGO_TEMPERATURA, puntos_temperatura),
+                                   np.linspace(*RANGO_LLUVIA, puntos_lluvia), indexing='ij')
+    return malla_t.ravel(), malla_p.ravel()
+
+
+def anios_referencia(n_sinteticos: int = 2):
+    """{nombre: (temps, lluvias)} de un año: el pronóstico real y años sintéticos."""
+    from src.neural.gestor_climatico import df_clima
+
+    anios = {}
+    if not df_clima.empty and {'temp', 'lluvia'} <= set(df_clima.columns):
+        anios["real"] = (df_clima['temp'].to_numpy(float), df_clima['lluvia'].to_numpy(float))
+    for i in range(n_sinteticos):
+        anios[f"sintetico_{i}"] = clima_sintetico(365, SEMILLA + i)
+    # La referencia lanza ValueError fuera de rango: se compara sólo dentro del dominio
+    return {nombre: (np.clip(t, *RANGO_TEMPERATURA), np.clip(p, *RANGO_LLUVIA))
+            for nombre, (t, p) in anios.items()}
+
+
+# --- MÉTRICAS ---
+
+def desviacion(scores, referencia):
+    """Desviación absoluta máxima/media y tasa de cambio de categoría."""
+    from src.fuzzy.fuzzy_system import clasificar_lote
+
+    error = np.abs(np.asarray(scores) - np.asarray(referencia))
+    categorias, _ = clasificar_lote(scores)
+    categorias_ref, _ = clasificar_lote(referencia)
+    return {
+        "desviacion_maxima": float(error.max()),
+        "desviacion_media": float(error.mean()),
+        "tasa_cambio_categoria": float(np.mean(categorias != categorias_ref)),
+        "muestras": int(error.size),
+    }
+
+
+def dias_optimos(scores):
+    """Día óptimo y tabla de fitness de cada perfil con un vector de aptitud diaria."""
+    from src.optimization.motor_puntuacion import MotorPuntuacion
+    from src.optimization.perfiles_cultivo import PERFILES
+
+    motor = MotorPuntuacion(scores)
+    return {nombre: (motor.mejores_dias([perfil])[nombre][0], motor.puntuar_perfil(perfil))
+            for nombre, perfil in PERFILES.items()}
+
+
+def comparar_optimos(optimos, optimos_ref):
+    """Perfiles cuyo día óptimo cambia y la aptitud (de referencia) que se pierde."""
+    cambios = {}
+    for nombre, (dia_ref, tabla_ref) in optimos_ref.items():
+        dia = optimos[nombre][0]
+        if dia != dia_ref:
+            cambios[nombre] = {"dia_referencia": dia_ref, "dia": dia,
+                               "aptitud_perdida": float(tabla_ref[dia_ref - 1] - tabla_ref[dia - 1])}
+    return cambios
+
+
+# --- EJECUCIÓN ---
+
+def correr_fidelidad(motores=None, puntos_temperatura: int = 73, puntos_lluvia: int = 67,
+                     n_sinteticos: int = 2):
+    """
+    Evalúa cada motor contra la referencia. Retorna el reporte (dict).
+    """
+    from src.fuzzy.fuzzy_system import SistemaDifusoSiembra
+
+    nombres = [REFERENCIA] + [m for m in (motores or MOTORES) if m != REFERENCIA]
+    desconocidos = set(nombres) - set(MOTORES)
+    if desconocidos:
+        raise ValueError(f"❌ Motores desconocidos: {', '.join(sorted(desconocidos))}. "
+                         f"Opciones: {', '.join(MOTORES)}")
+
+    sistema = SistemaDifusoSiembra()
+    temps, lluvias = rejilla_densa(puntos_temperatura, puntos_lluvia)
+    anios = anios_referencia(n_sinteticos)
+
+    salidas = {}
+    reporte = {}
+    for nombre in nombres:
+        inicio = time.perf_counter()
+        evaluar = MOTORES[nombre](sistema)
+        preparacion = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        scores_rejilla = evaluar(temps, lluvias)
+        tiempo = time.perf_counter() - inicio
+
+        salidas[nombre] = {
+            "rejilla": scores_rejilla,
+            **{anio: evaluar(t, p) for anio, (t, p) in anios.items()},
+        }
+        reporte[nombre] = {
+            "preparacion_s": preparacion,
+            "tiempo_rejilla_s": tiempo,
+            "dias_por_s": temps.size / tiempo,
+        }
+
+    referencia = salidas[REFERENCIA]
+    optimos_ref = {anio: dias_optimos(referencia[anio]) for anio in anios}
+    for nombre in nombres:
+        reporte[nombre]["exactitud"] = {conjunto: desviacion(scores, referencia[conjunto])
+                                        for conjunto, scores in salidas[nombre].items()}
+        reporte[nombre]["dias_optimos_cambiados"] = {
+            anio: cambios for anio in anios
+            if (cambios := comparar_optimos(dias_optimos(salidas[nombre][anio]), optimos_ref[anio]))
+        }
+
+    return {
+        "referencia": REFERENCIA,
+        "rejilla": [puntos_temperatura, puntos_lluvia],
+        "anios": list(anios),
+        "dias_optimos_referencia": {anio: {perfil: dia for perfil, (dia, _) in optimos.items()}
+                                    for anio, optimos in optimos_ref.items()},
+        "motores": reporte,
+    }
+
+
+def fallas(reporte, max_desviacion: float = 1.0, max_cambio_categoria: float = 0.01):
+    """Mensajes de los motores que exceden las tolerancias (vacía si todo pasa)."""
+    mensajes = []
+    for nombre, datos in reporte["motores"].items():
+        for conjunto, metricas in datos["exactitud"].items():
+            if metricas["desviacion_maxima"] > max_desviacion:
+                mensajes.append(f"{nombre}/{conjunto}: desviación máxima "
+                                f"{metricas['desviacion_maxima']:.3f} > {max_desviacion}")
+            if metricas["tasa_cambio_categoria"] > max_cambio_categoria:
+                mensajes.append(f"{nombre}/{conjunto}: cambio de categoría "
+                                f"{metricas['tasa_cambio_categoria']:.2%} > {max_cambio_categoria:.2%}")
+        for anio, cambios in datos["dias_optimos_cambiados"].items():
+            for perfil, cambio in cambios.items():
+                # Con aptitud perdida 0 es un empate en la meseta del paisaje,
+                # pero el día elegido igual cambia: también cuenta como falla
+                mensajes.append(f"{nombre}/{anio}: {perfil} día {cambio['dia_referencia']} → "
+                                f"{cambio['dia']} (pierde {cambio['aptitud_perdida']:.2f})")
+    return mensajes
+
+
+def imprimir_resumen(reporte):
+    print(f"\n {'motor':<12} {'días/s':>12} {'desv. máx':>10} {'desv. media':>12} {'cambio cat.':>12}")
+    for nombre, datos in reporte["motores"].items():
+        rejilla = datos["exactitud"]["rejilla"]
+        print(f" {nombre:<12} {datos['dias_por_s']:>12,.0f} {rejilla['desviacion_maxima']:>10.3f} "
+              f"{rejilla['desviacion_media']:>12.4f} {rejilla['tasa_cambio_categoria']:>12.2%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exactitud vs. velocidad de los motores difusos")
+    parser.add_argument("--salida", help="Archivo JSON donde guardar el reporte")
+    parser.add_argument("--motores", nargs="+", choices=list(MOTORES),
+                        help="Motores a comparar (default: todos)")
+    parser.add_argument("--puntos", type=int, nargs=2, default=[73, 67],
+                        metavar=("TEMPERATURA", "LLUVIA"),
+                        help="Puntos de la rejilla densa por eje (default: 73 67)")
+    parser.add_argument("--sinteticos", type=int, default=2,
+                        help="Años sintéticos de referencia (default: 2)")
+    parser.add_argument("--max-desviacion", type=float, default=1.0,
+                        help="Desviación absoluta máxima tolerada del score (default: 1.0)")
+    parser.add_argument("--max-cambio-categoria", type=float, default=0.01,
+                        help="Fracción de días que pueden cambiar de categoría (default: 0.01)")
+    args = parser.parse_args(argv)
+
+    reporte = correr_fidelidad(args.motores, *args.puntos, n_sinteticos=args.sinteticos)
+    imprimir_resumen(reporte)
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+        print(f"✅ Reporte guardado en: {args.salida}")
+
+    mensajes = fallas(reporte, args.max_desviacion, args.max_cambio_categoria)
+    for mensaje in mensajes:
+        print(f"❌ {mensaje}")
+    return 1 if mensajes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
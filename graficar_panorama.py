@@ -1,15 +1,18 @@
 """
 Script de visualización del "Panorama de Aptitud".
 
-Este módulo realiza un análisis de fuerza bruta para calcular el "fitness" o
-aptitud de siembra para cada día posible del año. Luego, genera una gráfica
-que muestra cómo varía esta aptitud, destacando el día óptimo.
+Este módulo obtiene el "fitness" o aptitud de siembra de cada día posible del
+año con una sola pasada difusa vectorizada y sumas por ventana (ver
+src/optimization/panorama.py), para todos los perfiles de cultivo a la vez.
+Luego, genera una gráfica que muestra cómo varía esta aptitud, destacando el día óptimo.
 """
 
 import os  # <--- NUEVO: Para manejar rutas de archivos
 import matplotlib.pyplot as plt
-from src.neural.gestor_climatico import obtener_clima_real
-from src.fuzzy.fuzzy_system import calcular_aptitud
+from src.optimization.algoritmo_genetico import optimizar
+from src.optimization.motor_puntuacion import obtener_motor
+from src.optimization.panorama import paisaje_aptitud
+from src.optimization.perfiles_cultivo import PERFILES
 
 # Configuración estética
 plt.style.use('ggplot')
@@ -20,35 +23,18 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 # Asumimos que el script está en una subcarpeta (ej: src/viz), subimos al root
 project_root = os.path.dirname(os.path.dirname(current_dir)) 
 
-def obtener_score_del_dia(dia_inicio):
-    """
-    Calcula el puntaje de aptitud total para un ciclo de cultivo.
-    """
-    datos = obtener_clima_real(dia_inicio, duracion_cultivo=120)
+print("⏳ Generando el Panorama Completo...")
 
-    if not datos:
-        return 0
+# --- 1. Paisajes de todos los perfiles en una sola llamada ---
+# La aptitud diaria ya la calculó el motor de puntuación (una pasada difusa
+# vectorizada); cada paisaje es una suma por ventana sobre ella.
+nombres, paisajes = paisaje_aptitud(obtener_motor().aptitud, PERFILES.values())
+principal = nombres.index("maiz_120")
+dias = list(range(1, PERFILES["maiz_120"].ultimo_dia_siembra + 1))
+scores = paisajes[principal, :len(dias)].tolist()
 
-    score = 0
-    for dia in datos:
-        try:
-            s = calcular_aptitud(dia['lluvia'], dia['temp'])
-            score += s
-        except Exception:
-            pass
-    return score
-
-
-print("⏳ Generando el Panorama Completo (Esto puede tardar unos segundos)...")
-
-# --- 1. Análisis de Fuerza Bruta ---
-dias = list(range(1, 241))
-scores = []
-
-for d in dias:
-    if d % 20 == 0:
-        print(f"   ... Calculando día {d}")
-    scores.append(obtener_score_del_dia(d))
+# Resultado del optimizador para comparar con el óptimo del paisaje
+resultado = optimizar("maiz_120")
 
 # --- 2. Identificación del Óptimo Real ---
 max_score = max(scores)
@@ -57,11 +43,18 @@ mejor_dia_real = dias[scores.index(max_score)]
 # --- 3. Generación de la Gráfica ---
 plt.figure(figsize=(12, 6))
 
-plt.plot(dias, scores, color='#2ecc71', linewidth=2, label='Aptitud (Score)')
+plt.plot(dias, scores, color='#2ecc71', linewidth=2, label='Aptitud (Score) maiz_120')
 plt.fill_between(dias, scores, color='#2ecc71', alpha=0.3)
 
+# Otros perfiles (duraciones de ciclo) como referencia
+for nombre, paisaje in zip(nombres, paisajes):
+    if nombre != "maiz_120":
+        plt.plot(range(1, paisaje.size + 1), paisaje, linewidth=1, alpha=0.6, label=nombre)
+
 # Se destaca el punto óptimo encontrado
 plt.plot(mejor_dia_real, max_score, 'ro', markersize=10, label=f'Óptimo Real (Día {mejor_dia_real})')
+plt.axvline(resultado.mejor_dia, color='gray', linestyle=':',
+            label=f'{resultado.algoritmo} (Día {resultado.mejor_dia})')
 plt.annotate(f'Mejor Fecha\nDía {mejor_dia_real}',
              xy=(mejor_dia_real, max_score),
              xytext=(mejor_dia_real+10, max_score),
@@ -80,7 +73,9 @@ plt.xticks(posiciones_meses, nombres_meses)
 
 plt.tight_layout()
 
-print(f"¡Listo! El mejor día calculado a fuerza bruta fue: {mejor_dia_real}")
+print(f"¡Listo! El mejor día del paisaje completo fue: {mejor_dia_real}")
+print(f"El {resultado.algoritmo} encontró el día {resultado.mejor_dia} "
+      f"con {resultado.evaluaciones} evaluaciones en {resultado.tiempo:.3f} s")
 
 # --- 4. GUARDADO DE IMAGEN (NUEVO) ---
 # Guardamos la imagen en la raíz del proyecto (o donde prefieras)
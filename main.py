@@ -3,35 +3,92 @@ Punto de entrada principal para el Sistema de Optimización de Siembra Mixteca.
 
 Este script ejecuta el algoritmo de optimización (PSO/Genético) y, además de dar
 la fecha, genera una gráfica del pronóstico climático para el ciclo de cultivo seleccionado.
+
+Para todas las etapas del pipeline (preparar datos, entrenar, pronosticar,
+evaluar, optimizar, reportar) ver `python -m src --help` (src/cli.py).
+
+Las gráficas se guardan como imagen sin abrir ventanas. Con `--sin-graficas`
+no se genera ninguna (modo headless para corridas en lote).
+
+Con `--metricas RUTA` se registran tiempos por etapa y contadores (ver
+src/instrumentacion.py) y se guardan al final en RUTA (JSON, o texto de
+Prometheus si termina en .prom).
+
+Con `--profile [BASE]` la etapa de optimización se perfila con cProfile y con
+un muestreador de pilas (ver src/perfilado.py): se escriben BASE.txt (puntos
+calientes), BASE.folded (pilas para flamegraph) y BASE.prof (default BASE:
+perfil_siembra).
 """
 
+import argparse
 import datetime
-import matplotlib.pyplot as plt
 import os
-import sys
+
+from src import instrumentacion
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Sistema de Optimización de Siembra Mixteca")
+    parser.add_argument("--backend", choices=("ag", "pso"), default="ag",
+                        help="Optimizador (default: algoritmo genético)")
+    parser.add_argument("--sin-graficas", action="store_true",
+                        help="No generar ninguna gráfica (modo headless)")
+    parser.add_argument("--metricas", metavar="RUTA",
+                        help="Guardar tiempos y contadores (JSON, o Prometheus si termina en .prom)")
+    parser.add_argument("--profile", metavar="BASE", nargs="?", const="perfil_siembra",
+                        help="Perfilar la optimización (default BASE: perfil_siembra)")
+    return parser
+
+
+# Al importarse como módulo no se lee sys.argv (sería el del programa que importa)
+ARGS = crear_parser().parse_args([] if __name__ != "__main__" else None)
+
+# La instrumentación se activa antes de importar el resto para medir también
+# la carga del CSV y la construcción del sistema difuso
+RUTA_METRICAS = ARGS.metricas
+if RUTA_METRICAS:
+    instrumentacion.activar()
 
 # --- IMPORTACIONES ---
-from src.optimization.algoritmo_genetico import correr_optimizacion
-#from src.optimization.algoritmo_pso import correr_optimizacion
+# El optimizador se elige con `--backend pso` (default: algoritmo genético)
+if ARGS.backend == "pso":
+    from src.optimization.algoritmo_pso import correr_optimizacion
+else:
+    from src.optimization.algoritmo_genetico import correr_optimizacion
 
 # Necesitamos esta función para graficar el clima del periodo ganador
 from src.neural.gestor_climatico import obtener_clima_real 
+from src.optimization.perfiles_cultivo import obtener_perfil
+
+# Perfil de cultivo a optimizar (ver src/optimization/perfiles_cultivo.py)
+PERFIL = obtener_perfil("maiz_120")
 
 if __name__ == "__main__":
+    graficar = not ARGS.sin_graficas
+    base_perfil = ARGS.profile
+
     # --- 1. Ejecución del Algoritmo de Optimización ---
     print("--- SISTEMA DE OPTIMIZACIÓN DE SIEMBRA MIXTECA ---")
     print("Iniciando búsqueda de la mejor ventana de siembra...")
 
-    # Obtiene el día (número entero 1-365)
-    mejor_dia = correr_optimizacion()
+    # Resultado estructurado: mejor día (1-365), aptitud, historial, evaluaciones...
+    if base_perfil:
+        from src.perfilado import imprimir_resumen, perfilar
+
+        with perfilar(base_perfil) as info_perfil:
+            resultado = correr_optimizacion(PERFIL, graficar=graficar)
+        imprimir_resumen(info_perfil)
+    else:
+        resultado = correr_optimizacion(PERFIL, graficar=graficar)
+    mejor_dia = resultado.mejor_dia
 
     print(f"Recomendación final para el agricultor: Sembrar en el día {mejor_dia} del año.")
 
     # --- 2. Conversión del resultado a una fecha legible ---
     fecha_inicio = datetime.date(2026, 1, 1) + datetime.timedelta(days=int(mejor_dia) - 1)
     
-    # Calculamos también la fecha de cosecha (120 días después)
-    fecha_cosecha = fecha_inicio + datetime.timedelta(days=120)
+    # Calculamos también la fecha de cosecha (duración del ciclo del perfil)
+    fecha_cosecha = fecha_inicio + datetime.timedelta(days=PERFIL.duracion)
 
     meses_es = {
         1: "Enero", 2: "Febrero", 3: "Marzo", 4: "Abril", 5: "Mayo", 6: "Junio",
@@ -41,49 +98,32 @@ if __name__ == "__main__":
     print(f"\nFecha exacta recomendada: {fecha_inicio.day} de {meses_es[fecha_inicio.month]} de {fecha_inicio.year}")
     print(f"Fecha estimada de cosecha: {fecha_cosecha.day} de {meses_es[fecha_cosecha.month]} de {fecha_cosecha.year}")
 
-    # --- 3. GENERACIÓN DE GRÁFICA DE LA VENTANA SELECCIONADA (NUEVO) ---
-    print("\nGenerando gráfica del clima para el periodo seleccionado...")
+    # --- 3. GENERACIÓN DE GRÁFICA DE LA VENTANA SELECCIONADA (opcional) ---
+    datos_cultivo = None
+    if graficar:
+        print("\nGenerando gráfica del clima para el periodo seleccionado...")
 
-    # Recuperamos los datos climáticos SOLO de la ventana ganadora (120 días)
-    datos_cultivo = obtener_clima_real(mejor_dia, duracion_cultivo=120)
+        # Recuperamos los datos climáticos SOLO de la ventana ganadora
+        datos_cultivo = obtener_clima_real(mejor_dia, duracion_cultivo=PERFIL.duracion)
     
     if datos_cultivo:
+        from src.optimization.graficas import graficar_ventana
+
         # Extraemos listas para graficar
-        dias_ciclo = list(range(1, 121))
         temps = [d['temp'] for d in datos_cultivo]
         lluvias = [d['lluvia'] for d in datos_cultivo]
 
-        # Configuración de la figura con DOS ejes Y (Doble escala)
-        fig, ax1 = plt.subplots(figsize=(12, 6))
-
-        # EJE Y1 (Izquierda): Temperatura
-        color_temp = 'tab:red'
-        ax1.set_xlabel('Días del Ciclo de Cultivo (1-120)')
-        ax1.set_ylabel('Temperatura (°C)', color=color_temp, fontsize=12)
-        ax1.plot(dias_ciclo, temps, color=color_temp, linewidth=2, label='Temperatura')
-        ax1.tick_params(axis='y', labelcolor=color_temp)
-        ax1.grid(True, linestyle='--', alpha=0.5)
-
-        # EJE Y2 (Derecha): Lluvia
-        ax2 = ax1.twinx()  # Instancia un segundo eje que comparte el mismo eje X
-        color_rain = 'tab:blue'
-        ax2.set_ylabel('Lluvia (mm)', color=color_rain, fontsize=12)
-        # Usamos gráfico de barras para la lluvia (se ve mejor) o fill_between
-        ax2.fill_between(dias_ciclo, lluvias, color=color_rain, alpha=0.3, label='Lluvia Acumulada')
-        ax2.tick_params(axis='y', labelcolor=color_rain)
-
-        # Títulos y Leyendas
-        plt.title(f'Condiciones Climáticas para la Ventana de Siembra: Día {mejor_dia}', fontsize=14)
-        
-        # Ajuste para guardar
-        fig.tight_layout()
-        
         nombre_archivo = 'resultado_ventana_seleccionada.png'
         # Guardar en la raíz o donde desees
-        ruta_guardado = os.path.join(os.getcwd(), nombre_archivo)
-        plt.savefig(ruta_guardado, dpi=300)
+        ruta_guardado = graficar_ventana(temps, lluvias, mejor_dia,
+                                         os.path.join(os.getcwd(), nombre_archivo))
         
         print(f" Gráfica del ciclo guardada en: {ruta_guardado}")
-        plt.show()
-    else:
-        print("No se pudieron recuperar datos climáticos para graficar.")
\ No newline at end of file
+    elif graficar:
+        print("No se pudieron recuperar datos climáticos para graficar.")
+
+    # --- 4. MÉTRICAS DE LA CORRIDA (opcional) ---
+    if RUTA_METRICAS:
+        print("\n--- TIEMPOS Y CONTADORES ---")
+        print(instrumentacion.resumen())
+        print(f" Métricas guardadas en: {instrumentacion.volcar(RUTA_METRICAS)}")
@@ -0,0 +1,9 @@
+"""
+Sistema de Optimización de Siembra Mixteca.
+
+    src.neural        Módulo 1: datos históricos, LSTM y pronóstico climático.
+    src.fuzzy         Módulo 2: inferencia difusa (aptitud de cada día).
+    src.optimization  Módulo 3: búsqueda de la fecha de siembra (AG / PSO).
+
+Punto de entrada: `python -m src --help` (ver cli.py).
+"""
@@ -0,0 +1,7 @@
+"""Permite ejecutar `python -m src <etapa>` (ver cli.py)."""
+
+import sys
+
+from src.cli import main
+
+sys.exit(main())
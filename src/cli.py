@@ -0,0 +1,394 @@
+"""
+Línea de comandos del Sistema de Siembra Mixteca.
+
+Todas las etapas del pipeline desde un solo punto de entrada:
+
+    python -m src prepare                  Descarga y prepara el histórico (NASA POWER)
+    python -m src train                    Entrena la LSTM
+    python -m src forecast --formato npy   Genera el pronóstico 2026
+    python -m src score --motor tabulado   Evalúa cada día del pronóstico (lógica difusa)
+    python -m src optimize --backend pso   Busca el mejor día de siembra
+    python -m src report --grafica p.png   Paisaje de aptitud y óptimo de cada perfil
+    python -m src pipeline                 Etapas pendientes, omitiendo las que están al día
+    python -m src serve --puerto 8765      Servicio HTTP local con el estado en memoria
+    python -m src serve --asincrono        Igual, agrupando consultas concurrentes en lotes
+    python -m src synth --sitios 100       Pronósticos sintéticos para pruebas de carga
+
+Cada etapa importa sólo los módulos que necesita: `optimize` con el AG no
+carga TensorFlow, y `prepare`/`train` no cargan la lógica difusa. (Toda
+etapa que evalúa la lógica difusa sí importa matplotlib: skfuzzy.control lo
+trae para sus gráficas.)
+
+Sólo el motor vectorizado admite `--politica extrapolate`; las demás
+combinaciones no soportadas se rechazan al leer los argumentos.
+
+Opciones globales (antes del subcomando):
+
+    --metricas RUTA   Tiempos y contadores de la corrida (ver instrumentacion.py)
+    --profile BASE    Perfil cProfile + pilas de la etapa (ver perfilado.py)
+"""
+
+import argparse
+import json
+import sys
+
+BACKENDS = ("ag", "pso", "islas")
+MOTORES_DIFUSOS = ("vectorizado", "tabulado", "skfuzzy", "memo")
+POLITICAS = ("clip", "zero", "nan", "extrapolate")
+
+
+# --- AUXILIARES ---
+
+def _cargar_pronostico(ruta):
+    """(temps, lluvias) del pronóstico; CSV o .npy según la extensión."""
+    import numpy as np
+    from src.neural.gestor_climatico import iterar_pronostico
+
+    temps, lluvias = [], []
+    for _, t, p in iterar_pronostico(ruta):
+        temps.append(t)
+        lluvias.append(p)
+    if not temps:
+        raise ValueError(f"❌ El pronóstico {ruta} no tiene días")
+    return np.concatenate(temps), np.concatenate(lluvias)
+
+
+def _motor_puntuacion(args):
+    """
+    Motor de puntuación para la etapa: el global (pronóstico por defecto y
+    motor vectorizado) o uno construido con --pronostico / --motor.
+    """
+    if args.pronostico is None and args.motor == "vectorizado":
+        return None
+    from src.optimization.motor_puntuacion import MotorPuntuacion
+
+    if args.pronostico is None:
+        from src.neural.gestor_climatico import df_clima
+        temps, lluvias = df_clima['temp'].to_numpy(float), df_clima['lluvia'].to_numpy(float)
+    else:
+        temps, lluvias = _cargar_pronostico(args.pronostico)
+
+    motor_difuso = None
+    if args.motor != "vectorizado":
+        from src.fuzzy.motores import crear_motor
+        motor_difuso = crear_motor(args.motor)
+    return MotorPuntuacion.desde_clima(temps, lluvias, motor_difuso=motor_difuso)
+
+
+# --- ETAPAS ---
+
+def etapa_prepare(args):
+    from src.neural.preparacion_datos import preparar_datos
+
+    return 0 if preparar_datos() is not None else 1
+
+
+def etapa_train(args):
+    from src.neural.entrenamiento_modelo import entrenar
+
+    return 0 if entrenar(graficar=args.graficas, fuente=args.fuente) is not None else 1
+
+
+def etapa_forecast(args):
+    from src.neural.generar_pronostico import generar_pronostico
+
+    ruta_csv = generar_pronostico(args.salida)
+    if ruta_csv is None:
+        return 1
+    if args.formato == "npy":
+        from src.neural.gestor_climatico import guardar_pronostico_binario
+
+        ruta_npy = ruta_csv.rsplit('.', 1)[0] + '.npy'
+        dias = guardar_pronostico_binario(ruta_csv, ruta_npy)
+        print(f"✅ Pronóstico binario ({dias} días) guardado en: {ruta_npy}")
+    return 0
+
+
+def etapa_score(args):
+    from src.fuzzy.flujo_evaluacion import evaluar_bloques, exportar_resultados
+    from src.neural.gestor_climatico import CSV_PATH, iterar_pronostico
+
+    motor = None
+    if args.motor != "vectorizado":
+        from src.fuzzy.motores import crear_motor
+        motor = crear_motor(args.motor)
+
+    ruta = args.pronostico or CSV_PATH
+    bloques = evaluar_bloques(iterar_pronostico(ruta, args.tam_bloque),
+                              politica=args.politica, motor=motor)
+    if args.salida:
+        dias = exportar_resultados(bloques, args.salida, args.formato)
+        print(f"✅ {dias} días evaluados ({args.motor}) guardados en: {args.salida}")
+        return 0
+
+    import numpy as np
+    from collections import Counter
+
+    categorias = Counter()
+    scores = []
+    for bloque in bloques:
+        categorias.update(bloque["categoria"].tolist())
+        scores.append(bloque["score_amplitud"])
+    scores = np.concatenate(scores)
+    print(f"Días evaluados: {scores.size} (motor {args.motor}, política {args.politica})")
+    print(f"Score medio: {np.nanmean(scores):.2f} | mínimo {np.nanmin(scores):.2f} | "
+          f"máximo {np.nanmax(scores):.2f}")
+    for categoria, n in categorias.most_common():
+        print(f"  {categoria:<10} {n:>6} días")
+    return 0
+
+
+def etapa_optimize(args):
+    motor = _motor_puntuacion(args)
+
+    if args.backend == "islas":
+        from src.optimization.islas import correr_islas
+
+        resultado = correr_islas([args.perfil], motor=motor, semilla=42 if args.semilla is None else args.semilla)
+        print(f"Mejor solución: {resultado['mejor']}")
+        print(f"Evaluaciones: {resultado['evaluaciones']} en {resultado['tiempo']:.3f} s")
+        if args.json:
+            print(json.dumps(resultado["mejor"], ensure_ascii=False))
+        return 0
+
+    if args.backend == "pso":
+        from src.optimization.algoritmo_pso import optimizar
+    else:
+        from src.optimization.algoritmo_genetico import optimizar
+
+    resultado = optimizar(args.perfil, motor=motor, semilla=args.semilla)
+    if args.json:
+        print(json.dumps(resultado.a_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(f"{resultado.algoritmo} | perfil {resultado.perfil}: día {resultado.mejor_dia} "
+              f"(aptitud {resultado.aptitud:.2f})")
+        print(f"Paro: {resultado.motivo_paro} tras {resultado.generaciones} generaciones, "
+              f"{resultado.evaluaciones} evaluaciones en {resultado.tiempo:.3f} s")
+
+    if args.graficas:
+        from src.optimization.graficas import graficar_convergencia
+
+        ruta = graficar_convergencia(resultado, f"convergencia_{args.backend}.png")
+        print(f"✅ Gráfica guardada en: {ruta}")
+    return 0
+
+
+def etapa_report(args):
+    import numpy as np
+    from src.optimization.motor_puntuacion import obtener_motor
+    from src.optimization.panorama import paisaje_aptitud
+    from src.optimization.perfiles_cultivo import PERFILES
+
+    motor = _motor_puntuacion(args) or obtener_motor()
+    nombres, paisajes = paisaje_aptitud(motor.aptitud, PERFILES.values())
+
+    reporte = {}
+    print(f" {'perfil':<18} {'mejor día':>9} {'aptitud':>10}")
+    for nombre, paisaje in zip(nombres, paisajes):
+        mejor = int(np.nanargmax(paisaje))
+        reporte[nombre] = {"mejor_dia": mejor + 1, "aptitud": float(paisaje[mejor])}
+        print(f" {nombre:<18} {mejor + 1:>9} {paisaje[mejor]:>10.2f}")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(reporte, f, indent=2, ensure_ascii=False)
+        print(f"✅ Reporte guardado en: {args.salida}")
+    if args.grafica:
+        from src.optimization.graficas import graficar_paisajes
+
+        print(f"✅ Gráfica guardada en: {graficar_paisajes(nombres, paisajes, args.grafica)}")
+    return 0
+
+
+def etapa_pipeline(args):
+    from src.orquestador import Orquestador
+
+    orquestador = Orquestador(parametros={"motor": args.motor, "politica": args.politica,
+                                          "backend": args.backend, "perfil": args.perfil,
+                                          "semilla": args.semilla})
+    if args.estado:
+        for nombre, motivo in orquestador.estado():
+            print(f" {nombre:<10} {'al día' if motivo is None else motivo}")
+        return 0
+
+    try:
+        resultado = orquestador.correr(args.desde, args.hasta, args.forzar)
+    except (ValueError, FileNotFoundError, RuntimeError) as e:
+        print(e)
+        return 1
+    ejecutadas = [nombre for nombre, estado in resultado.items() if estado == "ejecutada"]
+    print(f"✅ Pipeline: {len(ejecutadas)} etapa(s) ejecutada(s), "
+          f"{len(resultado) - len(ejecutadas)} al día")
+    return 0
+
+
+def etapa_serve(args):
+    opciones = dict(ruta_pronostico=args.pronostico, motor=args.motor, politica=args.politica)
+    if args.asincrono:
+        from src.servicio_async import servir_asincrono
+
+        servir_asincrono(args.host, args.puerto, args.ventana_ms / 1000, args.max_lote,
+                         **opciones)
+    else:
+        from src.servicio import servir
+
+        servir(args.host, args.puerto, **opciones)
+    return 0
+
+
+def etapa_synth(args):
+    from src.mocks import guardar_pronosticos_sinteticos
+
+    rutas = guardar_pronosticos_sinteticos(args.salida, args.sitios, args.anios, args.semilla,
+                                           args.anio_inicio, args.formato)
+    print(f"✅ {len(rutas)} pronóstico(s) sintético(s) de {args.anios * 365} días "
+          f"guardados en: {args.salida}")
+    return 0
+
+
+# --- ARGUMENTOS ---
+
+def _opciones_pronostico(subparser):
+    subparser.add_argument("--pronostico", help="Pronóstico a usar (.csv o .npy; "
+                                                "default: data/processed/Pronostico_2026_IA.csv)")
+    subparser.add_argument("--motor", choices=MOTORES_DIFUSOS, default="vectorizado",
+                           help="Motor de inferencia difusa (default: vectorizado)")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m src",
+                                     description="Sistema de Optimización de Siembra Mixteca")
+    parser.add_argument("--metricas", metavar="RUTA",
+                        help="Guardar tiempos y contadores (JSON, o Prometheus si es .prom)")
+    parser.add_argument("--profile", metavar="BASE",
+                        help="Perfilar la etapa (BASE.txt, BASE.folded, BASE.prof)")
+    etapas = parser.add_subparsers(dest="etapa", required=True)
+
+    etapas.add_parser("prepare", help="Descargar y preparar el histórico climático")
+
+    train = etapas.add_parser("train", help="Entrenar la LSTM")
+    train.add_argument("--graficas", action="store_true", help="Mostrar la curva de aprendizaje")
+    train.add_argument("--fuente", choices=("serie", "csv"), default="serie",
+                       help="serie: ventanas al vuelo con tf.data; csv: dataset de ventanas en memoria")
+
+    forecast = etapas.add_parser("forecast", help="Generar el pronóstico 2026")
+    forecast.add_argument("--salida", default="Pronostico_2026_IA.csv")
+    forecast.add_argument("--formato", choices=("csv", "npy"), default="csv",
+                          help="npy además guarda el formato binario por bloques")
+
+    score = etapas.add_parser("score", help="Evaluar cada día del pronóstico")
+    _opciones_pronostico(score)
+    score.add_argument("--politica", choices=POLITICAS, default="clip",
+                       help="Entradas fuera de rango (default: clip)")
+    score.add_argument("--tam-bloque", type=int, default=4096)
+    score.add_argument("--salida", help="Archivo de resultados .csv, .ndjson o .npy "
+                                        "(default: sólo resumen)")
+    score.add_argument("--formato", choices=("csv", "ndjson", "npy"),
+                       help="Formato de --salida (default: según la extensión)")
+
+    optimize = etapas.add_parser("optimize", help="Buscar el mejor día de siembra")
+    _opciones_pronostico(optimize)
+    optimize.add_argument("--backend", choices=BACKENDS, default="ag",
+                          help="Optimizador (default: ag)")
+    optimize.add_argument("--perfil", default="maiz_120", help="Perfil de cultivo")
+    optimize.add_argument("--semilla", type=int, help="Semilla aleatoria (corrida reproducible)")
+    optimize.add_argument("--graficas", action="store_true", help="Guardar curva de convergencia")
+    optimize.add_argument("--json", action="store_true", help="Imprimir el resultado como JSON")
+
+    report = etapas.add_parser("report", help="Paisaje de aptitud de todos los perfiles")
+    _opciones_pronostico(report)
+    report.add_argument("--grafica", metavar="RUTA", help="Guardar la gráfica del paisaje")
+    report.add_argument("--salida", metavar="RUTA", help="Guardar el reporte como JSON")
+
+    from src.orquestador import NOMBRES_ETAPAS, PARAMETROS_DEFAULT
+
+    pipeline = etapas.add_parser("pipeline", help="Correr las etapas pendientes (con caché "
+                                                  "de artefactos en data/artefactos)")
+    pipeline.add_argument("--desde", choices=NOMBRES_ETAPAS, default="score",
+                          help="Primera etapa a considerar (default: score; las anteriores "
+                               "se toman como están)")
+    pipeline.add_argument("--hasta", choices=NOMBRES_ETAPAS, default="report")
+    pipeline.add_argument("--forzar", nargs="*", choices=NOMBRES_ETAPAS, default=[],
+                          help="Etapas a correr aunque estén al día")
+    pipeline.add_argument("--estado", action="store_true",
+                          help="Sólo mostrar qué etapas están al día y por qué no")
+    pipeline.add_argument("--motor", choices=MOTORES_DIFUSOS, default=PARAMETROS_DEFAULT["motor"])
+    pipeline.add_argument("--politica", choices=POLITICAS,
+                          default=PARAMETROS_DEFAULT["politica"])
+    pipeline.add_argument("--backend", choices=BACKENDS, default=PARAMETROS_DEFAULT["backend"])
+    pipeline.add_argument("--perfil", default=PARAMETROS_DEFAULT["perfil"])
+    pipeline.add_argument("--semilla", type=int, default=PARAMETROS_DEFAULT["semilla"])
+
+    serve = etapas.add_parser("serve", help="Servicio HTTP local de puntuación")
+    _opciones_pronostico(serve)
+    serve.add_argument("--politica", choices=POLITICAS, default="clip")
+    serve.add_argument("--host", default="127.0.0.1", help="Interfaz (default: sólo localhost)")
+    serve.add_argument("--puerto", type=int, default=8765)
+    serve.add_argument("--asincrono", action="store_true",
+                       help="Frente asyncio que agrupa consultas concurrentes en lotes")
+    serve.add_argument("--ventana-ms", type=float, default=2.0,
+                       help="Espera máxima para juntar un lote (default: 2 ms)")
+    serve.add_argument("--max-lote", type=int, default=1024,
+                       help="Consultas por lote antes de despachar sin esperar")
+
+    synth = etapas.add_parser("synth", help="Generar pronósticos sintéticos (pruebas de carga)")
+    synth.add_argument("--salida", default="data/sintetico", help="Carpeta de salida")
+    synth.add_argument("--sitios", type=int, default=1)
+    synth.add_argument("--anios", type=int, default=1)
+    synth.add_argument("--semilla", type=int, default=2026)
+    synth.add_argument("--anio-inicio", type=int, default=2026)
+    synth.add_argument("--formato", choices=("npy", "csv"), default="npy")
+    return parser
+
+
+ETAPAS = {
+    "prepare": etapa_prepare,
+    "train": etapa_train,
+    "forecast": etapa_forecast,
+    "score": etapa_score,
+    "optimize": etapa_optimize,
+    "report": etapa_report,
+    "pipeline": etapa_pipeline,
+    "serve": etapa_serve,
+    "synth": etapa_synth,
+}
+
+
+def _validar_politica(parser, args):
+    """Rechaza una política de rango que el motor elegido no implementa."""
+    politica = getattr(args, "politica", None)
+    if politica is None:
+        return
+    from src.fuzzy.motores import POLITICAS_MOTOR
+
+    if politica not in POLITICAS_MOTOR[args.motor]:
+        parser.error(f"el motor {args.motor} no admite --politica {politica} "
+                     f"(opciones: {', '.join(POLITICAS_MOTOR[args.motor])})")
+
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    _validar_politica(parser, args)
+
+    if args.metricas:
+        from src import instrumentacion
+        instrumentacion.activar()
+
+    etapa = ETAPAS[args.etapa]
+    if args.profile:
+        from src.perfilado import imprimir_resumen, perfilar
+
+        with perfilar(args.profile) as info_perfil:
+            codigo = etapa(args)
+        imprimir_resumen(info_perfil)
+    else:
+        codigo = etapa(args)
+
+    if args.metricas:
+        print(f"📈 Métricas guardadas en: {instrumentacion.volcar(args.metricas)}")
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Evaluación difusa en flujo (streaming) para pronósticos de cualquier longitud.
+
+`evaluar_multiples_dias` necesita la lista completa en memoria y regresa otra
+lista completa. Para re-análisis de décadas y varios sitios este módulo arma
+una tubería de generadores:
+
+    gestor_climatico.iterar_pronostico()   →  bloques (fechas, temps, lluvias)
+    evaluar_bloques()                      →  bloques de resultados vectorizados
+    exportar_resultados()                  →  archivo escrito y vaciado por bloque
+
+Sólo un bloque vive en memoria a la vez, sin importar el horizonte.
+
+Formatos de exportación (se eligen por extensión o con `formato`):
+
+    csv      Una fila por día.
+    ndjson   Un objeto JSON por línea con la forma de `evaluar`, listo para
+             ingestión con `tail -f`. Las líneas se arman directo de los
+             arreglos del bloque, sin un diccionario por día; NaN → null.
+    npy      Registros DTYPE_RESULTADO (ver resultados.py). El encabezado se
+             reescribe tras cada bloque, así el archivo siempre es un .npy
+             válido con los días escritos hasta ese momento; cada columna se
+             lee con np.load(ruta, mmap_mode='r')['score_amplitud'].
+
+Los bloques pueden ser los diccionarios de `evaluar_bloques` o lotes
+estructurados de `SistemaDifusoSiembra.evaluar_registros`.
+"""
+
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from src.fuzzy.resultados import (DTYPE_RESULTADO, NOMBRES_CATEGORIA, RECOMENDACIONES,
+                                  codificar_categorias)
+
+
+def evaluar_bloques(bloques: Iterable, sistema=None, politica: str = "clip",
+                    motor=None) -> Iterator[Dict]:
+    """
+    Evalúa bloques de días con el motor vectorizado (u otro del registro).
+
+    Args:
+        bloques (iterable): Tuplas (fechas, temps, lluvias), p. ej. las que
+            produce gestor_climatico.iterar_pronostico. `fechas` puede ser None.
+        sistema (SistemaDifusoSiembra): Sistema a usar; por defecto el global.
+        politica (str): Política para entradas fuera de rango (ver
+            motor_vectorizado.POLITICAS_RANGO).
+        motor: (opcional) Motor con `evaluar_lote` (ver motores.crear_motor);
+            por defecto el motor vectorizado del sistema.
+
+    Yields:
+        dict: Un bloque de resultados con arreglos 'fecha', 'temperatura',
+              'precipitacion', 'score_amplitud', 'categoria', 'recomendacion'
+              y 'codigo' (código entero de la categoría, ver resultados.py).
+    """
+    from src.fuzzy.fuzzy_system import clasificar_lote
+
+    if sistema is None:
+        from src.fuzzy.fuzzy_system import sistema_global as sistema
+
+    for fechas, temps, lluvias in bloques:
+        if motor is None:
+            scores, _ = sistema.evaluar_lote(temps, lluvias, politica=politica)
+        else:
+            scores = np.round(motor.evaluar_lote(temps, lluvias, politica=politica)[0], 2)
+        categorias, recomendaciones = clasificar_lote(scores)
+        yield {
+            "fecha": fechas,
+            "temperatura": np.asarray(temps, dtype=float),
+            "precipitacion": np.asarray(lluvias, dtype=float),
+            "score_amplitud": scores,
+            "categoria": categorias,
+            "recomendacion": recomendaciones,
+            "codigo": codificar_categorias(scores),
+        }
+
+
+def evaluar_dias_flujo(dias: Iterable[Dict], sistema=None, politica: str = "clip",
+                       tam_bloque: int = 1024) -> Iterator[Dict]:
+    """
+    Versión generadora de `evaluar_multiples_dias`.
+
+    Consume cualquier iterable de diccionarios {"fecha", "temperatura",
+    "precipitacion"} (puede ser otro generador), los agrupa en bloques de
+    `tam_bloque` días para evaluarlos de forma vectorizada y entrega los
+    resultados día por día con el mismo formato que `evaluar` (diccionarios).
+    """
+    iterador = iter(dias)
+    while True:
+        lote = list(islice(iterador, tam_bloque))
+        if not lote:
+            return
+
+        temps = [float(d['temperatura']) for d in lote]
+        lluvias = [float(d['precipitacion']) for d in lote]
+        bloque = next(evaluar_bloques([(None, temps, lluvias)], sistema, politica))
+
+        for i, dia in enumerate(lote):
+            resultado = {
+                "score_amplitud": float(bloque["score_amplitud"][i]),
+                "categoria": str(bloque["categoria"][i]),
+                "recomendacion": str(bloque["recomendacion"][i]),
+                "inputs": {
+                    "temperatura": temps[i],
+                    "precipitacion": lluvias[i],
+                },
+            }
+            if 'fecha' in dia:
+                resultado['fecha'] = dia['fecha']
+            yield resultado
+
+
+def _columnas(bloque) -> Tuple:
+    """(fechas o None, temps, lluvias, scores, códigos) de un bloque o lote."""
+    if isinstance(bloque, np.ndarray):
+        fechas = bloque['fecha']
+        return (None if np.isnat(fechas).all() else fechas, bloque['temperatura'],
+                bloque['precipitacion'], bloque['score_amplitud'], bloque['codigo'])
+    codigos = bloque.get("codigo")
+    if codigos is None:
+        codigos = codificar_categorias(bloque["score_amplitud"])
+    return (bloque["fecha"], np.asarray(bloque["temperatura"], dtype=float),
+            np.asarray(bloque["precipitacion"], dtype=float),
+            np.asarray(bloque["score_amplitud"], dtype=float), codigos)
+
+
+def _fechas_texto(fechas, n: int) -> np.ndarray:
+    if fechas is None:
+        return np.full(n, "")
+    texto = np.asarray(fechas).astype('datetime64[D]').astype(str)
+    texto[texto == "NaT"] = ""
+    return texto
+
+
+def escribir_resultados_csv(bloques_resultado: Iterable, archivo: str) -> int:
+    """
+    Escribe bloques de resultados en CSV de forma incremental.
+
+    El archivo se vacía (flush) después de cada bloque para que otro proceso
+    pueda leerlo mientras se genera.
+
+    Returns:
+        int: Número de días escritos.
+    """
+    columnas = ["fecha", "temperatura", "precipitacion",
+                "score_amplitud", "categoria", "recomendacion"]
+    total = 0
+
+    with open(archivo, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(columnas)
+
+        for bloque in bloques_resultado:
+            fechas, temps, lluvias, scores, codigos = _columnas(bloque)
+            escritor.writerows(zip(
+                _fechas_texto(fechas, len(scores)),
+                np.round(temps, 4),
+                np.round(lluvias, 4),
+                scores,
+                NOMBRES_CATEGORIA[codigos],
+                RECOMENDACIONES[codigos],
+            ))
+            f.flush()
+            total += len(scores)
+
+    return total
+
+
+# Categoría y recomendación ya escapadas como JSON, indexadas por código
+_CATEGORIAS_JSON = [json.dumps(str(c), ensure_ascii=False) for c in NOMBRES_CATEGORIA]
+_RECOMENDACIONES_JSON = [json.dumps(str(r), ensure_ascii=False) for r in RECOMENDACIONES]
+
+
+def _numeros_json(arreglo) -> list:
+    """Texto JSON de cada número (igual que json.dumps; NaN → null)."""
+    valores = np.asarray(arreglo, dtype=float)
+    textos = list(map(repr, valores.tolist()))
+    if not np.isfinite(valores).all():
+        for i in np.flatnonzero(~np.isfinite(valores)):
+            textos[i] = "null"
+    return textos
+
+
+def escribir_resultados_ndjson(bloques_resultado: Iterable, archivo: str) -> int:
+    """
+    Escribe bloques de resultados como NDJSON (un objeto por línea).
+
+    Cada línea tiene la forma de `evaluar` / `exportar_a_json`, con 'fecha'
+    al final cuando el bloque la trae. Se vacía después de cada bloque.
+
+    Returns:
+        int: Número de días escritos.
+    """
+    total = 0
+    with open(archivo, 'w', encoding='utf-8') as f:
+        for bloque in bloques_resultado:
+            fechas, temps, lluvias, scores, codigos = _columnas(bloque)
+            columnas = [_numeros_json(scores),
+                        [_CATEGORIAS_JSON[c] for c in codigos.tolist()],
+                        [_RECOMENDACIONES_JSON[c] for c in codigos.tolist()],
+                        _numeros_json(temps), _numeros_json(lluvias)]
+            plantilla = ('{{"score_amplitud": {}, "categoria": {}, "recomendacion": {}, '
+                         '"inputs": {{"temperatura": {}, "precipitacion": {}}}')
+            if fechas is None:
+                plantilla += '}}\n'
+            else:
+                plantilla += ', "fecha": {}}}\n'
+                columnas.append([f'"{t}"' if t else "null"
+                                 for t in _fechas_texto(fechas, len(scores)).tolist()])
+            f.write("".join(map(plantilla.format, *columnas)))
+            f.flush()
+            total += len(scores)
+    return total
+
+
+def _encabezado_npy(n_dias: int) -> bytes:
+    """
+    Encabezado .npy (v1.0) de `n_dias` registros DTYPE_RESULTADO. El número
+    de días ocupa siempre el mismo ancho para poder reescribirlo en su lugar.
+    """
+    descr = np.lib.format.dtype_to_descr(DTYPE_RESULTADO)
+    texto = f"{{'descr': {descr!r}, 'fortran_order': False, 'shape': ({n_dias:>20},), }}"
+    relleno = 64 - (len(np.lib.format.MAGIC_PREFIX) + 4 + len(texto) + 1) % 64
+    texto = texto + " " * relleno + "\n"
+    return (np.lib.format.magic(1, 0) + len(texto).to_bytes(2, 'little')
+            + texto.encode('latin-1'))
+
+
+def escribir_resultados_npy(bloques_resultado: Iterable, archivo: str) -> int:
+    """
+    Escribe bloques de resultados como registros DTYPE_RESULTADO (.npy).
+
+    Los registros se agregan al final y el encabezado se actualiza después
+    de cada bloque, así el archivo se puede abrir con np.load mientras se
+    escribe.
+
+    Returns:
+        int: Número de días escritos.
+    """
+    total = 0
+    with open(archivo, 'wb') as f:
+        f.write(_encabezado_npy(0))
+        for bloque in bloques_resultado:
+            if isinstance(bloque, np.ndarray) and bloque.dtype == DTYPE_RESULTADO:
+                lote = bloque
+            else:
+                fechas, temps, lluvias, scores, codigos = _columnas(bloque)
+                lote = np.empty(len(scores), dtype=DTYPE_RESULTADO)
+                lote['fecha'] = np.datetime64('NaT') if fechas is None else fechas
+                lote['temperatura'] = temps
+                lote['precipitacion'] = lluvias
+                lote['score_amplitud'] = scores
+                lote['codigo'] = codigos
+            f.write(lote.tobytes())
+            total += len(lote)
+
+            f.seek(0)
+            f.write(_encabezado_npy(total))
+            f.seek(0, 2)
+            f.flush()
+    return total
+
+
+FORMATOS_EXPORTACION = {
+    "csv": escribir_resultados_csv,
+    "ndjson": escribir_resultados_ndjson,
+    "npy": escribir_resultados_npy,
+}
+_EXTENSIONES = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson", ".npy": "npy"}
+
+
+def exportar_resultados(bloques_resultado: Iterable, archivo: str, formato: str = None) -> int:
+    """
+    Exporta bloques de resultados en flujo, en el formato indicado o según
+    la extensión de `archivo` (.csv, .ndjson/.jsonl, .npy).
+
+    Returns:
+        int: Número de días escritos.
+    """
+    if formato is None:
+        extension = "." + archivo.rsplit(".", 1)[-1].lower() if "." in archivo else ""
+        formato = _EXTENSIONES.get(extension)
+        if formato is None:
+            raise ValueError(f"❌ No se reconoce el formato de {archivo}. "
+                             f"Usa una extensión {', '.join(_EXTENSIONES)} o indica el formato")
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f"❌ Formato de exportación desconocido: {formato}. "
+                         f"Opciones: {', '.join(FORMATOS_EXPORTACION)}")
+    return FORMATOS_EXPORTACION[formato](bloques_resultado, archivo)
@@ -123,6 +123,35 @@ from skfuzzy import control as ctrl
 import json
 from typing import Dict, List, Union, Tuple
 
+from src import instrumentacion
+from src.fuzzy.resultados import (CATEGORIAS, NOMBRES_CATEGORIA, RECOMENDACIONES,
+                                  ResultadoDia, codificar_categorias, crear_lote,
+                                  lote_a_dicts)
+
+
+# ==============================================================================
+#                    CLASIFICACIÓN DEL SCORE
+# ==============================================================================
+
+# CATEGORIAS: (score mínimo, categoría, recomendación), de mayor a menor.
+# Vive en resultados.py junto con los códigos enteros de cada categoría.
+
+
+def clasificar_lote(scores) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clasifica un arreglo de scores con los mismos umbrales que `evaluar`.
+    
+    Los scores NaN (política de rango "nan") quedan como "SIN_DATO".
+    Para guardar muchos días conviene más `codificar_categorias` (un uint8
+    por día en lugar de dos cadenas).
+    
+    RETORNA:
+    ────────
+        tuple: (categorias, recomendaciones) como arreglos de texto.
+    """
+    codigos = codificar_categorias(scores)
+    return NOMBRES_CATEGORIA[codigos], RECOMENDACIONES[codigos]
+
 
 class SistemaDifusoSiembra:
     """
@@ -198,17 +227,24 @@ class SistemaDifusoSiembra:
         """
         print("🔧 Inicializando Sistema de Inferencia Difusa...")
         
-        # Paso 1: Crear variables
-        self._crear_variables()
-        
-        # Paso 2: Definir funciones de membresía
-        self._crear_funciones_membresia()
+        with instrumentacion.medir("difuso.construccion"):
+            # Paso 1: Crear variables
+            self._crear_variables()
+            
+            # Paso 2: Definir funciones de membresía
+            self._crear_funciones_membresia()
+            
+            # Paso 3: Establecer reglas
+            self._crear_reglas()
+            
+            # Paso 4: Crear sistema de control
+            self._crear_sistema_control()
         
-        # Paso 3: Establecer reglas
-        self._crear_reglas()
+        # Memo cuantizado opcional (ver activar_memo)
+        self._memo = None
         
-        # Paso 4: Crear sistema de control
-        self._crear_sistema_control()
+        # Motor vectorizado para lotes (se construye al primer uso)
+        self._motor = None
         
         print("✅ Sistema inicializado correctamente")
     
@@ -595,7 +631,8 @@ class SistemaDifusoSiembra:
         
         RETORNA:
         ────────
-            dict: Diccionario con los resultados:
+            dict: Diccionario con los resultados (para el registro compacto
+                  con __slots__ ver `evaluar_registro`):
                 {
                     "score_amplitud": float,    # Puntaje 0-100
                     "categoria": str,           # "EXCELENTE", "BUENO", etc.
@@ -628,6 +665,17 @@ class SistemaDifusoSiembra:
             Score 0-30:   MALO      → NO sembrar, esperar mejores condiciones
         """
         
+        return self.evaluar_registro(temperatura, precipitacion).a_dict()
+    
+    
+    def evaluar_registro(self, temperatura: float, precipitacion: float) -> ResultadoDia:
+        """
+        Igual que `evaluar`, pero regresa un ResultadoDia (ver resultados.py):
+        un registro con __slots__ y el código entero de la categoría, sin
+        construir diccionarios. Conviene para guardar muchos días; para JSON
+        usar `evaluar` o `a_dict()`.
+        """
+        
         # ═══════════════════════════════════════════════════════════════════
         # PASO 1: Validar que los valores estén en rango
         # ═══════════════════════════════════════════════════════════════════
@@ -645,64 +693,130 @@ class SistemaDifusoSiembra:
             )
         
         # ═══════════════════════════════════════════════════════════════════
-        # PASO 2: Asignar valores de entrada al sistema
+        # PASO 2 y 3: Asignar entradas y ejecutar inferencia difusa
+        #             (pasando por el memo cuantizado si está activo)
         # ═══════════════════════════════════════════════════════════════════
         
-        self.simulacion.input['temperatura'] = temperatura
-        self.simulacion.input['lluvia'] = precipitacion
+        instrumentacion.contar("difuso.evaluaciones")
+        if self._memo is not None:
+            score = round(self._memo(temperatura, precipitacion), 2)
+        else:
+            score = self._calcular_score(temperatura, precipitacion)
         
         # ═══════════════════════════════════════════════════════════════════
-        # PASO 3: Ejecutar inferencia difusa
+        # PASO 4: Clasificar resultado
+        # ═══════════════════════════════════════════════════════════════════
+        
+        for codigo, (minimo, _, _) in enumerate(CATEGORIAS):
+            if score >= minimo:
+                break
+        
         # ═══════════════════════════════════════════════════════════════════
+        # PASO 5: Construir y retornar resultado
+        # ═══════════════════════════════════════════════════════════════════
+        
+        return ResultadoDia(score, codigo, temperatura, precipitacion)
+    
+    
+    def _calcular_score(self, temperatura: float, precipitacion: float) -> float:
+        """
+        Ejecuta la inferencia difusa para un día y retorna el score (0-100)
+        redondeado a 2 decimales. Asume que las entradas ya fueron validadas.
+        """
+        self.simulacion.input['temperatura'] = temperatura
+        self.simulacion.input['lluvia'] = precipitacion
         
         try:
             # Calcular resultado (fuzzificar → evaluar reglas → defuzzificar)
             self.simulacion.compute()
             
             # Obtener valor defuzzificado (centroide)
-            score = round(self.simulacion.output['amplitud'], 2)
+            return round(self.simulacion.output['amplitud'], 2)
             
         except KeyError:
             # Manejar casos extremos donde no hay activación de reglas
             if temperatura < 10 or temperatura > 40:
-                score = 10.0
+                return 10.0
             elif precipitacion < 2 or precipitacion > 35:
-                score = 15.0
+                return 15.0
             else:
-                score = 30.0
+                return 30.0
+    
+    
+    def activar_memo(self, paso_temperatura: float = 0.1, paso_lluvia: float = 0.1,
+                     max_entradas: int = 16384, salto_maximo: float = 1.0):
+        """
+        Activa el memo cuantizado (LRU) delante de `evaluar`.
         
-        # ═══════════════════════════════════════════════════════════════════
-        # PASO 4: Clasificar resultado
-        # ═══════════════════════════════════════════════════════════════════
+        El score se calcula una sola vez en cada nodo de una rejilla de
+        `paso_temperatura` °C × `paso_lluvia` mm y cada día se interpola entre
+        las esquinas de su celda (exacto si difieren más de `salto_maximo`).
+        Ver memo_difuso.MemoDifusoCuantizado.
         
-        if score >= 70:
-            categoria = "EXCELENTE"
-            recomendacion = "Sembrar"
-        elif score >= 50:
-            categoria = "BUENO"
-            recomendacion = "Sembrar con monitoreo"
-        elif score >= 30:
-            categoria = "REGULAR"
-            recomendacion = "Esperar si es posible"
-        else:
-            categoria = "MALO"
-            recomendacion = "NO sembrar"
+        RETORNA:
+        ────────
+            MemoDifusoCuantizado: el memo activo (para consultar estadísticas).
+        """
+        from src.fuzzy.memo_difuso import MemoDifusoCuantizado
+        
+        self._memo = MemoDifusoCuantizado(self._calcular_score,
+                                          paso_temperatura=paso_temperatura,
+                                          paso_lluvia=paso_lluvia,
+                                          max_entradas=max_entradas,
+                                          salto_maximo=salto_maximo)
+        return self._memo
+    
+    
+    def desactivar_memo(self):
+        """Vuelve a la evaluación exacta en cada llamada."""
+        self._memo = None
+    
+    
+    def estadisticas_memo(self) -> Dict | None:
+        """Aciertos, fallos y tasa de aciertos del memo (None si está inactivo)."""
+        if self._memo is None:
+            return None
+        return self._memo.estadisticas()
+    
+    
+    def evaluar_lote(self, temperaturas, precipitaciones,
+                     politica: str = "clip") -> Tuple[np.ndarray, Dict]:
+        """
+        Evalúa arreglos completos de días sin lanzar excepciones por día.
         
-        # ═══════════════════════════════════════════════════════════════════
-        # PASO 5: Construir y retornar resultado
-        # ═══════════════════════════════════════════════════════════════════
+        Las entradas fuera de 5-45°C / 0-45mm se tratan según `politica`
+        ("clip", "zero", "nan" o "extrapolate") en lugar de lanzar
+        ValueError. Ver motor_vectorizado.MotorDifusoVectorizado.
         
-        resultado = {
-            "score_amplitud": score,
-            "categoria": categoria,
-            "recomendacion": recomendacion,
-            "inputs": {
-                "temperatura": temperatura,
-                "precipitacion": precipitacion
-            }
-        }
+        RETORNA:
+        ────────
+            tuple: (scores redondeados a 2 decimales, contadores de entradas
+                    afectadas por la política)
+        """
+        if self._motor is None:
+            from src.fuzzy.motor_vectorizado import MotorDifusoVectorizado
+            self._motor = MotorDifusoVectorizado(self)
         
-        return resultado
+        with instrumentacion.medir("difuso.lote"):
+            scores, contadores = self._motor.evaluar_lote(
+                temperaturas, precipitaciones, politica=politica, sin_activacion="fallback"
+            )
+        instrumentacion.contar("difuso.evaluaciones_lote", contadores["evaluados"])
+        return np.round(scores, 2), contadores
+    
+    
+    def evaluar_registros(self, temperaturas, precipitaciones, fechas=None,
+                          politica: str = "clip") -> np.ndarray:
+        """
+        Como `evaluar_lote`, pero regresa un lote de resultados compacto:
+        un arreglo estructurado DTYPE_RESULTADO (fecha, temperatura,
+        precipitacion, score_amplitud y el código entero de la categoría).
+        
+        Ver resultados.py para pasar un día a ResultadoDia (como
+        `evaluar_registro`) o el lote completo a la forma JSON de `evaluar`.
+        """
+        scores, _ = self.evaluar_lote(temperaturas, precipitaciones, politica=politica)
+        return crear_lote(scores, temperaturas, precipitaciones, fechas)
     
     
     def evaluar_desde_json(self, datos: Dict) -> Dict:
@@ -908,13 +1022,23 @@ class SistemaDifusoSiembra:
         return resultado['score_amplitud']
     
     
-    def exportar_a_json(self, resultado: Dict, archivo: str | None = None) -> str:
+    def exportar_a_json(self, resultado, archivo: str | None = None) -> str:
         """
         Exporta el resultado a formato JSON.
         
+        Acepta un diccionario, un ResultadoDia, una lista de ellos o un lote
+        de `evaluar_registros`; la forma del JSON es siempre la de `evaluar`.
+        Para años de días o muchas parcelas conviene el NDJSON en flujo de
+        flujo_evaluacion.exportar_resultados.
         Si se proporciona archivo, guarda en disco.
         Siempre retorna el string JSON.
         """
+        if isinstance(resultado, np.ndarray):
+            resultado = lote_a_dicts(resultado)
+        elif isinstance(resultado, ResultadoDia):
+            resultado = resultado.a_dict()
+        elif isinstance(resultado, list):
+            resultado = [r.a_dict() if isinstance(r, ResultadoDia) else r for r in resultado]
         json_str = json.dumps(resultado, indent=2, ensure_ascii=False)
         
         if archivo:
@@ -1024,7 +1148,80 @@ except Exception:
 # VERSIÓN FINAL CORREGIDA (PEGAR AL FINAL)
 # ==========================================
 
+# Memo cuantizado opcional para calcular_aptitud (ver activar_memo_aptitud)
+_memo_aptitud = None
+
+
+def activar_memo_aptitud(paso_temperatura=0.1, paso_lluvia=0.1, max_entradas=16384,
+                         salto_maximo=1.0):
+    """
+    Activa un memo cuantizado (LRU) delante de `calcular_aptitud`.
+
+    Retorna el MemoDifusoCuantizado activo para consultar su tasa de aciertos
+    (`estadisticas()`) o el error frente a la evaluación exacta
+    (`estimar_error(temps, lluvias)`).
+    """
+    global _memo_aptitud
+    from src.fuzzy.memo_difuso import MemoDifusoCuantizado
+
+    _memo_aptitud = MemoDifusoCuantizado(
+        lambda temp, lluvia: _calcular_aptitud_exacta(lluvia, temp),
+        paso_temperatura=paso_temperatura,
+        paso_lluvia=paso_lluvia,
+        max_entradas=max_entradas,
+        salto_maximo=salto_maximo,
+    )
+    return _memo_aptitud
+
+
+def desactivar_memo_aptitud():
+    """Vuelve a evaluar `calcular_aptitud` de forma exacta en cada llamada."""
+    global _memo_aptitud
+    _memo_aptitud = None
+
+
 def calcular_aptitud(lluvia_val, temp_val):
+    instrumentacion.contar("aptitud.evaluaciones")
+    if _memo_aptitud is not None:
+        return _memo_aptitud(temp_val, lluvia_val)
+    return _calcular_aptitud_exacta(lluvia_val, temp_val)
+
+
+# Motor vectorizado compartido por calcular_aptitud_lote
+_motor_aptitud = None
+
+
+def calcular_aptitud_lote(lluvias, temps, politica="clip"):
+    """
+    Versión vectorizada de `calcular_aptitud` para arreglos de días.
+
+    En vez de atrapar excepciones día por día, aplica una política explícita
+    ("clip", "zero", "nan", "extrapolate") a las entradas fuera de rango.
+    Si ninguna regla se activa el día vale 0.0, igual que `calcular_aptitud`.
+
+    Retorna (aptitudes, contadores); los contadores acumulados del motor se
+    consultan con `contadores_rango_aptitud()`.
+    """
+    global _motor_aptitud
+    if _motor_aptitud is None:
+        from src.fuzzy.motor_vectorizado import MotorDifusoVectorizado
+        _motor_aptitud = MotorDifusoVectorizado(sistema_global)
+
+    with instrumentacion.medir("aptitud.lote"):
+        aptitudes, contadores = _motor_aptitud.evaluar_lote(temps, lluvias, politica=politica,
+                                                            sin_activacion="cero")
+    instrumentacion.contar("aptitud.evaluaciones_lote", contadores["evaluados"])
+    return aptitudes, contadores
+
+
+def contadores_rango_aptitud():
+    """Contadores acumulados de `calcular_aptitud_lote` (entradas fuera de rango, etc.)."""
+    if _motor_aptitud is None:
+        return None
+    return dict(_motor_aptitud.contadores)
+
+
+def _calcular_aptitud_exacta(lluvia_val, temp_val):
     try:
         # Verificación de seguridad
         if 'sistema_global' not in globals():
@@ -0,0 +1,194 @@
+"""
+Memo cuantizado (LRU) para evaluaciones difusas de un solo día.
+
+Los pronósticos del Módulo 1 llegan con más decimales (p. ej. 13.459198 °C)
+de los que los universos definidos en `_crear_variables` pueden distinguir.
+Días vecinos casi idénticos repiten casi la misma inferencia, así que este
+módulo:
+
+    1. Evalúa la función sólo en los NODOS de una rejilla configurable y
+       guarda cada nodo en una caché LRU acotada.
+    2. Responde cada consulta interpolando (bilineal) entre las cuatro
+       esquinas de su celda, como motor_tabulado.py. Las celdas cuyas esquinas
+       difieren más de `salto_maximo` (un quiebre brusco o el salto a los
+       valores fijos cuando ninguna regla se activa) se evalúan de forma exacta.
+    3. Lleva la cuenta de aciertos/fallos y permite medir el error cometido
+       frente a la evaluación exacta.
+
+Cota de error: en una celda interpolada la respuesta queda entre los valores
+de sus esquinas, que difieren a lo más `salto_maximo`. Con la rejilla por defecto (0.1 °C × 0.1 mm,
+salto_maximo 1.0) la desviación máxima medida frente a skfuzzy en
+benchmarks/fidelidad_motores.py es 0.09 puntos, sin cambios de categoría ni
+de día óptimo. Con 0.5 °C la desviación sigue bajo 0.3 pero ya cambia el día
+elegido en empates de la meseta del paisaje.
+
+El memo es OPCIONAL. Se activa con `SistemaDifusoSiembra.activar_memo()` o con
+`activar_memo_aptitud()` (para `calcular_aptitud`), ambos en fuzzy_system.py.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+from src import instrumentacion
+
+
+class MemoDifusoCuantizado:
+    """
+    Envuelve una función `funcion(temperatura, precipitacion) -> float` con
+    una caché LRU de sus valores en los nodos de una rejilla.
+
+    Los nodos siempre se evalúan en la misma posición (índice × paso), por lo
+    que el resultado no depende del orden en que lleguen los días.
+
+    Args:
+        funcion (callable): Evaluación exacta a memorizar.
+        paso_temperatura (float): Tamaño de la rejilla en °C.
+        paso_lluvia (float): Tamaño de la rejilla en mm.
+        max_entradas (int): Número máximo de nodos guardados antes de
+            desalojar el menos usado recientemente.
+        salto_maximo (float): Diferencia máxima entre las esquinas de una
+            celda para interpolar; por encima se evalúa de forma exacta.
+    """
+
+    def __init__(self, funcion: Callable[[float, float], float],
+                 paso_temperatura: float = 0.1, paso_lluvia: float = 0.1,
+                 max_entradas: int = 16384, salto_maximo: float = 1.0):
+        if paso_temperatura <= 0 or paso_lluvia <= 0:
+            raise ValueError("❌ Los pasos de cuantización deben ser positivos")
+        if max_entradas < 4:
+            raise ValueError("❌ max_entradas debe ser al menos 4 (las esquinas de una celda)")
+        if salto_maximo < 0:
+            raise ValueError("❌ salto_maximo no puede ser negativo")
+
+        self.funcion = funcion
+        self.paso_temperatura = float(paso_temperatura)
+        self.paso_lluvia = float(paso_lluvia)
+        self.max_entradas = int(max_entradas)
+        self.salto_maximo = float(salto_maximo)
+
+        self._cache: "OrderedDict[Tuple[int, int], float]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.exactas = 0
+
+    def _celda(self, temperatura: float, precipitacion: float):
+        """Índices de la esquina inferior de la celda y posición (0-1) dentro de ella."""
+        pos_t = temperatura / self.paso_temperatura
+        pos_p = precipitacion / self.paso_lluvia
+        idx_t, idx_p = int(np.floor(pos_t)), int(np.floor(pos_p))
+        return idx_t, idx_p, pos_t - idx_t, pos_p - idx_p
+
+    def _nodo(self, idx_t: int, idx_p: int) -> float:
+        # Índices enteros del nodo: evitan comparar flotantes como llave
+        clave = (idx_t, idx_p)
+        if clave in self._cache:
+            self.aciertos += 1
+            instrumentacion.contar("difuso.memo_aciertos")
+            self._cache.move_to_end(clave)
+            return self._cache[clave]
+
+        self.fallos += 1
+        instrumentacion.contar("difuso.memo_fallos")
+        valor = self.funcion(idx_t * self.paso_temperatura, idx_p * self.paso_lluvia)
+        self._cache[clave] = valor
+
+        if len(self._cache) > self.max_entradas:
+            # Desalojar el nodo usado hace más tiempo
+            self._cache.popitem(last=False)
+
+        return valor
+
+    def _interpolar(self, temperatura: float, precipitacion: float):
+        """Valor interpolado en la celda, o None si la celda debe evaluarse exacta."""
+        idx_t, idx_p, ft, fp = self._celda(temperatura, precipitacion)
+        # Sólo se consultan las esquinas con peso (un nodo exacto es 1 consulta)
+        esquinas = [(0, 0, (1 - ft) * (1 - fp))]
+        if ft > 0:
+            esquinas.append((1, 0, ft * (1 - fp)))
+        if fp > 0:
+            esquinas.append((0, 1, (1 - ft) * fp))
+        if ft > 0 and fp > 0:
+            esquinas.append((1, 1, ft * fp))
+
+        valores = [self._nodo(idx_t + dt, idx_p + dp) for dt, dp, _ in esquinas]
+        if len(valores) > 1 and max(valores) - min(valores) > self.salto_maximo:
+            return None
+        return sum(peso * v for (_, _, peso), v in zip(esquinas, valores))
+
+    def __call__(self, temperatura: float, precipitacion: float) -> float:
+        valor = self._interpolar(temperatura, precipitacion)
+        if valor is None:
+            self.exactas += 1
+            instrumentacion.contar("difuso.memo_exactas")
+            return self.funcion(temperatura, precipitacion)
+        return valor
+
+    def limpiar(self):
+        """Vacía la caché y reinicia los contadores."""
+        self._cache.clear()
+        self.aciertos = 0
+        self.fallos = 0
+        self.exactas = 0
+
+    def estadisticas(self) -> Dict:
+        """
+        Resumen del uso de la caché.
+
+        Returns:
+            dict: aciertos y fallos (por nodo), tasa_aciertos (0-1),
+                  consultas evaluadas de forma exacta, entradas ocupadas,
+                  capacidad y parámetros de la rejilla.
+        """
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            "exactas": self.exactas,
+            "entradas": len(self._cache),
+            "max_entradas": self.max_entradas,
+            "paso_temperatura": self.paso_temperatura,
+            "paso_lluvia": self.paso_lluvia,
+            "salto_maximo": self.salto_maximo,
+        }
+
+    def estimar_error(self, temperaturas: Sequence[float],
+                      precipitaciones: Sequence[float]) -> Dict:
+        """
+        Compara el valor memorizado contra la evaluación exacta.
+
+        Cada muestra se evalúa de forma exacta y como la respondería el memo.
+        La caché y los contadores del memo se restauran al terminar.
+
+        Args:
+            temperaturas (list): Temperaturas de muestra en °C.
+            precipitaciones (list): Lluvias de muestra en mm (misma longitud).
+
+        Returns:
+            dict: error_maximo, error_medio, error_p95 y número de muestras.
+        """
+        temperaturas = np.asarray(temperaturas, dtype=float)
+        precipitaciones = np.asarray(precipitaciones, dtype=float)
+        if temperaturas.shape != precipitaciones.shape:
+            raise ValueError("❌ Las muestras de temperatura y lluvia deben tener la misma longitud")
+
+        respaldo = (self._cache.copy(), self.aciertos, self.fallos, self.exactas)
+        errores = np.empty(temperaturas.size, dtype=float)
+        try:
+            for i, (t, p) in enumerate(zip(temperaturas, precipitaciones)):
+                errores[i] = abs(self(t, p) - self.funcion(t, p))
+        finally:
+            self._cache, self.aciertos, self.fallos, self.exactas = respaldo
+
+        if errores.size == 0:
+            return {"error_maximo": 0.0, "error_medio": 0.0,
+                    "error_p95": 0.0, "muestras": 0}
+
+        return {
+            "error_maximo": float(errores.max()),
+            "error_medio": float(errores.mean()),
+            "error_p95": float(np.percentile(errores, 95)),
+            "muestras": int(errores.size),
+        }
@@ -0,0 +1,154 @@
+"""
+Motor difuso tabulado: rejilla precalculada + interpolación bilineal.
+
+El score de `SistemaDifusoSiembra` sólo depende de (temperatura, lluvia)
+dentro de un dominio acotado (5–45 °C × 0–45 mm). Este motor evalúa una vez
+la rejilla completa con el motor vectorizado y después responde cada consulta
+interpolando entre las cuatro esquinas de su celda: unas cuantas operaciones
+de NumPy por día, sin importar cuántas reglas tenga el sistema.
+
+Es una APROXIMACIÓN: el error depende del paso de la rejilla y es mayor
+cerca de los quiebres de las funciones de membresía. Las celdas donde alguna
+esquina no activa reglas (el score salta a un valor fijo) se evalúan de forma
+exacta. Para medir el error frente a la referencia skfuzzy ver
+benchmarks/fidelidad_motores.py.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.fuzzy.motor_vectorizado import (MotorDifusoVectorizado, RANGO_LLUVIA,
+                                         RANGO_TEMPERATURA, _score_sin_activacion)
+
+
+# "extrapolate" necesita la pendiente exacta en el borde; usar el motor vectorizado
+POLITICAS_TABULADO = ("clip", "zero", "nan")
+
+
+class MotorDifusoTabulado:
+    """
+    Tabla (temperatura × lluvia) de scores con la misma interfaz de
+    `evaluar_lote` que MotorDifusoVectorizado.
+
+    Args:
+        sistema (SistemaDifusoSiembra): Sistema de referencia. Si es None se
+            crea uno nuevo.
+        paso_temperatura (float): Paso de la rejilla en °C.
+        paso_lluvia (float): Paso de la rejilla en mm.
+    """
+
+    def __init__(self, sistema=None, paso_temperatura: float = 0.1, paso_lluvia: float = 0.1):
+        if paso_temperatura <= 0 or paso_lluvia <= 0:
+            raise ValueError("❌ Los pasos de la rejilla deben ser positivos")
+
+        self._motor = MotorDifusoVectorizado(sistema)
+        self.paso_temperatura = float(paso_temperatura)
+        self.paso_lluvia = float(paso_lluvia)
+
+        # Nodos de la rejilla (los extremos del rango siempre son nodos)
+        t_min, t_max = RANGO_TEMPERATURA
+        p_min, p_max = RANGO_LLUVIA
+        self.nodos_temperatura = np.linspace(
+            t_min, t_max, int(np.ceil((t_max - t_min) / self.paso_temperatura)) + 1)
+        self.nodos_lluvia = np.linspace(
+            p_min, p_max, int(np.ceil((p_max - p_min) / self.paso_lluvia)) + 1)
+
+        malla_t, malla_p = np.meshgrid(self.nodos_temperatura, self.nodos_lluvia, indexing='ij')
+        centroides, activado = self._motor.inferir(malla_t, malla_p)
+        self._centroides = centroides.reshape(malla_t.shape)
+        activado = activado.reshape(malla_t.shape)
+
+        # Celdas con alguna esquina sin reglas activas: el score salta a los
+        # valores fijos (10/15/30 o 0) y la interpolación lo suavizaría. Esas
+        # celdas se evalúan de forma exacta.
+        self._celda_exacta = ~(activado[:-1, :-1] & activado[1:, :-1]
+                               & activado[:-1, 1:] & activado[1:, 1:])
+
+    @property
+    def fraccion_exacta(self) -> float:
+        """Fracción de celdas de la rejilla que se evalúan de forma exacta."""
+        return float(self._celda_exacta.mean())
+
+    def _interpolar(self, t, p, sin_activacion: str) -> np.ndarray:
+        """
+        Interpolación bilineal en la rejilla (entradas ya saturadas al rango);
+        las celdas marcadas como exactas pasan por el motor vectorizado.
+        """
+        def indices(valores, nodos):
+            posicion = (valores - nodos[0]) / (nodos[1] - nodos[0])
+            i = np.clip(np.floor(posicion).astype(int), 0, nodos.size - 2)
+            return i, posicion - i
+
+        i, ft = indices(t, self.nodos_temperatura)
+        j, fp = indices(p, self.nodos_lluvia)
+        tabla = self._centroides
+        scores = ((1 - ft) * (1 - fp) * tabla[i, j] + ft * (1 - fp) * tabla[i + 1, j]
+                  + (1 - ft) * fp * tabla[i, j + 1] + ft * fp * tabla[i + 1, j + 1])
+
+        exactas = self._celda_exacta[i, j]
+        if exactas.any():
+            centroides, activado = self._motor.inferir(t[exactas], p[exactas])
+            if sin_activacion == "fallback":
+                respaldo = _score_sin_activacion(t[exactas], p[exactas])
+            else:
+                respaldo = 0.0
+            scores[exactas] = np.where(activado, centroides, respaldo)
+        return scores
+
+    def evaluar_lote(self, temperaturas, precipitaciones, politica: str = "clip",
+                     sin_activacion: str = "fallback") -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Evalúa muchos días a la vez interpolando en la tabla.
+
+        Args:
+            temperaturas (array): Temperaturas en °C.
+            precipitaciones (array): Lluvias en mm (misma forma).
+            politica (str): "clip", "zero" o "nan".
+            sin_activacion (str): "fallback" (10/15/30 como `evaluar`) o
+                "cero" (como `calcular_aptitud`).
+
+        Returns:
+            tuple: (scores, contadores), igual que MotorDifusoVectorizado.
+        """
+        if politica not in POLITICAS_TABULADO:
+            raise ValueError(f"❌ Política de rango no soportada por el motor tabulado: "
+                             f"{politica}. Opciones: {', '.join(POLITICAS_TABULADO)}")
+        if sin_activacion not in ("fallback", "cero"):
+            raise ValueError(f"❌ Opción sin_activacion desconocida: {sin_activacion}")
+
+        temperaturas = np.asarray(temperaturas, dtype=float)
+        precipitaciones = np.asarray(precipitaciones, dtype=float)
+        if temperaturas.shape != precipitaciones.shape:
+            raise ValueError("❌ temperaturas y precipitaciones deben tener la misma forma")
+        forma = temperaturas.shape
+        t = temperaturas.ravel()
+        p = precipitaciones.ravel()
+
+        t_min, t_max = RANGO_TEMPERATURA
+        p_min, p_max = RANGO_LLUVIA
+        no_finito = ~(np.isfinite(t) & np.isfinite(p))
+        t_baja, t_alta = t < t_min, t > t_max
+        p_baja, p_alta = p < p_min, p > p_max
+        fuera = t_baja | t_alta | p_baja | p_alta
+
+        t_sat = np.clip(np.nan_to_num(t, nan=t_min), t_min, t_max)
+        p_sat = np.clip(np.nan_to_num(p, nan=p_min), p_min, p_max)
+        scores = self._interpolar(t_sat, p_sat, sin_activacion)
+
+        if politica == "zero":
+            scores[fuera] = 0.0
+        elif politica == "nan":
+            scores[fuera] = np.nan
+        scores[no_finito] = np.nan
+
+        contadores = {
+            "evaluados": int(t.size),
+            "temperatura_bajo_rango": int(t_baja.sum()),
+            "temperatura_sobre_rango": int(t_alta.sum()),
+            "lluvia_bajo_rango": int(p_baja.sum()),
+            "lluvia_sobre_rango": int(p_alta.sum()),
+            "fuera_de_rango": int(fuera.sum()),
+            "no_finitos": int(no_finito.sum()),
+        }
+        return scores.reshape(forma), contadores
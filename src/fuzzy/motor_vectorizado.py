@@ -0,0 +1,305 @@
+"""
+Motor de inferencia difusa vectorizado y políticas de rango.
+
+`SistemaDifusoSiembra.evaluar` procesa un día a la vez, lanza `ValueError`
+fuera de 5–45 °C / 0–45 mm y recurre a un `KeyError` cuando ninguna regla se
+activa. `calcular_aptitud` además atrapa cualquier excepción y devuelve 0.0.
+Con muchos días fuera de rango ese flujo por excepciones es lento y distorsiona
+el fitness sin avisar.
+
+Este módulo evalúa ARREGLOS completos de días con NumPy, reproduciendo la
+inferencia Mamdani de skfuzzy (mínimo para AND, máximo para agregar, centroide
+sobre el universo de salida con los puntos de corte añadidos), y aplica una
+política explícita a las entradas fuera de rango:
+
+    "clip"         Satura la entrada al límite del rango válido.
+    "zero"         El día recibe score 0.0.
+    "nan"          El día recibe score NaN (para descartarlo después).
+    "extrapolate"  Continúa linealmente el score desde el límite, usando la
+                   pendiente en el borde (con términos "hombro" coincide con
+                   "clip").
+
+Cada evaluación regresa, además de los scores, contadores de cuántas entradas
+fueron afectadas.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+POLITICAS_RANGO = ("clip", "zero", "nan", "extrapolate")
+
+# Rangos válidos que documenta y valida SistemaDifusoSiembra.evaluar
+RANGO_TEMPERATURA = (5.0, 45.0)
+RANGO_LLUVIA = (0.0, 45.0)
+
+
+def _score_sin_activacion(temperaturas, precipitaciones):
+    """Score que `evaluar` asigna cuando ninguna regla se activa (rama KeyError)."""
+    return np.where(
+        (temperaturas < 10) | (temperaturas > 40), 10.0,
+        np.where((precipitaciones < 2) | (precipitaciones > 35), 15.0, 30.0)
+    )
+
+
+class MotorDifusoVectorizado:
+    """
+    Réplica vectorizada del sistema Mamdani de `SistemaDifusoSiembra`.
+
+    Los universos, funciones de membresía y reglas se leen del sistema
+    skfuzzy ya construido, así que cualquier cambio en fuzzy_system.py se
+    refleja aquí sin duplicar los puntos de quiebre.
+
+    Args:
+        sistema (SistemaDifusoSiembra): Sistema de referencia. Si es None se
+            crea uno nuevo.
+    """
+
+    def __init__(self, sistema=None):
+        if sistema is None:
+            from src.fuzzy.fuzzy_system import SistemaDifusoSiembra
+            sistema = SistemaDifusoSiembra()
+
+        self._antecedentes = {
+            sistema.temperatura.label: self._leer_variable(sistema.temperatura),
+            sistema.lluvia.label: self._leer_variable(sistema.lluvia),
+        }
+        self._etiqueta_temperatura = sistema.temperatura.label
+        self._etiqueta_lluvia = sistema.lluvia.label
+
+        self._universo_salida, mfs_salida = self._leer_variable(sistema.amplitud)
+        self._terminos_salida = list(mfs_salida)
+        self._mfs_salida = [mfs_salida[t] for t in self._terminos_salida]
+        self._inversas_salida = [self._preparar_inversas(mf) for mf in self._mfs_salida]
+
+        self._reglas = [self._leer_regla(regla) for regla in sistema.reglas]
+
+        self.contadores = self._contadores_vacios()
+
+    # ==========================================================================
+    #                   LECTURA DEL SISTEMA SKFUZZY
+    # ==========================================================================
+
+    @staticmethod
+    def _leer_variable(variable):
+        universo = np.asarray(variable.universe, dtype=float)
+        mfs = {etiqueta: np.asarray(termino.mf, dtype=float)
+               for etiqueta, termino in variable.terms.items()}
+        return universo, mfs
+
+    def _leer_regla(self, regla):
+        antecedente = regla.antecedent
+        if not hasattr(antecedente, 'term1'):
+            # Regla de un solo término
+            terminos = [(antecedente.parent.label, antecedente.label)]
+            operador = np.fmin
+        else:
+            if antecedente.kind not in ('and', 'or'):
+                raise ValueError(f"❌ Operador de regla no soportado: {antecedente.kind}")
+            terminos = [(antecedente.term1.parent.label, antecedente.term1.label),
+                        (antecedente.term2.parent.label, antecedente.term2.label)]
+            operador = np.fmin if antecedente.kind == 'and' else np.fmax
+
+        consecuente = regla.consequent[0]
+        indice_salida = self._terminos_salida.index(consecuente.term.label)
+        return terminos, operador, indice_salida, float(consecuente.weight)
+
+    def _preparar_inversas(self, mf):
+        """
+        Tramos monótonos (subida y bajada) de una función de membresía, para
+        encontrar en qué puntos del universo la función alcanza un corte dado.
+        """
+        pico = np.flatnonzero(mf == mf.max())
+        x = self._universo_salida
+        subida = (mf[:pico[0] + 1], x[:pico[0] + 1])
+        bajada = (mf[pico[-1]:][::-1], x[pico[-1]:][::-1])
+        return subida, bajada
+
+    # ==========================================================================
+    #                   INFERENCIA
+    # ==========================================================================
+
+    def inferir(self, temperaturas, precipitaciones) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inferencia Mamdani para arreglos de entradas (sin política de rango).
+
+        Igual que skfuzzy, las entradas se saturan a los extremos de cada
+        universo antes de fuzzificar.
+
+        Returns:
+            tuple: (centroides, activado). `activado` es False donde ninguna
+                   regla se activó; ahí el centroide es NaN.
+        """
+        entradas = {
+            self._etiqueta_temperatura: np.asarray(temperaturas, dtype=float).ravel(),
+            self._etiqueta_lluvia: np.asarray(precipitaciones, dtype=float).ravel(),
+        }
+
+        # --- 1. Fuzzificación ---
+        membresias = {}
+        for etiqueta, (universo, mfs) in self._antecedentes.items():
+            valores = np.clip(entradas[etiqueta], universo[0], universo[-1])
+            for termino, mf in mfs.items():
+                membresias[(etiqueta, termino)] = np.interp(valores, universo, mf)
+
+        n = entradas[self._etiqueta_temperatura].size
+        cortes = np.zeros((len(self._mfs_salida), n))
+
+        # --- 2. Evaluación de reglas y acumulación (máximo) ---
+        for terminos, operador, indice_salida, peso in self._reglas:
+            activacion = membresias[terminos[0]]
+            for termino in terminos[1:]:
+                activacion = operador(activacion, membresias[termino])
+            np.fmax(cortes[indice_salida], activacion * peso, out=cortes[indice_salida])
+
+        # --- 3. Universo de salida + puntos donde cada término cruza su corte ---
+        extra = []
+        for k, ((mf_sub, x_sub), (mf_baj, x_baj)) in enumerate(self._inversas_salida):
+            extra.append(np.interp(cortes[k], mf_sub, x_sub))
+            extra.append(np.interp(cortes[k], mf_baj, x_baj))
+        x = np.concatenate(
+            [np.broadcast_to(self._universo_salida, (n, self._universo_salida.size)),
+             np.stack(extra, axis=1)],
+            axis=1,
+        )
+        x.sort(axis=1)
+
+        # --- 4. Agregación: máximo de los términos recortados ---
+        y = np.zeros_like(x)
+        for k, mf in enumerate(self._mfs_salida):
+            np.maximum(y, np.minimum(cortes[k][:, None],
+                                     np.interp(x, self._universo_salida, mf)), out=y)
+
+        # --- 5. Centroide exacto de la función lineal a tramos ---
+        x1, x2 = x[:, :-1], x[:, 1:]
+        y1, y2 = y[:, :-1], y[:, 1:]
+        dx = x2 - x1
+        area = (dx * (y1 + y2) / 2.0).sum(axis=1)
+        momento = (dx * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2)) / 6.0).sum(axis=1)
+
+        activado = area > 0
+        centroides = np.full(n, np.nan)
+        np.divide(momento, area, out=centroides, where=activado)
+        return centroides, activado
+
+    # ==========================================================================
+    #                   POLÍTICAS DE RANGO
+    # ==========================================================================
+
+    @staticmethod
+    def _contadores_vacios() -> Dict[str, int]:
+        return {
+            "evaluados": 0,
+            "temperatura_bajo_rango": 0,
+            "temperatura_sobre_rango": 0,
+            "lluvia_bajo_rango": 0,
+            "lluvia_sobre_rango": 0,
+            "fuera_de_rango": 0,
+            "no_finitos": 0,
+            "sin_activacion": 0,
+        }
+
+    def evaluar_lote(self, temperaturas, precipitaciones, politica: str = "clip",
+                     sin_activacion: str = "fallback") -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        Evalúa muchos días a la vez aplicando una política de rango.
+
+        Args:
+            temperaturas (array): Temperaturas en °C.
+            precipitaciones (array): Lluvias en mm (misma forma).
+            politica (str): "clip", "zero", "nan" o "extrapolate".
+            sin_activacion (str): Qué hacer si ninguna regla se activa:
+                "fallback" usa los valores fijos de `evaluar` (10/15/30) y
+                "cero" devuelve 0.0 como `calcular_aptitud`.
+
+        Returns:
+            tuple: (scores, contadores). `scores` tiene la forma de la entrada
+                   y `contadores` indica cuántas entradas fueron afectadas.
+        """
+        if politica not in POLITICAS_RANGO:
+            raise ValueError(f"❌ Política de rango desconocida: {politica}. "
+                             f"Opciones: {', '.join(POLITICAS_RANGO)}")
+        if sin_activacion not in ("fallback", "cero"):
+            raise ValueError(f"❌ Opción sin_activacion desconocida: {sin_activacion}")
+
+        temperaturas = np.asarray(temperaturas, dtype=float)
+        precipitaciones = np.asarray(precipitaciones, dtype=float)
+        if temperaturas.shape != precipitaciones.shape:
+            raise ValueError("❌ temperaturas y precipitaciones deben tener la misma forma")
+        forma = temperaturas.shape
+        t = temperaturas.ravel()
+        p = precipitaciones.ravel()
+
+        t_min, t_max = RANGO_TEMPERATURA
+        p_min, p_max = RANGO_LLUVIA
+        no_finito = ~(np.isfinite(t) & np.isfinite(p))
+        t_baja, t_alta = t < t_min, t > t_max
+        p_baja, p_alta = p < p_min, p > p_max
+        fuera = t_baja | t_alta | p_baja | p_alta
+
+        # Todas las políticas evalúan sobre entradas saturadas; "zero"/"nan"
+        # sobrescriben después los días fuera de rango.
+        t_sat = np.clip(np.nan_to_num(t, nan=t_min), t_min, t_max)
+        p_sat = np.clip(np.nan_to_num(p, nan=p_min), p_min, p_max)
+        centroides, activado = self.inferir(t_sat, p_sat)
+
+        if sin_activacion == "fallback":
+            scores = np.where(activado, centroides, _score_sin_activacion(t_sat, p_sat))
+        else:
+            scores = np.where(activado, centroides, 0.0)
+
+        if politica == "zero":
+            scores[fuera] = 0.0
+        elif politica == "nan":
+            scores[fuera] = np.nan
+        elif politica == "extrapolate" and fuera.any():
+            scores[fuera] = self._extrapolar(t[fuera], p[fuera], t_sat[fuera],
+                                             p_sat[fuera], scores[fuera], sin_activacion)
+        scores[no_finito] = np.nan
+
+        contadores = {
+            "evaluados": int(t.size),
+            "temperatura_bajo_rango": int(t_baja.sum()),
+            "temperatura_sobre_rango": int(t_alta.sum()),
+            "lluvia_bajo_rango": int(p_baja.sum()),
+            "lluvia_sobre_rango": int(p_alta.sum()),
+            "fuera_de_rango": int(fuera.sum()),
+            "no_finitos": int(no_finito.sum()),
+            "sin_activacion": int((~activado).sum()),
+        }
+        for clave, valor in contadores.items():
+            self.contadores[clave] += valor
+
+        return scores.reshape(forma), contadores
+
+    def _extrapolar(self, t, p, t_sat, p_sat, base, sin_activacion):
+        """
+        Continúa el score linealmente desde el borde del rango válido usando
+        una diferencia finita hacia el interior (un paso del universo).
+        """
+        paso_t = np.diff(self._antecedentes[self._etiqueta_temperatura][0][:2])[0]
+        paso_p = np.diff(self._antecedentes[self._etiqueta_lluvia][0][:2])[0]
+
+        # Punto un paso hacia dentro del rango, sólo en el eje que se salió
+        t_int = t_sat - np.sign(t - t_sat) * paso_t
+        p_int = p_sat - np.sign(p - p_sat) * paso_p
+        centro_t, act_t = self.inferir(t_int, p_sat)
+        centro_p, act_p = self.inferir(t_sat, p_int)
+        if sin_activacion == "fallback":
+            interior_t = np.where(act_t, centro_t, _score_sin_activacion(t_int, p_sat))
+            interior_p = np.where(act_p, centro_p, _score_sin_activacion(t_sat, p_int))
+        else:
+            interior_t = np.where(act_t, centro_t, 0.0)
+            interior_p = np.where(act_p, centro_p, 0.0)
+
+        pendiente_t = (base - interior_t) / paso_t
+        pendiente_p = (base - interior_p) / paso_p
+        extrapolado = (base
+                       + pendiente_t * np.abs(t - t_sat)
+                       + pendiente_p * np.abs(p - p_sat))
+        return np.clip(extrapolado, self._universo_salida[0], self._universo_salida[-1])
+
+    def reiniciar_contadores(self):
+        """Pone en cero los contadores acumulados del motor."""
+        self.contadores = self._contadores_vacios()
@@ -0,0 +1,152 @@
+"""
+Registro de motores de inferencia difusa intercambiables.
+
+Todos los motores exponen la interfaz de MotorDifusoVectorizado:
+
+    evaluar_lote(temperaturas, precipitaciones, politica="clip",
+                 sin_activacion="fallback") -> (scores, contadores)
+
+así que el motor de puntuación, el flujo por bloques y la línea de comandos
+pueden elegir uno por nombre:
+
+    "skfuzzy"      Referencia: la simulación de skfuzzy, un día a la vez.
+    "memo"         skfuzzy con memo interpolado (nodos cada 0.1 °C × 0.1 mm).
+    "vectorizado"  Réplica NumPy exacta de la inferencia Mamdani (default).
+    "tabulado"     Rejilla precalculada con interpolación bilineal.
+
+La fidelidad y el rendimiento de cada uno se miden con
+benchmarks/fidelidad_motores.py.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.fuzzy.motor_tabulado import POLITICAS_TABULADO
+from src.fuzzy.motor_vectorizado import (POLITICAS_RANGO, RANGO_LLUVIA, RANGO_TEMPERATURA,
+                                         _score_sin_activacion)
+
+# skfuzzy sólo se evalúa dentro del dominio: no hay pendiente para "extrapolate"
+POLITICAS_REFERENCIA = ("clip", "zero", "nan")
+
+
+class MotorReferencia:
+    """
+    Adapta la simulación skfuzzy de `SistemaDifusoSiembra` a `evaluar_lote`.
+
+    Args:
+        sistema (SistemaDifusoSiembra): Sistema a usar (None crea uno nuevo).
+        paso_memo (float | None): Si se indica, cada día pasa por un memo
+            con nodos cada `paso_memo` °C y mm (ver memo_difuso.py).
+    """
+
+    def __init__(self, sistema=None, paso_memo: float = None):
+        if sistema is None:
+            from src.fuzzy.fuzzy_system import SistemaDifusoSiembra
+            sistema = SistemaDifusoSiembra()
+        self.sistema = sistema
+        self._memos = {}
+        self.paso_memo = paso_memo
+
+    def _centroide(self, temperatura: float, precipitacion: float) -> float:
+        """Centroide de skfuzzy, o NaN si ninguna regla se activa."""
+        simulacion = self.sistema.simulacion
+        simulacion.input['temperatura'] = temperatura
+        simulacion.input['lluvia'] = precipitacion
+        try:
+            simulacion.compute()
+            return float(simulacion.output['amplitud'])
+        except (KeyError, ValueError):
+            return np.nan
+
+    def _funcion(self, sin_activacion: str):
+        def score(temperatura, precipitacion):
+            centroide = self._centroide(temperatura, precipitacion)
+            if not np.isnan(centroide):
+                return centroide
+            if sin_activacion == "cero":
+                return 0.0
+            return float(_score_sin_activacion(temperatura, precipitacion))
+
+        if self.paso_memo is None:
+            return score
+        if sin_activacion not in self._memos:
+            from src.fuzzy.memo_difuso import MemoDifusoCuantizado
+            self._memos[sin_activacion] = MemoDifusoCuantizado(score, self.paso_memo,
+                                                               self.paso_memo)
+        return self._memos[sin_activacion]
+
+    def evaluar_lote(self, temperaturas, precipitaciones, politica: str = "clip",
+                     sin_activacion: str = "fallback") -> Tuple[np.ndarray, Dict[str, int]]:
+        if politica not in POLITICAS_REFERENCIA:
+            raise ValueError(f"❌ Política de rango no soportada por el motor skfuzzy: "
+                             f"{politica}. Opciones: {', '.join(POLITICAS_REFERENCIA)}")
+        if sin_activacion not in ("fallback", "cero"):
+            raise ValueError(f"❌ Opción sin_activacion desconocida: {sin_activacion}")
+
+        temperaturas = np.asarray(temperaturas, dtype=float)
+        precipitaciones = np.asarray(precipitaciones, dtype=float)
+        if temperaturas.shape != precipitaciones.shape:
+            raise ValueError("❌ temperaturas y precipitaciones deben tener la misma forma")
+        t = np.clip(np.nan_to_num(temperaturas.ravel(), nan=RANGO_TEMPERATURA[0]),
+                    *RANGO_TEMPERATURA)
+        p = np.clip(np.nan_to_num(precipitaciones.ravel(), nan=RANGO_LLUVIA[0]),
+                    *RANGO_LLUVIA)
+        no_finito = ~(np.isfinite(temperaturas) & np.isfinite(precipitaciones)).ravel()
+        fuera = (t != temperaturas.ravel()) | (p != precipitaciones.ravel())
+
+        funcion = self._funcion(sin_activacion)
+        scores = np.array([funcion(ti, pi) for ti, pi in zip(t, p)], dtype=float)
+        if politica == "zero":
+            scores[fuera] = 0.0
+        elif politica == "nan":
+            scores[fuera] = np.nan
+        scores[no_finito] = np.nan
+
+        contadores = {"evaluados": int(t.size), "fuera_de_rango": int((fuera & ~no_finito).sum()),
+                      "no_finitos": int(no_finito.sum())}
+        return scores.reshape(temperaturas.shape), contadores
+
+
+def _vectorizado(sistema):
+    from src.fuzzy.motor_vectorizado import MotorDifusoVectorizado
+    return MotorDifusoVectorizado(sistema)
+
+
+def _tabulado(sistema):
+    from src.fuzzy.motor_tabulado import MotorDifusoTabulado
+    return MotorDifusoTabulado(sistema)
+
+
+MOTORES = {
+    "skfuzzy": lambda sistema: MotorReferencia(sistema),
+    "memo": lambda sistema: MotorReferencia(sistema, paso_memo=0.1),
+    "vectorizado": _vectorizado,
+    "tabulado": _tabulado,
+}
+
+# Políticas de rango que acepta cada motor del registro
+POLITICAS_MOTOR = {
+    "skfuzzy": POLITICAS_REFERENCIA,
+    "memo": POLITICAS_REFERENCIA,
+    "vectorizado": POLITICAS_RANGO,
+    "tabulado": POLITICAS_TABULADO,
+}
+
+
+def crear_motor(nombre: str = "vectorizado", sistema=None):
+    """
+    Construye un motor del registro por nombre.
+
+    Args:
+        nombre (str): "skfuzzy", "memo", "vectorizado" o "tabulado".
+        sistema (SistemaDifusoSiembra): Sistema de referencia (default: el
+            global de fuzzy_system).
+    """
+    if nombre not in MOTORES:
+        raise ValueError(f"❌ Motor difuso desconocido: {nombre}. "
+                         f"Opciones: {', '.join(MOTORES)}")
+    if sistema is None:
+        from src.fuzzy.fuzzy_system import sistema_global
+        sistema = sistema_global
+    return MOTORES[nombre](sistema)
@@ -0,0 +1,172 @@
+"""
+Registros compactos de resultados de la evaluación difusa.
+
+`evaluar` regresa un diccionario anidado por día:
+
+    {"score_amplitud": 85.77, "categoria": "EXCELENTE",
+     "recomendacion": "Sembrar", "inputs": {"temperatura": 27, "precipitacion": 10}}
+
+Con 365 días × sitios × escenarios eso son millones de diccionarios y
+cadenas repetidas (memoria y trabajo para el recolector de basura). Para esos
+casos:
+
+    ResultadoDia      Un día (`evaluar_registro`): objeto con __slots__ (sin
+                      __dict__). Se puede leer como el diccionario
+                      (r["categoria"]), pero no es un dict: para JSON o para
+                      modificarlo, `a_dict()`.
+    DTYPE_RESULTADO   Muchos días: un arreglo estructurado de NumPy, 33 bytes
+                      por día. Categoría y recomendación se guardan como un
+                      código entero (índice en CATEGORIAS; SIN_DATO al final).
+
+`a_dict()` / `lote_a_dicts()` reconstruyen la forma JSON original, que es la
+que sigue escribiendo `exportar_a_json`.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+# (score mínimo, categoría, recomendación), de mayor a menor
+CATEGORIAS = (
+    (70, "EXCELENTE", "Sembrar"),
+    (50, "BUENO", "Sembrar con monitoreo"),
+    (30, "REGULAR", "Esperar si es posible"),
+    (float("-inf"), "MALO", "NO sembrar"),
+)
+
+# Código de los scores NaN (política de rango "nan")
+CODIGO_SIN_DATO = len(CATEGORIAS)
+NOMBRES_CATEGORIA = np.array([c for _, c, _ in CATEGORIAS] + ["SIN_DATO"])
+RECOMENDACIONES = np.array([r for _, _, r in CATEGORIAS] + ["Sin datos"])
+_UMBRALES = np.array([minimo for minimo, _, _ in CATEGORIAS])
+
+DTYPE_RESULTADO = np.dtype([
+    ('fecha', 'datetime64[D]'),
+    ('temperatura', 'float64'),
+    ('precipitacion', 'float64'),
+    ('score_amplitud', 'float64'),
+    ('codigo', 'uint8'),
+])
+
+
+def codificar_categorias(scores) -> np.ndarray:
+    """Código de categoría (uint8) de cada score; NaN → CODIGO_SIN_DATO."""
+    scores = np.asarray(scores, dtype=float)
+    # Primer umbral que el score alcanza (los umbrales van de mayor a menor)
+    codigos = np.argmax(scores[..., None] >= _UMBRALES, axis=-1).astype(np.uint8)
+    codigos[np.isnan(scores)] = CODIGO_SIN_DATO
+    return codigos
+
+
+class ResultadoDia:
+    """
+    Resultado de evaluar un día.
+
+    Se accede por atributo (r.categoria) o, sólo para leer, como el
+    diccionario de `evaluar` (r["categoria"], r["inputs"]["temperatura"]).
+
+    Args:
+        score_amplitud (float): Puntaje 0-100 (NaN sin dato).
+        codigo (int): Índice de la categoría en CATEGORIAS.
+        temperatura (float): Temperatura de entrada en °C.
+        precipitacion (float): Lluvia de entrada en mm.
+        fecha: (opcional) Fecha del día, tal como llegó.
+    """
+
+    __slots__ = ("score_amplitud", "codigo", "temperatura", "precipitacion", "fecha")
+
+    _CLAVES = ("score_amplitud", "categoria", "recomendacion", "inputs", "fecha")
+
+    def __init__(self, score_amplitud: float, codigo: int, temperatura: float,
+                 precipitacion: float, fecha=None):
+        self.score_amplitud = score_amplitud
+        self.codigo = codigo
+        self.temperatura = temperatura
+        self.precipitacion = precipitacion
+        self.fecha = fecha
+
+    @property
+    def categoria(self) -> str:
+        return str(NOMBRES_CATEGORIA[self.codigo])
+
+    @property
+    def recomendacion(self) -> str:
+        return str(RECOMENDACIONES[self.codigo])
+
+    @property
+    def inputs(self) -> Dict:
+        return {"temperatura": self.temperatura, "precipitacion": self.precipitacion}
+
+    def a_dict(self) -> Dict:
+        """Forma JSON de siempre (con 'fecha' sólo si el día la trae)."""
+        datos = {
+            "score_amplitud": self.score_amplitud,
+            "categoria": self.categoria,
+            "recomendacion": self.recomendacion,
+            "inputs": self.inputs,
+        }
+        if self.fecha is not None:
+            datos["fecha"] = self.fecha
+        return datos
+
+    # --- Compatibilidad con el diccionario anterior ---
+
+    def __getitem__(self, clave: str):
+        if clave not in self._CLAVES or (clave == "fecha" and self.fecha is None):
+            raise KeyError(clave)
+        return getattr(self, clave)
+
+    def __setitem__(self, clave: str, valor):
+        if clave != "fecha":
+            raise KeyError(f"❌ Sólo 'fecha' puede asignarse en un ResultadoDia, no '{clave}'")
+        self.fecha = valor
+
+    def __contains__(self, clave: str) -> bool:
+        return clave in self._CLAVES and (clave != "fecha" or self.fecha is not None)
+
+    def get(self, clave: str, default=None):
+        return self[clave] if clave in self else default
+
+    def keys(self):
+        return self.a_dict().keys()
+
+    def __eq__(self, otro) -> bool:
+        if isinstance(otro, ResultadoDia):
+            otro = otro.a_dict()
+        return self.a_dict() == otro
+
+    def __repr__(self) -> str:
+        return repr(self.a_dict())
+
+
+# --- LOTES ---
+
+def crear_lote(scores, temperaturas, precipitaciones, fechas=None) -> np.ndarray:
+    """
+    Arreglo estructurado (DTYPE_RESULTADO) con los resultados de muchos días.
+
+    `fechas` puede ser None (quedan NaT) o cualquier arreglo convertible a
+    datetime64[D].
+    """
+    scores = np.asarray(scores, dtype=float).ravel()
+    lote = np.empty(scores.size, dtype=DTYPE_RESULTADO)
+    lote['fecha'] = np.datetime64('NaT') if fechas is None else \
+        np.asarray(fechas, dtype='datetime64[D]').ravel()
+    lote['temperatura'] = np.asarray(temperaturas, dtype=float).ravel()
+    lote['precipitacion'] = np.asarray(precipitaciones, dtype=float).ravel()
+    lote['score_amplitud'] = scores
+    lote['codigo'] = codificar_categorias(scores)
+    return lote
+
+
+def resultado_de_lote(lote: np.ndarray, i: int) -> ResultadoDia:
+    """El día `i` del lote como ResultadoDia."""
+    fila = lote[i]
+    fecha = None if np.isnat(fila['fecha']) else str(fila['fecha'])
+    return ResultadoDia(float(fila['score_amplitud']), int(fila['codigo']),
+                        float(fila['temperatura']), float(fila['precipitacion']), fecha)
+
+
+def lote_a_dicts(lote: np.ndarray) -> List[Dict]:
+    """Todo el lote en la forma JSON de `evaluar` (para exportar)."""
+    return [resultado_de_lote(lote, i).a_dict() for i in range(len(lote))]
@@ -0,0 +1,180 @@
+"""
+Instrumentación ligera: temporizadores y contadores por etapa.
+
+Registra en qué se va el tiempo de una corrida (carga del CSV, construcción
+del sistema difuso, evaluaciones de fitness, gráficas...) y cuántas veces
+ocurre cada operación (evaluaciones difusas, aciertos del memo, ventanas de
+clima consultadas, llamadas a predict del modelo).
+
+Está DESACTIVADA por defecto. Desactivada, cada punto instrumentado cuesta
+sólo la consulta de una bandera global, así que puede quedarse en el código
+de producción. Se activa con `activar()` o con la variable de entorno
+SIEMBRA_INSTRUMENTACION=1 (antes de importar los módulos, para medir también
+las cargas que ocurren al importar).
+
+    from src import instrumentacion
+
+    instrumentacion.activar()
+    with instrumentacion.medir("optimizacion"):
+        ...
+    instrumentacion.contar("difuso.evaluaciones")
+    instrumentacion.volcar("metricas.json")   # o "metricas.prom"
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict
+
+_activo = os.environ.get("SIEMBRA_INSTRUMENTACION", "") not in ("", "0")
+_candado = threading.Lock()
+_contadores: Dict[str, float] = {}
+_temporizadores: Dict[str, Dict[str, float]] = {}
+
+
+class _SinMedicion:
+    """Contexto vacío que se regresa cuando la instrumentación está apagada."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_SIN_MEDICION = _SinMedicion()
+
+
+def activar():
+    """Empieza a registrar tiempos y contadores."""
+    global _activo
+    _activo = True
+
+
+def desactivar():
+    """Deja de registrar (conserva lo ya medido)."""
+    global _activo
+    _activo = False
+
+
+def activa() -> bool:
+    return _activo
+
+
+def reiniciar():
+    """Borra todos los tiempos y contadores registrados."""
+    with _candado:
+        _contadores.clear()
+        _temporizadores.clear()
+
+
+def contar(nombre: str, cantidad: float = 1):
+    """Suma `cantidad` al contador `nombre`."""
+    if not _activo:
+        return
+    with _candado:
+        _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+
+def registrar_tiempo(nombre: str, segundos: float):
+    """Agrega una duración ya medida al temporizador `nombre`."""
+    with _candado:
+        datos = _temporizadores.setdefault(nombre, {"llamadas": 0, "total_s": 0.0, "max_s": 0.0})
+        datos["llamadas"] += 1
+        datos["total_s"] += segundos
+        datos["max_s"] = max(datos["max_s"], segundos)
+
+
+@contextmanager
+def _medir(nombre: str):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_tiempo(nombre, time.perf_counter() - inicio)
+
+
+def medir(nombre: str):
+    """Contexto que cronometra su bloque bajo `nombre` (no hace nada si está apagada)."""
+    if not _activo:
+        return _SIN_MEDICION
+    return _medir(nombre)
+
+
+def cronometrado(nombre: str):
+    """Decorador: cronometra cada llamada a la función bajo `nombre`."""
+    def decorador(funcion):
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _activo:
+                return funcion(*args, **kwargs)
+            with _medir(nombre):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+# --- EXPORTACIÓN ---
+
+def instantanea() -> Dict:
+    """Copia de todo lo registrado: {"contadores": {...}, "temporizadores": {...}}."""
+    with _candado:
+        return {
+            "contadores": dict(_contadores),
+            "temporizadores": {nombre: dict(datos) for nombre, datos in _temporizadores.items()},
+        }
+
+
+def a_json() -> str:
+    return json.dumps(instantanea(), indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def _nombre_prometheus(nombre: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in nombre)
+
+
+def a_prometheus(prefijo: str = "siembra") -> str:
+    """
+    Formato de texto de Prometheus: un contador por métrica y, por cada
+    temporizador, la suma de segundos, el número de llamadas y el máximo.
+    """
+    datos = instantanea()
+    lineas = []
+    for nombre, valor in sorted(datos["contadores"].items()):
+        metrica = f"{prefijo}_{_nombre_prometheus(nombre)}_total"
+        lineas += [f"# TYPE {metrica} counter", f"{metrica} {valor}"]
+    for nombre, tiempo in sorted(datos["temporizadores"].items()):
+        metrica = f"{prefijo}_{_nombre_prometheus(nombre)}_segundos"
+        lineas += [f"# TYPE {metrica} summary",
+                   f"{metrica}_sum {tiempo['total_s']}",
+                   f"{metrica}_count {tiempo['llamadas']}",
+                   f"# TYPE {metrica}_max gauge",
+                   f"{metrica}_max {tiempo['max_s']}"]
+    return "\n".join(lineas) + "\n"
+
+
+def volcar(ruta: str) -> str:
+    """
+    Guarda lo registrado en `ruta`: texto Prometheus si termina en .prom o
+    .txt, JSON en cualquier otro caso. Retorna la ruta absoluta.
+    """
+    texto = a_prometheus() if ruta.endswith((".prom", ".txt")) else a_json()
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(texto)
+    return os.path.abspath(ruta)
+
+
+def resumen() -> str:
+    """Tabla legible de tiempos (de mayor a menor) y contadores."""
+    datos = instantanea()
+    lineas = [f" {'etapa':<32} {'llamadas':>9} {'total (s)':>10} {'máx (s)':>9}"]
+    for nombre, tiempo in sorted(datos["temporizadores"].items(),
+                                 key=lambda par: par[1]["total_s"], reverse=True):
+        lineas.append(f" {nombre:<32} {tiempo['llamadas']:>9} "
+                      f"{tiempo['total_s']:>10.3f} {tiempo['max_s']:>9.3f}")
+    for nombre, valor in sorted(datos["contadores"].items()):
+        lineas.append(f" {nombre:<32} {valor:>9g}")
+    return "\n".join(lineas)
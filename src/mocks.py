@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 # Simula la Red Neuronal (Compañera 1)
 def predecir_clima_simulado(dia_inicio, duracion=120):
     clima = []
@@ -16,4 +18,146 @@ def evaluar_riesgo_simulado(temp, lluvia):
     riesgo = 0
     if temp > 30: riesgo += 50
     if lluvia < 5: riesgo += 50
-    return min(riesgo, 100)
\ No newline at end of file
+    return min(riesgo, 100)
+
+# ==============================================================================
+#            CLIMA SINTÉTICO VECTORIZADO (pruebas de carga)
+# ==============================================================================
+#
+# Los simuladores de arriba generan un día a la vez con `random`. Para probar
+# el motor difuso, los optimizadores y el servicio a escala de producción
+# (miles de sitios × décadas) sin datos de la NASA ni modelo entrenado, este
+# generador produce series completas con NumPy, reproducibles por semilla.
+#
+# Calibrado con el histórico de Huajuapan (Reporte_Humano_Huajuapan.csv,
+# 2005-2024) por mínimos cuadrados sobre dos armónicos anuales:
+#
+#   - Temperatura: climatología estacional (máximo en mayo) + anomalía AR(1)
+#     (φ = 0.71) con desviación mayor en la temporada seca.
+#   - Lluvia: cadena de Markov húmedo/seco con probabilidad estacional de día
+#     húmedo (temporada de junio a septiembre) y rachas: con persistencia
+#     0.40 resultan P(húmedo | húmedo) ≈ 0.78 y P(húmedo | seco) ≈ 0.15 como
+#     en el histórico. Montos: 1 mm + gamma con media estacional.
+#   - Sitios: desplazamiento de temperatura (altitud) y factores de lluvia
+#     propios. Años: anomalía de temperatura y de lluvia (años secos/húmedos).
+
+SEMILLA_SINTETICA = 2026
+DIAS_ANIO = 365
+
+# Coeficientes (media, cos, sen, cos 2ω, sen 2ω) con ω = 2π·(día - 1)/365
+ARMONICOS_TEMPERATURA = (16.52, -2.60, 1.23, -1.06, -0.52)
+ARMONICOS_DESVIACION_TEMPERATURA = (1.92, 0.70, 0.44, 0.06, -0.17)
+ARMONICOS_PROB_HUMEDO = (0.409, -0.368, -0.206, 0.004, 0.042)
+ARMONICOS_MONTO_HUMEDO = (4.27, -2.11, -1.14, -0.20, 0.27)
+
+AUTOCORRELACION_TEMPERATURA = 0.71
+PERSISTENCIA_HUMEDA = 0.4
+UMBRAL_HUMEDO = 1.0  # mm
+FORMA_GAMMA_LLUVIA = 0.85
+
+
+def _armonicos(coeficientes) -> np.ndarray:
+    """Valor diario (365 días) de una serie de dos armónicos anuales."""
+    w = 2 * np.pi * np.arange(DIAS_ANIO) / DIAS_ANIO
+    base = np.stack([np.ones_like(w), np.cos(w), np.sin(w), np.cos(2 * w), np.sin(2 * w)])
+    return np.asarray(coeficientes) @ base
+
+
+def generar_clima(sitios: int = 1, anios: int = 1, semilla: int = SEMILLA_SINTETICA):
+    """
+    Temperatura (°C) y lluvia (mm) diarias sintéticas.
+
+    Args:
+        sitios (int): Número de sitios (parcelas) independientes.
+        anios (int): Años de 365 días por sitio.
+        semilla (int): Semilla del generador (misma semilla, mismas series).
+
+    Returns:
+        tuple: (temps, lluvias) con forma (sitios, anios, 365). Para una
+               serie continua por sitio: temps.reshape(sitios, -1).
+    """
+    rng = np.random.default_rng(semilla)
+    forma = (sitios, anios)
+
+    # Variación por sitio y por año
+    desplazamiento = rng.normal(0, 1.5, (sitios, 1)) + rng.normal(0, 0.4, forma)
+    factor_humedo = np.exp(rng.normal(0, 0.15, (sitios, 1)) + rng.normal(0, 0.15, forma))
+    factor_monto = np.exp(rng.normal(0, 0.25, (sitios, 1)))
+
+    clima_temp = _armonicos(ARMONICOS_TEMPERATURA)
+    desviacion = _armonicos(ARMONICOS_DESVIACION_TEMPERATURA)
+    prob_humedo = np.clip(_armonicos(ARMONICOS_PROB_HUMEDO), 0.02, 0.95)
+    monto_medio = np.maximum(_armonicos(ARMONICOS_MONTO_HUMEDO), UMBRAL_HUMEDO + 0.5)
+
+    # Anomalía AR(1) con varianza estacionaria 1 (se escala por día)
+    phi = AUTOCORRELACION_TEMPERATURA
+    ruido = rng.standard_normal(forma + (DIAS_ANIO,)) * np.sqrt(1 - phi ** 2)
+    # Cadena de Markov: P(húmedo | seco) y P(húmedo | húmedo) con la
+    # probabilidad estacionaria `prob_humedo`
+    pi = np.clip(prob_humedo * factor_humedo[..., None], 0.01, 0.97)
+    p01 = pi * (1 - PERSISTENCIA_HUMEDA)
+    p11 = np.minimum(PERSISTENCIA_HUMEDA + p01, 0.99)
+    sorteo = rng.random(forma + (DIAS_ANIO,))
+
+    anomalia = np.empty(forma + (DIAS_ANIO,))
+    humedo = np.empty(forma + (DIAS_ANIO,), dtype=bool)
+    anomalia[..., 0] = rng.standard_normal(forma)
+    humedo[..., 0] = sorteo[..., 0] < pi[..., 0]
+    for d in range(1, DIAS_ANIO):
+        anomalia[..., d] = phi * anomalia[..., d - 1] + ruido[..., d]
+        humedo[..., d] = sorteo[..., d] < np.where(humedo[..., d - 1], p11[..., d], p01[..., d])
+
+    temps = clima_temp + desplazamiento[..., None] + desviacion * anomalia
+    escala = (monto_medio - UMBRAL_HUMEDO) * factor_monto[..., None] / FORMA_GAMMA_LLUVIA
+    montos = UMBRAL_HUMEDO + rng.gamma(FORMA_GAMMA_LLUVIA, 1.0, forma + (DIAS_ANIO,)) * escala
+    lluvias = np.where(humedo, montos, 0.0)
+    return temps, lluvias
+
+
+def guardar_pronosticos_sinteticos(directorio: str, sitios: int = 1, anios: int = 1,
+                                   semilla: int = SEMILLA_SINTETICA, anio_inicio: int = 2026,
+                                   formato: str = "npy"):
+    """
+    Escribe un pronóstico sintético por sitio, legible por
+    gestor_climatico.iterar_pronostico (y por --pronostico en la CLI).
+
+    Args:
+        directorio (str): Carpeta de salida (se crea si no existe).
+        sitios, anios, semilla: Ver generar_clima.
+        anio_inicio (int): Año de la primera fecha. Las fechas son días
+            consecutivos; con años bisiestos se recorren un día por año.
+        formato (str): "npy" (DTYPE_PRONOSTICO) o "csv" (columnas del
+            Módulo 1).
+
+    Returns:
+        list: Rutas escritas (sitio_000.npy, sitio_001.npy, ...).
+    """
+    import os
+
+    from src.neural.gestor_climatico import DTYPE_PRONOSTICO
+
+    if formato not in ("npy", "csv"):
+        raise ValueError(f"❌ Formato desconocido: {formato}. Opciones: npy, csv")
+
+    os.makedirs(directorio, exist_ok=True)
+    temps, lluvias = generar_clima(sitios, anios, semilla)
+    n_dias = anios * DIAS_ANIO
+    fechas = np.datetime64(f"{anio_inicio}-01-01") + np.arange(n_dias)
+
+    rutas = []
+    for sitio in range(sitios):
+        ruta = os.path.join(directorio, f"sitio_{sitio:03d}.{formato}")
+        datos = np.empty(n_dias, dtype=DTYPE_PRONOSTICO)
+        datos['fecha'] = fechas
+        datos['temp'] = temps[sitio].ravel()
+        datos['lluvia'] = lluvias[sitio].ravel()
+        if formato == "npy":
+            np.save(ruta, datos)
+        else:
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write("Fecha,Temperatura_Predicha,Lluvia_Predicha\n")
+                f.writelines(f"{fecha},{t:.6f},{l:.6f}\n" for fecha, t, l in
+                             zip(fechas.astype(str), datos['temp'].tolist(),
+                                 datos['lluvia'].tolist()))
+        rutas.append(ruta)
+    return rutas
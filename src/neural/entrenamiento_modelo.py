@@ -0,0 +1,259 @@
+"""
+Este código es la implementación de la Fase 1: 
+Entrenamiento del Modelo LSTM (entrenamiento_modelo.py) del proyecto. 
+Su propósito es diseñar, compilar y entrenar la red neuronal para la predicción 
+climática de temperatura y precipitación, utilizando el dataset creado previamente.
+"""
+import pandas as pd
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.models import Sequential
+from tensorflow.keras.layers import LSTM, Dense, Dropout
+from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
+import matplotlib.pyplot as plt
+
+from src.neural.preparacion_datos import (SERIE_DIARIA, guardar_serie_diaria, indices_ventanas,
+                                         procesar_datos)
+
+# CONFIGURACIÓN DEL MODELO
+VENTANA_DIAS = 15
+N_FEATURES = 4  #los datos (Temp, Lluvia, Dia_Sin, Dia_Cos)
+N_OUTPUTS = 2   # (TARGET_Temp_Manana, TARGET_Lluvia_Manana)
+TAM_LOTE = 32
+
+# --- PASO 1: CARGAR Y PREPARAR LOS DATOS
+def cargar_y_formatear_datos():
+    print("1. Cargando y formateando Dataset_Entrenamiento_IA.csv...")
+    try:
+        df = pd.read_csv('Dataset_Entrenamiento_IA.csv')
+    except FileNotFoundError:
+        print(" ERROR: El archivo 'Dataset_Entrenamiento_IA.csv' no se encontró.")
+        print("         Asegúrate de ejecutar primero 'preparacion_datos.py'.")
+        return None, None, None, None
+        
+    # El 80% para entrenamiento, el 20% para validación (prueba)
+    split_index = int(len(df) * 0.8)
+    
+    # Separar entradas (X) y salidas/objetivos (Y)
+    
+    # X: Columnas de entrada (historia de 15 días)
+    X = df.iloc[:, :-N_OUTPUTS].values 
+    # Y: Columnas de salida (predicción del día siguiente)
+    Y = df.iloc[:, -N_OUTPUTS:].values 
+
+    # IMPORTANTE: Reformatear X a la forma que LSTM espera: [Ejemplos, Pasos de Tiempo, Características]
+    X = X.reshape(X.shape[0], VENTANA_DIAS, N_FEATURES)
+    print(f"   -> Forma de los datos de entrada (X): {X.shape}")
+    print(f"   -> Forma de los datos de salida (Y): {Y.shape}")
+
+    # Separación final
+    X_train, X_val = X[:split_index], X[split_index:]
+    Y_train, Y_val = Y[:split_index], Y[split_index:]
+    
+    return X_train, Y_train, X_val, Y_val
+
+# --- PASO 1 (tf.data): VENTANAS AL VUELO DESDE LA SERIE DIARIA ---
+#
+# El CSV de ventanas repite cada día 15 veces (una por ventana que lo
+# contiene) y `model.fit` recibía todo el arreglo en memoria. Aquí sólo vive
+# la serie diaria (días × 4, float32) y cada lote de ventanas se arma al
+# vuelo con un tf.gather; en memoria sólo hay índices de inicio (8 bytes por
+# ejemplo) y los lotes que el prefetch tiene listos.
+
+def cargar_serie_diaria(ruta=SERIE_DIARIA):
+    """
+    Serie diaria normalizada (días × 4). Si no existe el .npy se construye
+    desde 'Reporte_Humano_Huajuapan.csv' con el mismo procesamiento que
+    preparacion_datos.py. Retorna None si no hay ninguno de los dos.
+    """
+    print(f"1. Cargando la serie diaria {ruta}...")
+    try:
+        return np.load(ruta).astype(np.float32, copy=False)
+    except FileNotFoundError:
+        pass
+    try:
+        reporte = pd.read_csv('Reporte_Humano_Huajuapan.csv')
+    except FileNotFoundError:
+        print(f" ERROR: No se encontró '{ruta}' ni 'Reporte_Humano_Huajuapan.csv'.")
+        print("         Asegúrate de ejecutar primero 'preparacion_datos.py'.")
+        return None
+    print("   -> Construyéndola desde 'Reporte_Humano_Huajuapan.csv'...")
+    guardar_serie_diaria(procesar_datos(reporte), ruta)
+    return np.load(ruta).astype(np.float32, copy=False)
+
+
+def crear_dataset_ventanas(serie, inicios, tam_lote=TAM_LOTE, barajar=False,
+                           cache=None, semilla=None, ventana=VENTANA_DIAS):
+    """
+    tf.data.Dataset de lotes (X, Y): X con forma (lote, ventana, N_FEATURES)
+    e Y el día siguiente a cada ventana (temperatura y lluvia normalizadas).
+
+    Args:
+        serie (array): Serie diaria (días × N_FEATURES), o varias series ya
+            concatenadas (ver indices_ventanas).
+        inicios (array): Índices de inicio de cada ventana.
+        tam_lote (int): Ejemplos por lote.
+        barajar (bool): Barajar los ejemplos en cada época (como `fit` con
+            arreglos en memoria).
+        cache (str | None): None no guarda los lotes; "" los guarda en
+            memoria después de la primera época; una ruta, en disco.
+        semilla (int | None): Semilla del barajado.
+    """
+    serie = tf.constant(np.asarray(serie, dtype=np.float32))
+    desfases = tf.range(ventana + 1, dtype=tf.int64)
+
+    def armar_lote(indices):
+        dias = tf.gather(serie, indices[:, None] + desfases)  # (lote, ventana + 1, features)
+        return dias[:, :ventana, :], dias[:, ventana, :N_OUTPUTS]
+
+    ds = tf.data.Dataset.from_tensor_slices(np.asarray(inicios, dtype=np.int64))
+    if barajar:
+        ds = ds.shuffle(len(inicios), seed=semilla, reshuffle_each_iteration=True)
+    ds = ds.batch(tam_lote)
+    ds = ds.map(armar_lote, num_parallel_calls=tf.data.AUTOTUNE, deterministic=not barajar)
+    if cache is not None:
+        ds = ds.cache(cache)
+    return ds.prefetch(tf.data.AUTOTUNE)
+
+
+def crear_datasets(serie, tam_lote=TAM_LOTE, semilla=None):
+    """
+    Datasets de entrenamiento (barajado) y validación (en caché: es el
+    mismo en cada época). `serie` puede ser una serie o una lista de series.
+    """
+    series = serie if isinstance(serie, (list, tuple)) else [serie]
+    inicios_entrenamiento, inicios_validacion = indices_ventanas([len(s) for s in series])
+    serie = np.concatenate(series) if len(series) > 1 else series[0]
+    print(f"   -> {len(serie)} días, {len(inicios_entrenamiento)} ventanas de entrenamiento "
+          f"y {len(inicios_validacion)} de validación")
+
+    ds_entrenamiento = crear_dataset_ventanas(serie, inicios_entrenamiento, tam_lote,
+                                              barajar=True, semilla=semilla)
+    ds_validacion = crear_dataset_ventanas(serie, inicios_validacion, tam_lote, cache="")
+    return ds_entrenamiento, ds_validacion
+
+#DISEÑO Y COMPILACION EL MODELO LSTM 
+def crear_modelo(input_shape):
+    print("2. Diseñando la Red Neuronal LSTM...")
+    
+    model = Sequential([
+        # Capa LSTM: Toma la secuencia de 15 días
+        LSTM(units=64, 
+             activation='tanh', 
+             input_shape=input_shape, 
+             return_sequences=False), # return_sequences=False porque solo queremos una salida final
+        
+        # Capa de Regularización para evitar el sobreajuste (overfitting)
+        Dropout(0.2), 
+        
+        # Capa Densa (Feed-Forward)
+        Dense(units=32, activation='relu'),
+        
+        # Capa de Salida: 2 Neuronas para Temp y Lluvia
+        Dense(units=N_OUTPUTS, activation='linear')
+    ])
+    
+    # Compilación: Configuración del entrenamiento
+    model.compile(optimizer='adam', 
+                  loss='mean_squared_error', 
+                  metrics=['mae']) 
+    
+    print("   -> Modelo compilado. Resumen:")
+    model.summary()
+    return model
+
+# ENTRENAMIENTO DEL MODELO
+def entrenar_modelo(model, X_train, Y_train=None, X_val=None, Y_val=None):
+    """
+    Entrena con arreglos en memoria (X_train, Y_train, X_val, Y_val) o con
+    datasets de tf.data: entrenar_modelo(model, ds_entrenamiento,
+    X_val=ds_validacion).
+    """
+    print("\n3.Iniciando Entrenamiento (Esto tomará unos minutos)...")
+    
+    #EarlyStopping: Detiene el entrenamiento si el error de validación no mejora.
+    early_stop = EarlyStopping(monitor='val_loss', patience=10, verbose=1, mode='min')
+    #ModelCheckpoint: Guarda el mejor modelo que se haya visto.
+    model_checkpoint = ModelCheckpoint('mejor_modelo_clima.h5', 
+                                       monitor='val_loss', 
+                                       save_best_only=True, 
+                                       mode='min',
+                                       verbose=1)
+
+    if isinstance(X_train, tf.data.Dataset):
+        # Los lotes ya vienen armados (y barajados) por el dataset
+        historial = model.fit(
+            X_train,
+            epochs=50,
+            validation_data=X_val,
+            callbacks=[early_stop, model_checkpoint],
+            verbose=1
+        )
+        return historial
+
+    historial = model.fit(
+        X_train, Y_train,
+        epochs=50,                  
+        batch_size=TAM_LOTE,
+        validation_data=(X_val, Y_val),
+        callbacks=[early_stop, model_checkpoint],
+        verbose=1
+    )
+    
+    return historial
+
+# --- PASO 4: EVALUAR Y VISUALIZAR ---
+def evaluar_y_graficar(historial):
+    print("\n Evaluando el rendimiento...")
+    
+    # Visualizar la reducción de la pérdida (Loss)
+    plt.figure(figsize=(12, 6))
+    plt.plot(historial.history['loss'], label='Pérdida (MSE) en Entrenamiento')
+    plt.plot(historial.history['val_loss'], label='Pérdida (MSE) en Validación')
+    plt.title('Curva de Aprendizaje del Modelo LSTM')
+    plt.ylabel('Error Cuadrático Medio (MSE)')
+    plt.xlabel('Época')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+    
+    print("\n Entrenamiento finalizado.")
+    print("   El mejor modelo fue guardado como 'mejor_modelo_clima.h5'.")
+
+
+#EJECUCIÓN PRINCIPAL
+def entrenar(graficar=True, fuente="serie"):
+    """
+    Carga los datos, entrena la LSTM (guardando 'mejor_modelo_clima.h5') y,
+    si `graficar`, muestra la curva de aprendizaje. Retorna el historial.
+
+    `fuente`: "serie" arma las ventanas al vuelo con tf.data desde la serie
+    diaria; "csv" usa el Dataset_Entrenamiento_IA.csv completo en memoria.
+    """
+    # La forma de entrada es (15 días, 4 características)
+    input_shape = (VENTANA_DIAS, N_FEATURES)
+
+    if fuente == "csv":
+        X_train, Y_train, X_val, Y_val = cargar_y_formatear_datos()
+        if X_train is None:
+            return None
+        modelo = crear_modelo(input_shape)
+        historial_entrenamiento = entrenar_modelo(modelo, X_train, Y_train, X_val, Y_val)
+    else:
+        serie = cargar_serie_diaria()
+        if serie is None:
+            return None
+        ds_entrenamiento, ds_validacion = crear_datasets(serie)
+        modelo = crear_modelo(input_shape)
+        historial_entrenamiento = entrenar_modelo(modelo, ds_entrenamiento, X_val=ds_validacion)
+    
+    if graficar:
+        evaluar_y_graficar(historial_entrenamiento)
+    return historial_entrenamiento
+
+
+# Con --csv se entrena con el dataset de ventanas completo en memoria
+if __name__ == "__main__":
+    import sys
+
+    entrenar(fuente="csv" if "--csv" in sys.argv else "serie")
\ No newline at end of file
@@ -8,10 +8,9 @@ para generar una secuencia larga de predicciones (multi-step prediction) para el
 
 import pandas as pd
 import numpy as np
-from tensorflow.keras.models import load_model
-from sklearn.preprocessing import MinMaxScaler
 from datetime import timedelta, date
-from preparacion_datos import VENTANA_DIAS
+from src import instrumentacion
+from src.neural.preparacion_datos import VENTANA_DIAS
 
 # CONFIGURACIÓN DE LA PREDICCIÓN 
 DIAS_A_PREDECIR = 1094 
@@ -20,6 +19,8 @@ N_FEATURES = 4
 #HERRAMIENTAS DE PREPARACIÓN
 
 def cargar_datos_historicos_y_escalador():
+    from sklearn.preprocessing import MinMaxScaler
+
     print("Cargando datos históricos e inicializando Scaler...")
     try:
         df_historico = pd.read_csv('Reporte_Humano_Huajuapan.csv')
@@ -46,21 +47,33 @@ def cargar_datos_historicos_y_escalador():
 
 #PREDICCIÓN RECURSIVA
 
-def predecir_recursivamente(input_seq_inicial, scaler, ultima_fecha_historica):
-    print(f"Generando pronóstico recursivo para {DIAS_A_PREDECIR} días...")
+def predecir_recursivamente(input_seq_inicial, scaler, ultima_fecha_historica,
+                            modelo=None, dias=DIAS_A_PREDECIR):
+    """
+    Pronóstico recursivo de `dias` días. Si no se da `modelo` (cualquier
+    objeto con `predict(x, verbose=0)`), se carga 'mejor_modelo_clima.h5';
+    TensorFlow sólo se importa en ese caso.
+    """
+    print(f"Generando pronóstico recursivo para {dias} días...")
     
-    try:
-        modelo = load_model('mejor_modelo_clima.h5')
-    except OSError:
-        print("ERROR: No se encontró 'mejor_modelo_clima.h5'. ¡Asegúrate de entrenar el modelo primero!")
-        return None, None
+    if modelo is None:
+        from tensorflow.keras.models import load_model
+
+        try:
+            with instrumentacion.medir("pronostico.carga_modelo"):
+                modelo = load_model('mejor_modelo_clima.h5')
+        except OSError:
+            print("ERROR: No se encontró 'mejor_modelo_clima.h5'. ¡Asegúrate de entrenar el modelo primero!")
+            return None, None
         
     current_input = input_seq_inicial.copy()
     pronosticos_normalizados = []
     fechas_pronostico = []
     
-    for i in range(DIAS_A_PREDECIR):
-        prediccion_norm = modelo.predict(current_input, verbose=0)[0]
+    for i in range(dias):
+        with instrumentacion.medir("pronostico.predict"):
+            prediccion_norm = modelo.predict(current_input, verbose=0)[0]
+        instrumentacion.contar("pronostico.llamadas_predict")
         pronosticos_normalizados.append(prediccion_norm)
         
         fecha_predicha = ultima_fecha_historica + timedelta(days=i + 1)
@@ -79,7 +92,8 @@ def predecir_recursivamente(input_seq_inicial, scaler, ultima_fecha_historica):
 
 #DESNORMALIZACIÓN Y SALIDA FINAL (FILTRADO A 2026)
 
-def desnormalizar_y_guardar(pronosticos_norm, scaler, fechas):
+@instrumentacion.cronometrado("pronostico.guardado")
+def desnormalizar_y_guardar(pronosticos_norm, scaler, fechas, nombre_archivo='Pronostico_2026_IA.csv'):
     print("Desnormalizando y guardando el pronóstico...")
     
     pronosticos_desnorm = scaler.inverse_transform(pronosticos_norm)
@@ -93,20 +107,47 @@ def desnormalizar_y_guardar(pronosticos_norm, scaler, fechas):
     df_pronostico['Fecha'] = pd.to_datetime(df_pronostico['Fecha'])
     df_2026 = df_pronostico[df_pronostico['Fecha'].dt.year == 2026].reset_index(drop=True)
     
-    nombre_archivo = 'Pronostico_2026_IA.csv'
     df_2026.to_csv(nombre_archivo, index=False)
     
     print(f" ¡Pronóstico de {len(df_2026)} días generado con éxito para el año 2026!")
     print(f" El archivo '{nombre_archivo}' está listo para la Fase 3.")
     print("\nPrimeros 5 días del pronóstico de 2026:")
     print(df_2026.head())
+    return nombre_archivo
     
 #EJECUCIÓN PRINCIPAL
-if __name__ == "__main__":
+def generar_pronostico(nombre_archivo='Pronostico_2026_IA.csv', base_perfil=None):
+    """
+    Etapa completa: escalador + pronóstico recursivo + CSV de 2026.
+
+    Con `base_perfil` el pronóstico recursivo se perfila (ver src/perfilado.py).
+    Retorna la ruta del CSV, o None si faltan datos o modelo.
+    """
     input_seq_inicial, scaler_obj, ultima_fecha_historica = cargar_datos_historicos_y_escalador()
     
-    if input_seq_inicial is not None:
+    if input_seq_inicial is None:
+        return None
+
+    if base_perfil:
+        from src.perfilado import imprimir_resumen, perfilar
+
+        with perfilar(base_perfil) as info_perfil:
+            pronosticos_normalizados, fechas_pronostico = predecir_recursivamente(input_seq_inicial, scaler_obj, ultima_fecha_historica)
+        imprimir_resumen(info_perfil)
+    else:
         pronosticos_normalizados, fechas_pronostico = predecir_recursivamente(input_seq_inicial, scaler_obj, ultima_fecha_historica)
-        
-        if pronosticos_normalizados is not None:
-            desnormalizar_y_guardar(pronosticos_normalizados, scaler_obj, fechas_pronostico)
\ No newline at end of file
+    
+    if pronosticos_normalizados is None:
+        return None
+    return desnormalizar_y_guardar(pronosticos_normalizados, scaler_obj, fechas_pronostico, nombre_archivo)
+
+
+# Con --profile [BASE] el pronóstico recursivo se perfila
+if __name__ == "__main__":
+    import sys
+
+    base_perfil = None
+    if "--profile" in sys.argv:
+        siguiente = sys.argv[sys.argv.index("--profile") + 1:][:1]
+        base_perfil = siguiente[0] if siguiente else "perfil_pronostico"
+    generar_pronostico(base_perfil=base_perfil)
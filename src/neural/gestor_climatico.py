@@ -0,0 +1,155 @@
+"""
+Módulo Gestor Climático.
+
+Responsable de cargar y proporcionar los datos climáticos pronosticados
+para el año 2026 desde un archivo CSV.
+"""
+
+import numpy as np
+import pandas as pd
+import os
+
+from src import instrumentacion
+
+# --- Carga de Datos Climáticos ---
+# Construcción de la ruta al archivo CSV para asegurar que funcione en cualquier sistema.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+CSV_PATH = os.path.join(BASE_DIR, 'data', 'processed', 'Pronostico_2026_IA.csv')
+
+# Mapeo de los nombres de columna del CSV a nombres estandarizados ('temp', 'lluvia')
+# para uso interno en el sistema. Esto desacopla el código de los nombres
+# específicos del archivo CSV.
+NOMBRES_COLUMNAS = {
+    'Temperatura_Predicha': 'temp',
+    'Lluvia_Predicha': 'lluvia'
+}
+
+# Formato binario del pronóstico: un registro por día, legible por bloques
+# con np.load(..., mmap_mode='r') sin cargar el archivo completo.
+DTYPE_PRONOSTICO = np.dtype([
+    ('fecha', 'datetime64[D]'),
+    ('temp', 'float32'),
+    ('lluvia', 'float32'),
+])
+
+print(f"Cargando clima desde: {CSV_PATH}")
+
+try:
+    # Carga del archivo CSV que contiene el pronóstico del clima.
+    with instrumentacion.medir("clima.carga_csv"):
+        df_clima = pd.read_csv(CSV_PATH)
+        # Rellena cualquier valor faltante (NaN) con 0 para evitar errores.
+        df_clima = df_clima.fillna(0)
+
+        df_clima = df_clima.rename(columns=NOMBRES_COLUMNAS)
+
+except Exception as e:
+    # En caso de error al leer el archivo, se crea un DataFrame vacío
+    # y se notifica al usuario para que el programa no se detenga abruptamente.
+    print(f"ERROR LEYENDO CSV: {e}")
+    df_clima = pd.DataFrame()
+
+
+def obtener_clima_real(dia_inicio, duracion_cultivo=120):
+    """
+    Obtiene una porción del pronóstico climático para un ciclo de cultivo.
+
+    Args:
+        dia_inicio (int): El día del año en que comienza el ciclo (1-365).
+        duracion_cultivo (int): La duración en días del ciclo de cultivo.
+
+    Returns:
+        list: Una lista de diccionarios, donde cada diccionario representa
+              un día con sus valores de 'temp' y 'lluvia'. Retorna una
+              lista vacía si los datos no están disponibles o hay un error.
+    """
+    if df_clima.empty:
+        return []
+    instrumentacion.contar("clima.ventanas")
+
+    # Calcula los índices de inicio y fin para extraer los datos del DataFrame.
+    idx_inicio = max(0, int(dia_inicio) - 1)
+    idx_fin = idx_inicio + duracion_cultivo
+    datos = df_clima.iloc[idx_inicio : idx_fin]
+
+    try:
+        # Convierte el sub-DataFrame a una lista de diccionarios para un acceso más fácil.
+        resultado = datos[['temp', 'lluvia']].to_dict('records')
+    except KeyError:
+        # Si las columnas 'temp' o 'lluvia' no existen después del renombrado, retorna vacío.
+        return []
+
+    return resultado
+
+
+def iterar_pronostico(ruta=CSV_PATH, tam_bloque=4096):
+    """
+    Lee un pronóstico por bloques, sin materializarlo completo en memoria.
+
+    Acepta el CSV del Módulo 1 (columnas Fecha, Temperatura_Predicha,
+    Lluvia_Predicha) o un archivo binario .npy con DTYPE_PRONOSTICO
+    (ver guardar_pronostico_binario), que se recorre con memmap.
+
+    Args:
+        ruta (str): Ruta al archivo .csv o .npy.
+        tam_bloque (int): Número de días por bloque.
+
+    Yields:
+        tuple: (fechas, temps, lluvias) como arreglos NumPy. `fechas` es
+               datetime64[D] o None si el CSV no trae columna 'Fecha'.
+    """
+    if ruta.endswith('.npy'):
+        datos = np.load(ruta, mmap_mode='r')
+        for inicio in range(0, len(datos), tam_bloque):
+            bloque = datos[inicio:inicio + tam_bloque]
+            instrumentacion.contar("clima.bloques")
+            yield (np.asarray(bloque['fecha']),
+                   np.asarray(bloque['temp'], dtype=float),
+                   np.asarray(bloque['lluvia'], dtype=float))
+        return
+
+    for df in pd.read_csv(ruta, chunksize=tam_bloque):
+        # Mismo tratamiento que la carga completa: NaN -> 0 y nombres internos
+        df = df.fillna(0).rename(columns=NOMBRES_COLUMNAS)
+        instrumentacion.contar("clima.bloques")
+        fechas = None
+        if 'Fecha' in df.columns:
+            fechas = pd.to_datetime(df['Fecha']).to_numpy().astype('datetime64[D]')
+        yield (fechas,
+               df['temp'].to_numpy(dtype=float),
+               df['lluvia'].to_numpy(dtype=float))
+
+
+def guardar_pronostico_binario(ruta_csv, ruta_npy, tam_bloque=4096):
+    """
+    Convierte un pronóstico CSV al formato binario DTYPE_PRONOSTICO (.npy).
+
+    La conversión también es por bloques: primero se cuentan los días con el
+    mismo lector que después llena el memmap (así las líneas en blanco o las
+    filas que el lector descarta no dejan registros vacíos al final), y la
+    memoria no crece con el horizonte.
+
+    Returns:
+        int: Número de días escritos.
+    """
+    n_dias = sum(len(temps) for _, temps, _ in iterar_pronostico(ruta_csv, tam_bloque))
+
+    destino = np.lib.format.open_memmap(ruta_npy, mode='w+',
+                                        dtype=DTYPE_PRONOSTICO, shape=(n_dias,))
+    inicio = 0
+    for fechas, temps, lluvias in iterar_pronostico(ruta_csv, tam_bloque):
+        fin = inicio + len(temps)
+        if fin > n_dias:
+            break
+        # Sin columna 'Fecha' quedan NaT, no 1970-01-01
+        destino['fecha'][inicio:fin] = np.datetime64('NaT') if fechas is None else fechas
+        destino['temp'][inicio:fin] = temps
+        destino['lluvia'][inicio:fin] = lluvias
+        inicio = fin
+
+    destino.flush()
+    del destino
+    if inicio != n_dias:
+        raise ValueError(f"❌ {ruta_csv} cambió durante la conversión: se contaron "
+                         f"{n_dias} días y se leyeron {inicio}")
+    return inicio
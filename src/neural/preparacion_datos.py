@@ -10,7 +10,6 @@ deslizantes (Sliding Window) necesario para entrenar una Red Neuronal Recurrente
 import requests
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
 
 # --- CONFIGURACIÓN (Aquí se agregan las coordenadas deseadas Huajuapan) ---
 LAT = 17.8058   # Coordenadas de Huajuapan de León
@@ -19,6 +18,12 @@ START_DATE = "20050101" # Desde el 1 de Enero de 2005
 END_DATE = "20240101"   # Hasta el 1 de Enero de 2024
 VENTANA_DIAS = 15       # Cuántos días atrás mirará la IA para predecir
 
+# Serie diaria compacta (días × 4, float32) de la que el entrenamiento arma
+# las ventanas al vuelo; ocupa ~15 veces menos que el CSV de ventanas.
+SERIE_DIARIA = 'Serie_Diaria_IA.npy'
+COLUMNAS_SERIE = ['Temp_Norm', 'Lluvia_Norm', 'Dia_Sin', 'Dia_Cos']
+FRACCION_ENTRENAMIENTO = 0.8  # Primeras ventanas de cada serie para entrenar; el resto valida
+
 # --- PASO 1: EL MENSAJERO ---
 def descargar_datos():
     print("1. Conectando con satélites de NASA POWER...")
@@ -66,6 +71,8 @@ def descargar_datos():
 
 # --- PASO 2: EL LIMPIADOR Y TRADUCTOR (Procesamiento) ---
 def procesar_datos(df):
+    from sklearn.preprocessing import MinMaxScaler
+
     print("2. Limpiando y Normalizando...")
     
     # A. Limpieza: Si hay un -999 (error), se pone el valor del día anterior
@@ -88,8 +95,7 @@ def crear_dataset_ia(df, ventana):
     datos_x = []
     
     # Usamos: Temperatura, Lluvia y la Fecha (Seno/Coseno) como entrada
-    columnas_input = ['Temp_Norm', 'Lluvia_Norm', 'Dia_Sin', 'Dia_Cos']
-    vals_input = df[columnas_input].values
+    vals_input = df[COLUMNAS_SERIE].values
     vals_target = df[['Temp_Norm', 'Lluvia_Norm']].values # Lo que queremos predecir
     
     for i in range(len(vals_input) - ventana):
@@ -112,24 +118,63 @@ def crear_dataset_ia(df, ventana):
     
     return pd.DataFrame(datos_x, columns=cols)
 
+def indices_ventanas(longitudes, ventana=VENTANA_DIAS, fraccion=FRACCION_ENTRENAMIENTO):
+    """
+    Índices de inicio de ventana (sobre las series concatenadas) para
+    entrenamiento y validación.
+
+    Cada serie (un sitio) aporta sus ventanas sin cruzar a la siguiente, y
+    se parte en el tiempo: el primer `fraccion` de sus ventanas va a
+    entrenamiento y el resto a validación (igual que el 80/20 del CSV).
+    """
+    entrenamiento, validacion = [], []
+    desplazamiento = 0
+    for longitud in longitudes:
+        inicios = desplazamiento + np.arange(max(longitud - ventana, 0))
+        corte = int(len(inicios) * fraccion)
+        entrenamiento.append(inicios[:corte])
+        validacion.append(inicios[corte:])
+        desplazamiento += longitud
+    return np.concatenate(entrenamiento), np.concatenate(validacion)
+
+def guardar_serie_diaria(df, ruta=SERIE_DIARIA):
+    """Guarda las características normalizadas de cada día (sin ventanas) en .npy."""
+    np.save(ruta, df[COLUMNAS_SERIE].to_numpy(dtype=np.float32))
+    return ruta
+
 # --- EJECUCIÓN ------
-if __name__ == "__main__":
+def preparar_datos():
+    """
+    Descarga, limpia y guarda el reporte humano y el dataset de entrenamiento
+    en el directorio actual. Retorna el dataset, o None si falló la descarga.
+    """
     # 1. Ejecutar extracción
     datos = descargar_datos()
     
-    if datos is not None:
-        # 2. Ejecutar limpieza
-        datos_listos = procesar_datos(datos)
-        
-        # Guardamos un archivo "Humano" para que tú lo revises en Excel
-        datos_listos[['Fecha', 'Temperatura', 'Lluvia', 'Dia_Anio']].to_csv('Reporte_Humano_Huajuapan.csv', index=False)
-        print(" Archivo 'Reporte_Humano_Huajuapan.csv' creado (para ver en Excel).")
+    if datos is None:
+        return None
 
-        # 3. Crear formato para la Red Neuronal
-        dataset_ia = crear_dataset_ia(datos_listos, ventana=VENTANA_DIAS)
-        
-        # Guardamos el archivo "Máquina" para tus compañeros
-        dataset_ia.to_csv('Dataset_Entrenamiento_IA.csv', index=False)
-        print(f" Archivo 'Dataset_Entrenamiento_IA.csv' creado con éxito.")
-        print(f"   -> Tiene {len(dataset_ia)} ejemplos de entrenamiento.")
-        print(f"   -> Cada ejemplo usa {VENTANA_DIAS} días de historia para predecir el siguiente.")
+    # 2. Ejecutar limpieza
+    datos_listos = procesar_datos(datos)
+    
+    # Guardamos un archivo "Humano" para que tú lo revises en Excel
+    datos_listos[['Fecha', 'Temperatura', 'Lluvia', 'Dia_Anio']].to_csv('Reporte_Humano_Huajuapan.csv', index=False)
+    print(" Archivo 'Reporte_Humano_Huajuapan.csv' creado (para ver en Excel).")
+
+    # Serie diaria compacta para el entrenamiento con tf.data
+    guardar_serie_diaria(datos_listos)
+    print(f" Archivo '{SERIE_DIARIA}' creado ({len(datos_listos)} días).")
+
+    # 3. Crear formato para la Red Neuronal
+    dataset_ia = crear_dataset_ia(datos_listos, ventana=VENTANA_DIAS)
+    
+    # Guardamos el archivo "Máquina" para tus compañeros
+    dataset_ia.to_csv('Dataset_Entrenamiento_IA.csv', index=False)
+    print(f" Archivo 'Dataset_Entrenamiento_IA.csv' creado con éxito.")
+    print(f"   -> Tiene {len(dataset_ia)} ejemplos de entrenamiento.")
+    print(f"   -> Cada ejemplo usa {VENTANA_DIAS} días de historia para predecir el siguiente.")
+    return dataset_ia
+
+
+if __name__ == "__main__":
+    preparar_datos()
@@ -0,0 +1,290 @@
+# Archivo: src/optimization/algoritmo_genetico.py
+import pygad
+import numpy as np
+import os
+import sys
+
+# Agregamos la ruta del proyecto
+ruta_proyecto = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(ruta_proyecto)
+
+from src import instrumentacion
+from src.optimization.arranque import resolver_poblacion
+from src.optimization.convergencia import CriterioParada
+from src.optimization.espacio_decision import EspacioDecision
+from src.optimization.motor_puntuacion import obtener_motor, PENALIZACION
+from src.optimization.perfiles_cultivo import obtener_perfil
+from src.optimization.resultado import RegistroCorrida
+
+
+def crear_fitness_func(perfil=None, motor=None):
+    """
+    Construye la Función de Aptitud (Fitness) para un perfil de cultivo.
+    Evalúa qué tan buena es una fecha de siembra consultando la tabla
+    precalculada del motor de puntuación (una sola pasada difusa + sumas prefijo).
+    """
+    perfil = obtener_perfil(perfil)
+    tabla = (motor or obtener_motor()).puntuar_perfil(perfil)
+
+    def fitness_func(ga_instance, solution, solution_idx):
+        dia_siembra = int(solution[0])
+
+        # 1. RESTRICCIONES (Vallas de Seguridad)
+        # El último día de siembra del perfil asegura cosecha antes de fin de año
+        if dia_siembra < 1 or dia_siembra > perfil.ultimo_dia_siembra:
+            return PENALIZACION
+
+        # 2. APTITUD DEL CICLO (suma de la aptitud difusa diaria, ya precalculada)
+        return tabla[dia_siembra - 1]
+
+    return fitness_func
+
+
+def crear_ga(espacio, criterio=None, registro=None, **opciones):
+    """
+    Configura el AG sobre un espacio de decisión (ver espacio_decision.py).
+    Con `criterio` (CriterioParada) la corrida se detiene en cuanto se cumple
+    alguno de sus motivos de paro; `registro` (RegistroCorrida) acumula el
+    historial y las evaluaciones. `opciones` sobrescribe parámetros de
+    pygad.GA (p. ej. num_generations, initial_population, random_seed).
+    """
+    registro = registro or RegistroCorrida()
+
+    def fitness_lote(ga_instance, soluciones, indices):
+        # Toda la población se evalúa con una consulta vectorizada a la tabla
+        registro.registrar(soluciones)
+        return espacio.evaluar(soluciones)
+
+    def al_terminar_generacion(ga_instance):
+        registro.cerrar_generacion(ga_instance.last_generation_fitness)
+        if criterio is not None and criterio.actualizar(registro.mejor[-1], ga_instance.population,
+                                                        registro.evaluaciones):
+            return "stop"
+
+    parametros = dict(
+        num_generations=50,       # Número de generaciones
+        num_parents_mating=5,     # Padres para cruza
+        fitness_func=fitness_lote,
+        fitness_batch_size=20,    # Una llamada por población
+        sol_per_pop=20,           # Individuos por población
+        num_genes=espacio.num_genes,  # Día de siembra (+ perfil, + segunda siembra)
+        gene_type=int,            # Todos los genes son enteros
+        
+        # Rango de búsqueda (del 1 de enero al último día de siembra permitido)
+        init_range_low=1,
+        init_range_high=espacio.dia_maximo,
+        
+        # Restricción estricta (Gen Space)
+        gene_space=espacio.gene_space(),
+        
+        mutation_num_genes=1,
+        on_generation=al_terminar_generacion,
+        # random_seed=42  # Descomenta si quieres resultados fijos
+    )
+    if criterio is not None:
+        criterio.iniciar()
+    parametros.update(opciones)
+    if 'initial_population' in opciones:
+        parametros['fitness_batch_size'] = len(opciones['initial_population'])
+    return pygad.GA(**parametros)
+
+
+def _ejecutar_ga(espacio, criterio=None, poblacion=None, semillas=(), picos=0, registro=None,
+                 semilla=None):
+    """
+    Corre el AG sobre un espacio de decisión, opcionalmente con arranque en
+    caliente (ver arranque.py). Retorna (mejor_solucion, aptitud, ga_instance).
+    """
+    opciones = {} if semilla is None else {'random_seed': semilla}
+    inicial = resolver_poblacion(espacio, 20, poblacion, semillas, picos, semilla)
+    if inicial is not None:
+        opciones['initial_population'] = inicial
+    ga_instance = crear_ga(espacio, criterio, registro, **opciones)
+
+    # Ejecutar
+    ga_instance.run()
+
+    solution, solution_fitness, solution_idx = ga_instance.best_solution()
+    return solution, solution_fitness, ga_instance
+
+
+@instrumentacion.cronometrado("ag.optimizacion")
+def optimizar(perfil=None, criterio=None, semillas=(), picos=0, poblacion=None,
+              con_paisaje=False, motor=None, semilla=None):
+    """
+    Modo sin interfaz (headless): optimiza el día de siembra de un perfil sin
+    imprimir ni graficar. `criterio` (CriterioParada) controla el paro
+    temprano; por defecto se detiene tras 10 generaciones sin mejora o si la
+    población colapsa. Para correr siempre las 50 generaciones usa
+    CriterioParada(paciencia=None, diversidad_minima=None).
+
+    Arranque en caliente: `semillas` (días conocidos: óptimo previo, sitio
+    vecino), `picos` (top-k del barrido grueso del paisaje) o una
+    `poblacion` inicial explícita de 20 individuos.
+
+    Con `con_paisaje` el resultado incluye el fitness de todos los días de
+    siembra (ya calculado en el motor, no cuesta otra pasada). `motor`
+    permite optimizar sobre otro pronóstico (default: el global) y
+    `semilla` fija el generador aleatorio de PyGAD.
+
+    Returns:
+        ResultadoOptimizacion
+    """
+    perfil = obtener_perfil(perfil)
+    criterio = criterio or CriterioParada()
+    registro = RegistroCorrida()
+    espacio = EspacioDecision([perfil], motor=motor)
+
+    solution, solution_fitness, _ = _ejecutar_ga(espacio, criterio, poblacion, semillas, picos,
+                                                 registro, semilla)
+    instrumentacion.contar("ag.evaluaciones", registro.evaluaciones)
+    return registro.resultado("AG", perfil.nombre, int(solution[0]), solution_fitness,
+                              criterio.motivo, espacio.tabla[0].copy() if con_paisaje else None)
+
+
+def correr_optimizacion(perfil=None, criterio=None, semillas=(), picos=0, poblacion=None,
+                        graficar=True, con_paisaje=False):
+    """
+    Optimiza (ver `optimizar`), imprime el reporte y, si `graficar`, guarda
+    la curva de evolución en convergencia_ag.png (sin abrir ventanas).
+
+    Returns:
+        ResultadoOptimizacion: Mejor día, aptitud, historial, evaluaciones...
+    """
+    perfil = obtener_perfil(perfil)
+    print("\n--- INICIANDO ALGORITMO GENÉTICO (PyGAD) ---")
+    print(f"Perfil de cultivo: {perfil.nombre} ({perfil.duracion} días)")
+    
+    # Ejecutar y obtener resultados (problema de un solo gen: el día)
+    criterio = criterio or CriterioParada()
+    resultado = optimizar(perfil, criterio, semillas, picos, poblacion, con_paisaje)
+    
+    print("-" * 50)
+    print(" Optimización Completada (Algoritmo Genético)")
+    print(f" Mejor día encontrado: {resultado.mejor_dia}")
+    print(f" Aptitud alcanzada: {resultado.aptitud:.2f}")
+    print(f" Motivo de paro: {criterio.resumen()}")
+    print(f" Tiempo: {resultado.tiempo:.3f} s | evaluaciones repetidas: {resultado.fraccion_repetidas:.0%}")
+    print("-" * 50)
+
+    # Gráfica de evolución (paso opcional, lienzo Agg)
+    if graficar:
+        from src.optimization.graficas import graficar_convergencia
+
+        ruta = graficar_convergencia(resultado, os.path.join(ruta_proyecto, 'convergencia_ag.png'))
+        print(f"✅ Gráfica de evolución guardada en: {ruta}")
+    
+    return resultado
+
+
+def correr_optimizacion_perfiles(perfiles, criterio=None, semillas=None, picos=0):
+    """
+    Optimiza varios perfiles de cultivo reutilizando el mismo vector de
+    aptitud diaria, con paro temprano en cada corrida.
+
+    `semillas` ({nombre_perfil: días}) permite re-optimizar partiendo de los
+    óptimos previos, p. ej. el resultado de una corrida anterior.
+    Retorna {nombre_perfil: ResultadoOptimizacion}.
+    """
+    semillas = semillas or {}
+    resultados = {}
+    for perfil in perfiles:
+        perfil = obtener_perfil(perfil)
+        previas = np.atleast_1d(semillas.get(perfil.nombre, []))
+        resultado = optimizar(perfil, criterio, semillas=previas, picos=picos)
+        print(f" {perfil.nombre}: día {resultado.mejor_dia} (aptitud {resultado.aptitud:.2f})"
+              f" | paro: {resultado.motivo_paro} ({resultado.evaluaciones} evaluaciones)")
+        resultados[perfil.nombre] = resultado
+    return resultados
+
+
+def correr_optimizacion_genes(perfiles, segunda_siembra=False, fraccion_segunda=0.5,
+                              separacion_minima=15, criterio=None, semillas=(), picos=0):
+    """
+    AG con cromosoma de varios genes: día de siembra, perfil de cultivo
+    (variedad) y, opcionalmente, una segunda siembra escalonada.
+
+    `semillas` acepta días o cromosomas completos y `picos` agrega el top-k
+    del barrido grueso del paisaje (ver arranque.py).
+
+    Retorna el cromosoma decodificado:
+    {"dia_siembra", "perfil", "dia_segunda_siembra", "aptitud", "motivo_paro"}.
+    """
+    criterio = criterio or CriterioParada()
+    espacio = EspacioDecision(perfiles, segunda_siembra=segunda_siembra,
+                              fraccion_segunda=fraccion_segunda,
+                              separacion_minima=separacion_minima)
+
+    print("\n--- INICIANDO ALGORITMO GENÉTICO MULTI-GEN (PyGAD) ---")
+    print(f"Perfiles candidatos: {', '.join(espacio.nombres)}")
+    print(f"Genes por cromosoma: {espacio.num_genes}")
+
+    solution, solution_fitness, _ = _ejecutar_ga(espacio, criterio, semillas=semillas, picos=picos)
+    resultado = espacio.decodificar(solution)
+    resultado["aptitud"] = float(solution_fitness)
+    resultado["motivo_paro"] = criterio.motivo
+
+    print("-" * 50)
+    print(" Optimización Completada (Algoritmo Genético Multi-Gen)")
+    print(f" Perfil: {resultado['perfil']}")
+    print(f" Día de siembra: {resultado['dia_siembra']}")
+    if resultado["dia_segunda_siembra"] is not None:
+        print(f" Segunda siembra: día {resultado['dia_segunda_siembra']}")
+    print(f" Aptitud alcanzada: {solution_fitness:.2f}")
+    print(f" Motivo de paro: {criterio.resumen()}")
+    print("-" * 50)
+
+    return resultado
+
+
+def correr_optimizacion_multiobjetivo(perfil=None, umbral_seco=1.0, dia_limite_cosecha=365):
+    """
+    AG multiobjetivo (NSGA-II de PyGAD): aptitud total vs. días MALO vs.
+    racha seca vs. retraso de cosecha (ver multiobjetivo.py).
+
+    Toda la población se evalúa en una sola llamada vectorizada a la tabla de
+    objetivos. Retorna el frente de Pareto de los días evaluados:
+    {"dias": ..., "objetivos": ..., "nombres": OBJETIVOS}.
+    """
+    from src.optimization.multiobjetivo import ProblemaMultiobjetivo, SENTIDOS
+
+    perfil = obtener_perfil(perfil)
+    problema = ProblemaMultiobjetivo(perfil, umbral_seco=umbral_seco,
+                                     dia_limite_cosecha=dia_limite_cosecha)
+    evaluados = set()
+
+    def fitness_lote(ga_instance, soluciones, indices):
+        dias = np.asarray(soluciones)[:, 0].astype(int)
+        evaluados.update(dias.tolist())
+        # PyGAD maximiza todos los objetivos: invertimos los que se minimizan
+        return problema.evaluar(dias) * SENTIDOS
+
+    print("\n--- INICIANDO ALGORITMO GENÉTICO MULTIOBJETIVO (NSGA-II) ---")
+    print(f"Perfil de cultivo: {perfil.nombre} ({perfil.duracion} días)")
+
+    ga_instance = pygad.GA(
+        num_generations=50,
+        num_parents_mating=5,
+        fitness_func=fitness_lote,
+        fitness_batch_size=20,    # Toda la población en una llamada
+        sol_per_pop=20,
+        num_genes=1,
+        gene_type=int,
+        init_range_low=1,
+        init_range_high=perfil.ultimo_dia_siembra,
+        gene_space={'low': 1, 'high': perfil.ultimo_dia_siembra},
+        parent_selection_type='nsga2',
+        mutation_num_genes=1,
+    )
+    ga_instance.run()
+
+    frente = problema.frente(sorted(evaluados))
+
+    print("-" * 50)
+    print(" Frente de Pareto (Algoritmo Genético Multiobjetivo)")
+    print(f" {'Día':>5} | " + " | ".join(frente["nombres"]))
+    for dia, objetivos in zip(frente["dias"], frente["objetivos"]):
+        print(f" {dia:>5} | " + " | ".join(f"{v:.2f}" for v in objetivos))
+    print("-" * 50)
+
+    return frente
@@ -0,0 +1,247 @@
+"""
+Módulo de Optimización con Enjambre de Partículas (PSO).
+
+Este script implementa el algoritmo PSO utilizando la librería Mealpy (v3)
+para encontrar la fecha óptima de siembra. Maximiza una función de aptitud
+basada en datos climáticos históricos y lógica difusa.
+"""
+
+import os
+import sys
+
+# ✔ PEP 8: Importaciones de terceros agrupadas
+import numpy as np
+from mealpy import PSO, FloatVar
+from mealpy.utils.termination import Termination
+
+# --- CONFIGURACIÓN DE RUTAS ---
+# Se agrega el directorio padre al path para permitir importaciones locales
+# independientemente de desde dónde se ejecute el script.
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(os.path.dirname(current_dir))
+sys.path.append(parent_dir)
+
+# ✔ PEP 8: Importaciones locales al final
+from src import instrumentacion
+from src.optimization.arranque import resolver_poblacion
+from src.optimization.convergencia import CriterioParada
+from src.optimization.espacio_decision import EspacioDecision
+from src.optimization.motor_puntuacion import obtener_motor, PENALIZACION
+from src.optimization.perfiles_cultivo import obtener_perfil
+from src.optimization.resultado import RegistroCorrida
+
+
+def crear_funcion_objetivo(perfil=None, motor=None):
+    """
+    Construye la función objetivo del PSO para un perfil de cultivo.
+
+    La aptitud de cada día del pronóstico se calcula una sola vez en el motor
+    de puntuación; aquí sólo se consulta la tabla (día de siembra → fitness).
+
+    Args:
+        perfil (PerfilCultivo | str | None): Perfil a optimizar (default: maíz 120 días).
+        motor (MotorPuntuacion | None): Motor a usar (default: el global).
+
+    Returns:
+        callable: funcion_objetivo(solution) -> float.
+    """
+    perfil = obtener_perfil(perfil)
+    tabla = (motor or obtener_motor()).puntuar_perfil(perfil)
+
+    def funcion_objetivo(solution):
+        # PSO trabaja con flotantes, convertimos a entero para representar días
+        dia_siembra = int(solution[0])
+
+        # --- 1. VALIDACIÓN DE RESTRICCIONES (PENALIZACIÓN) ---
+        # Si el día está fuera del rango lógico de siembra del perfil
+        if dia_siembra < 1 or dia_siembra > perfil.ultimo_dia_siembra:
+            return PENALIZACION
+
+        # --- 2. APTITUD PRECALCULADA (sumas prefijo de la aptitud difusa) ---
+        return float(tabla[dia_siembra - 1])
+
+    return funcion_objetivo
+
+
+class TerminacionCriterio(Termination):
+    """
+    Adapta un CriterioParada a la interfaz de terminación de Mealpy.
+
+    Mealpy sólo sabe parar por épocas, evaluaciones, tiempo o estancamiento;
+    este adaptador además mide la diversidad del enjambre, deja registrado
+    el motivo de paro en el criterio y, al final de cada época, alimenta el
+    RegistroCorrida (mejor y media del enjambre).
+    """
+
+    def __init__(self, criterio, modelo, registro):
+        super().__init__(max_epoch=modelo.epoch, log_to=None)
+        self.criterio = criterio
+        self.modelo = modelo
+        self.registro = registro
+
+    def should_terminate(self, current_epoch, current_fe, current_time, current_threshold):
+        self.registro.cerrar_generacion([agente.target.fitness for agente in self.modelo.pop])
+        motivo = None
+        if self.criterio is not None:
+            posiciones = [agente.solution for agente in self.modelo.pop]
+            motivo = self.criterio.actualizar(self.modelo.g_best.target.fitness,
+                                              posiciones, self.registro.evaluaciones)
+        if motivo is None:
+            return super().should_terminate(current_epoch, current_fe,
+                                            current_time, current_threshold)
+        self.message = f"Paro temprano: {self.criterio.resumen()}"
+        return True
+
+
+def _ejecutar_pso(perfil, log_to="console", criterio=None, poblacion=None,
+                 semillas=(), picos=0, registro=None, motor=None, semilla=None):
+    """
+    Configura y corre el PSO para un perfil, opcionalmente con posiciones
+    iniciales sembradas (ver arranque.py). Retorna (mejor_dia, fitness, model).
+    """
+    registro = registro or RegistroCorrida()
+    objetivo = crear_funcion_objetivo(perfil, motor)
+
+    def objetivo_registrado(solution):
+        registro.registrar([solution])
+        return objetivo(solution)
+
+    # Definimos los límites usando FloatVar (Requerido por Mealpy v3)
+    limites = FloatVar(lb=[1], ub=[perfil.ultimo_dia_siembra], name="dia_siembra")
+
+    # --- A. DEFINICIÓN DEL PROBLEMA ---
+    problem_dict = {
+        "obj_func": objetivo_registrado,
+        "bounds": limites,
+        "minmax": "max",      # Buscamos maximizar la aptitud
+        "log_to": log_to,     # Imprimir progreso en consola
+    }
+
+    # --- B. CONFIGURACIÓN DEL MODELO ---
+    # epoch: Número de iteraciones (generaciones)
+    # pop_size: Número de partículas (agentes) buscando simultáneamente
+    model = PSO.OriginalPSO(epoch=50, pop_size=20)
+
+    # --- C. EJECUCIÓN ---
+    # solve() devuelve el mejor agente encontrado (con paro temprano si hay criterio)
+    if criterio is not None:
+        criterio.iniciar()
+    terminacion = TerminacionCriterio(criterio, model, registro)
+    iniciales = resolver_poblacion(EspacioDecision([perfil], motor=motor), model.pop_size,
+                                   poblacion, semillas, picos, semilla)
+    if iniciales is not None:
+        iniciales = iniciales.astype(float)
+    best_agent = model.solve(problem_dict, termination=terminacion,
+                             starting_solutions=iniciales, seed=semilla)
+
+    return int(best_agent.solution[0]), best_agent.target.fitness, model
+
+
+@instrumentacion.cronometrado("pso.optimizacion")
+def optimizar(perfil=None, criterio=None, semillas=(), picos=0, poblacion=None, log_to=None,
+              con_paisaje=False, motor=None, semilla=None):
+    """
+    Modo sin interfaz (headless): corre el PSO sin graficar (y, por defecto,
+    sin imprimir progreso) y regresa un ResultadoOptimizacion.
+
+    Args:
+        perfil (PerfilCultivo | str | None): Perfil de cultivo (default: maíz 120 días).
+        criterio (CriterioParada | None): Paro temprano (default: 10 épocas
+            sin mejora o enjambre colapsado).
+        semillas (iterable): Días conocidos para sembrar el enjambre (óptimo
+            previo, resultado de un sitio vecino).
+        picos (int): Top-k del barrido grueso del paisaje a usar como semillas.
+        poblacion (array | None): Posiciones iniciales explícitas (20 × 1).
+        log_to (str | None): Destino del registro de Mealpy ("console" o None).
+        con_paisaje (bool): Incluir el fitness de todos los días de siembra
+            (tabla ya calculada por el motor de puntuación).
+        motor (MotorPuntuacion | None): Pronóstico a usar (default: el global).
+        semilla (int | None): Semilla del generador aleatorio de Mealpy.
+
+    Returns:
+        ResultadoOptimizacion
+    """
+    perfil = obtener_perfil(perfil)
+    criterio = criterio or CriterioParada()
+    registro = RegistroCorrida()
+
+    mejor_dia, fitness_alcanzado, _ = _ejecutar_pso(perfil, log_to=log_to, criterio=criterio,
+                                                    poblacion=poblacion, semillas=semillas,
+                                                    picos=picos, registro=registro,
+                                                    motor=motor, semilla=semilla)
+    instrumentacion.contar("pso.evaluaciones", registro.evaluaciones)
+    motor = motor or obtener_motor()
+    paisaje = motor.puntuar_perfil(perfil).copy() if con_paisaje else None
+    return registro.resultado("PSO", perfil.nombre, mejor_dia, fitness_alcanzado,
+                              criterio.motivo, paisaje)
+
+
+def correr_optimizacion(perfil=None, criterio=None, semillas=(), picos=0, poblacion=None,
+                        graficar=True, con_paisaje=False):
+    """
+    Configura y ejecuta la optimización por Enjambre de Partículas (PSO).
+
+    Corre `optimizar`, imprime el reporte y, si `graficar`, guarda la
+    gráfica de convergencia en convergencia_pso.png con el lienzo Agg (sin
+    abrir ventanas ni bloquear).
+
+    Args:
+        perfil, criterio, semillas, picos, poblacion, con_paisaje: Ver `optimizar`.
+        graficar (bool): Guardar la gráfica de convergencia.
+
+    Returns:
+        ResultadoOptimizacion: Mejor día, aptitud, historial, evaluaciones...
+    """
+    perfil = obtener_perfil(perfil)
+    print("\n--- INICIANDO OPTIMIZACIÓN CON ENJAMBRE DE PARTÍCULAS (PSO) ---")
+    print("Mecanismo: Mealpy Library (v3)")
+    print(f"Perfil de cultivo: {perfil.nombre} ({perfil.duracion} días)")
+
+    criterio = criterio or CriterioParada()
+    resultado = optimizar(perfil, criterio, semillas, picos, poblacion, log_to="console",
+                          con_paisaje=con_paisaje)
+
+    # --- D. GRÁFICA DE CONVERGENCIA (paso opcional) ---
+    if graficar:
+        from src.optimization.graficas import graficar_convergencia
+
+        print("\n📊 Generando gráfica de convergencia...")
+        ruta_grafica = graficar_convergencia(resultado, os.path.join(parent_dir, 'convergencia_pso.png'))
+        print(f"✅ Gráfica guardada en: {ruta_grafica}")
+
+    # --- E. REPORTE FINAL ---
+    print("-" * 50)
+    print(" Optimización Completada (PSO)")
+    print(f" Mejor día encontrado: {resultado.mejor_dia}")
+    print(f" Aptitud total acumulada: {resultado.aptitud:.2f}")
+    print(f" Motivo de paro: {criterio.resumen()}")
+    print(f" Tiempo: {resultado.tiempo:.3f} s | evaluaciones repetidas: {resultado.fraccion_repetidas:.0%}")
+    print("-" * 50)
+
+    return resultado
+
+
+def correr_optimizacion_perfiles(perfiles, criterio=None, semillas=None, picos=0):
+    """
+    Optimiza varios perfiles de cultivo reutilizando el mismo vector de
+    aptitud diaria (sin gráficas y con paro temprano en cada corrida).
+
+    Args:
+        perfiles (list): Perfiles a optimizar.
+        criterio (CriterioParada | None): Paro temprano.
+        semillas (dict | None): {nombre_perfil: días} de corridas previas.
+        picos (int): Top-k del barrido grueso a usar como semillas.
+
+    Returns:
+        dict: {nombre_perfil: ResultadoOptimizacion}
+    """
+    semillas = semillas or {}
+    resultados = {}
+    for perfil in perfiles:
+        perfil = obtener_perfil(perfil)
+        previas = np.atleast_1d(semillas.get(perfil.nombre, []))
+        resultado = optimizar(perfil, criterio, semillas=previas, picos=picos)
+        print(f" {perfil.nombre}: día {resultado.mejor_dia} (aptitud {resultado.aptitud:.2f})"
+              f" | paro: {resultado.motivo_paro} ({resultado.evaluaciones} evaluaciones)")
+        resultados[perfil.nombre] = resultado
+    return resultados
@@ -0,0 +1,151 @@
+"""
+Arranque en caliente (warm start) de los optimizadores.
+
+Cada corrida empezaba con una población aleatoria en 1-240. Al re-optimizar
+tras actualizar el pronóstico, o para una parcela vecina, ya hay muy buenos
+candidatos:
+
+    - Óptimos previos (la corrida anterior de la misma parcela).
+    - El resultado de un sitio vecino.
+    - Los picos de un barrido grueso del paisaje (un día de cada `paso`,
+      consultando la tabla ya calculada del motor de puntuación).
+
+`poblacion_inicial` mezcla esas semillas, variaciones cercanas a ellas y
+algunos individuos aleatorios (para no perder exploración), y devuelve una
+matriz lista para `pygad.GA(initial_population=...)` o
+`mealpy ... solve(starting_solutions=...)`.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from src.optimization.motor_puntuacion import PENALIZACION
+
+
+def picos_paisaje(espacio, k: int = 3, paso: int = 7) -> np.ndarray:
+    """
+    Top-k de un barrido grueso del paisaje.
+
+    Args:
+        espacio (EspacioDecision): Espacio con la tabla (perfil × día).
+        k (int): Número de picos.
+        paso (int): Cada cuántos días se muestrea el paisaje.
+
+    Returns:
+        np.ndarray: Cromosomas (k × num_genes) de los mejores días muestreados
+                    (con el mejor perfil de ese día y sin segunda siembra).
+    """
+    dias = np.arange(1, espacio.dia_maximo + 1, paso)
+    # Todas las combinaciones (perfil, día muestreado) en una sola evaluación
+    n_perfiles = len(espacio.perfiles) if espacio.usa_perfil else 1
+    malla_p, malla_d = np.meshgrid(np.arange(n_perfiles), dias, indexing='ij')
+    valores = espacio.evaluar(_cromosomas(espacio, malla_d.ravel(), malla_p.ravel()))
+    valores = valores.reshape(malla_p.shape)
+
+    mejor_perfil = np.argmax(valores, axis=0)
+    mejor_valor = valores[mejor_perfil, np.arange(dias.size)]
+    orden = np.argsort(mejor_valor)[::-1]
+    orden = orden[mejor_valor[orden] != PENALIZACION][:k]
+    return _cromosomas(espacio, dias[orden], mejor_perfil[orden])
+
+
+def _cromosomas(espacio, dias, perfiles=None) -> np.ndarray:
+    """Arma cromosomas a partir de días (y perfiles) según los genes del espacio."""
+    dias = np.asarray(dias, dtype=int)
+    columnas = [dias]
+    if espacio.usa_perfil:
+        columnas.append(np.zeros_like(dias) if perfiles is None else np.asarray(perfiles, dtype=int))
+    if espacio.segunda_siembra:
+        columnas.append(np.zeros_like(dias))
+    return np.column_stack(columnas)
+
+
+def _normalizar_semillas(espacio, semillas: Iterable) -> np.ndarray:
+    """Acepta días sueltos o cromosomas completos; retorna una matriz de cromosomas."""
+    filas = []
+    for semilla in semillas:
+        semilla = np.atleast_1d(np.asarray(semilla, dtype=int))
+        if semilla.size == espacio.num_genes:
+            filas.append(semilla)
+        elif semilla.size == 1:
+            filas.append(_cromosomas(espacio, semilla)[0])
+        else:
+            raise ValueError(
+                f"❌ Semilla con {semilla.size} genes; se esperaban 1 o {espacio.num_genes}"
+            )
+    return np.array(filas, dtype=int).reshape(-1, espacio.num_genes)
+
+
+def poblacion_inicial(espacio, tam: int, semillas: Iterable = (), picos: int = 0,
+                      paso: int = 7, radio: int = 5, fraccion_aleatoria: float = 0.25,
+                      semilla_aleatoria=None) -> np.ndarray:
+    """
+    Población inicial sembrada con soluciones conocidas.
+
+    Args:
+        espacio (EspacioDecision): Espacio de decisión del optimizador.
+        tam (int): Individuos de la población.
+        semillas (iterable): Días (o cromosomas completos) conocidos: óptimos
+            previos, resultado de un sitio vecino...
+        picos (int): Cuántos picos del barrido grueso agregar como semillas.
+        paso (int): Paso (días) del barrido grueso.
+        radio (int): Máximo desplazamiento (días) de las variaciones de cada semilla.
+        fraccion_aleatoria (float): Fracción de la población que se genera al
+            azar en todo el rango (exploración).
+        semilla_aleatoria (int | None): Semilla del generador aleatorio.
+
+    Returns:
+        np.ndarray: Matriz (tam × num_genes) de enteros.
+    """
+    rng = np.random.default_rng(semilla_aleatoria)
+    base = _normalizar_semillas(espacio, semillas)
+    if picos > 0:
+        base = np.vstack([base, picos_paisaje(espacio, picos, paso)])
+    base = base[:tam]
+
+    if len(base) == 0:
+        n_aleatorios = tam
+    else:
+        n_aleatorios = min(int(round(tam * fraccion_aleatoria)), tam - len(base))
+    n_variaciones = tam - len(base) - n_aleatorios
+
+    # Variaciones: copias de las semillas con el día desplazado hasta ±radio
+    if n_variaciones:
+        variaciones = base[rng.integers(0, len(base), n_variaciones)]
+    else:
+        variaciones = np.empty((0, espacio.num_genes), dtype=int)
+    variaciones[:, 0] += rng.integers(-radio, radio + 1, len(variaciones))
+
+    limites = [(g['low'], g['high']) if isinstance(g, dict) else (min(g), max(g))
+               for g in espacio.gene_space()]
+    aleatorios = np.column_stack([rng.integers(bajo, alto + 1, n_aleatorios)
+                                  for bajo, alto in limites]).reshape(-1, espacio.num_genes)
+
+    poblacion = np.vstack([base, variaciones, aleatorios]).astype(int)
+    poblacion[:, 0] = np.clip(poblacion[:, 0], 1, espacio.dia_maximo)
+    return poblacion
+
+
+def resolver_poblacion(espacio, tam: int, poblacion=None, semillas: Iterable = (),
+                       picos: int = 0, semilla: int = None):
+    """
+    Población de arranque de un optimizador: la explícita si se da, una
+    sembrada si hay semillas o picos, o None (arranque aleatorio normal).
+    `semilla` fija el generador de las variaciones y del relleno aleatorio,
+    para que una corrida sembrada con semilla sea reproducible.
+    """
+    if poblacion is not None:
+        poblacion = np.atleast_2d(np.asarray(poblacion, dtype=int))
+        if poblacion.shape != (tam, espacio.num_genes):
+            raise ValueError(
+                f"❌ La población inicial debe ser de {tam} × {espacio.num_genes}, "
+                f"se recibió {poblacion.shape[0]} × {poblacion.shape[1]}"
+            )
+        return poblacion
+    # Los llamadores pasan listas, tuplas o arreglos de NumPy (cuyo valor de
+    # verdad es ambiguo): se normaliza antes de preguntar si hay semillas
+    semillas = [] if semillas is None else np.atleast_1d(semillas).astype(int).tolist()
+    if len(semillas) == 0 and picos <= 0:
+        return None
+    return poblacion_inicial(espacio, tam, semillas, picos, semilla_aleatoria=semilla)
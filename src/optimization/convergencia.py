@@ -0,0 +1,110 @@
+"""
+Criterios de paro temprano para los optimizadores (AG y PSO).
+
+Ambos optimizadores corrían siempre 50 generaciones/épocas, aunque el paisaje
+de un gen suele converger en unas cuantas. `CriterioParada` se consulta al
+final de cada generación y detiene la corrida por el primer motivo que se
+cumpla:
+
+    estancamiento   La mejor aptitud no mejora más de `tolerancia` en
+                    `paciencia` generaciones seguidas.
+    diversidad      La fracción de cromosomas distintos (genes enteros) en la
+                    población cae a `diversidad_minima` o menos.
+    tiempo          Se agotó el presupuesto de `tiempo_maximo` segundos.
+    evaluaciones    Se agotó el presupuesto de `max_evaluaciones` de fitness.
+
+Si ninguno se cumple, la corrida termina por "generaciones" (el máximo fijo).
+El motivo queda registrado en `criterio.motivo`.
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+
+MOTIVOS = ("estancamiento", "diversidad", "tiempo", "evaluaciones", "generaciones")
+
+
+class CriterioParada:
+    """
+    Reglas de paro temprano. Cualquier criterio en None queda desactivado.
+
+    Args:
+        paciencia (int | None): Generaciones sin mejora antes de parar.
+        tolerancia (float): Mejora mínima que cuenta como progreso.
+        diversidad_minima (float | None): Fracción (0-1) de individuos
+            distintos por debajo de la cual la población se considera colapsada.
+        tiempo_maximo (float | None): Segundos de reloj por corrida.
+        max_evaluaciones (int | None): Evaluaciones de fitness por corrida.
+    """
+
+    def __init__(self, paciencia: Optional[int] = 10, tolerancia: float = 1e-6,
+                 diversidad_minima: Optional[float] = 0.05,
+                 tiempo_maximo: Optional[float] = None,
+                 max_evaluaciones: Optional[int] = None):
+        self.paciencia = paciencia
+        self.tolerancia = tolerancia
+        self.diversidad_minima = diversidad_minima
+        self.tiempo_maximo = tiempo_maximo
+        self.max_evaluaciones = max_evaluaciones
+        self.iniciar()
+
+    def iniciar(self):
+        """Reinicia el estado para una corrida nueva."""
+        self.inicio = time.perf_counter()
+        self.mejor = -np.inf
+        self.sin_mejora = 0
+        self.generaciones = 0
+        self.evaluaciones = 0
+        self.diversidad = 1.0
+        self.motivo = "generaciones"
+
+    @staticmethod
+    def medir_diversidad(poblacion) -> float:
+        """Fracción de cromosomas distintos (tomando los genes como enteros)."""
+        poblacion = np.atleast_2d(np.asarray(poblacion)).astype(int)
+        if poblacion.shape[0] == 0:
+            return 0.0
+        return np.unique(poblacion, axis=0).shape[0] / poblacion.shape[0]
+
+    def actualizar(self, mejor_aptitud: float, poblacion=None,
+                   evaluaciones: Optional[int] = None) -> Optional[str]:
+        """
+        Registra una generación terminada.
+
+        Args:
+            mejor_aptitud (float): Mejor aptitud encontrada hasta ahora.
+            poblacion (array | None): Población actual (individuos × genes).
+            evaluaciones (int | None): Evaluaciones de fitness acumuladas.
+
+        Returns:
+            str | None: El motivo de paro, o None si la corrida debe seguir.
+        """
+        self.generaciones += 1
+        if evaluaciones is not None:
+            self.evaluaciones = int(evaluaciones)
+
+        if mejor_aptitud > self.mejor + self.tolerancia:
+            self.mejor = float(mejor_aptitud)
+            self.sin_mejora = 0
+        else:
+            self.sin_mejora += 1
+
+        if poblacion is not None:
+            self.diversidad = self.medir_diversidad(poblacion)
+
+        if self.paciencia is not None and self.sin_mejora >= self.paciencia:
+            self.motivo = "estancamiento"
+        elif self.diversidad_minima is not None and self.diversidad <= self.diversidad_minima:
+            self.motivo = "diversidad"
+        elif self.tiempo_maximo is not None and time.perf_counter() - self.inicio >= self.tiempo_maximo:
+            self.motivo = "tiempo"
+        elif self.max_evaluaciones is not None and self.evaluaciones >= self.max_evaluaciones:
+            self.motivo = "evaluaciones"
+        else:
+            return None
+        return self.motivo
+
+    def resumen(self) -> str:
+        return (f"{self.motivo} tras {self.generaciones} generaciones "
+                f"({self.evaluaciones} evaluaciones)")
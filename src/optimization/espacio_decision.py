@@ -0,0 +1,126 @@
+"""
+Espacio de decisión (cromosoma) del Algoritmo Genético.
+
+Originalmente el cromosoma tenía un solo gen: el día de siembra. Aquí se
+describen cromosomas más ricos:
+
+    gen 0  dia_siembra          1 .. último día de siembra
+    gen 1  indice_perfil        0 .. n_perfiles-1     (sólo con >1 perfil)
+    gen 2  dia_segunda_siembra  0 = sin segunda siembra, o un día posterior
+                                (siembra escalonada de una fracción de la parcela)
+
+El fitness NO recalcula clima ni lógica difusa: consulta la tabla
+(perfil × día de inicio) del motor de puntuación, de modo que el espacio de
+búsqueda más grande sigue siendo barato. Con un perfil y sin segunda siembra
+el problema es exactamente el original de un gen.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from src.optimization.motor_puntuacion import obtener_motor, PENALIZACION
+from src.optimization.perfiles_cultivo import obtener_perfil
+
+
+class EspacioDecision:
+    """
+    Describe los genes del cromosoma y evalúa poblaciones completas.
+
+    Args:
+        perfiles (list | None): Perfiles candidatos (default: sólo maíz 120 días).
+        segunda_siembra (bool): Agrega el gen de siembra escalonada.
+        fraccion_segunda (float): Fracción de la parcela sembrada en la
+            segunda fecha (0-1).
+        separacion_minima (int): Días mínimos entre la primera y la segunda
+            siembra.
+        motor (MotorPuntuacion | None): Motor a usar (default: el global).
+        tabla (np.ndarray | None): Tabla (perfil × día) precalculada; si se
+            da, no se consulta el motor.
+    """
+
+    def __init__(self, perfiles=None, segunda_siembra: bool = False,
+                 fraccion_segunda: float = 0.5, separacion_minima: int = 15,
+                 motor=None, tabla=None):
+        if not 0 < fraccion_segunda < 1:
+            raise ValueError("❌ fraccion_segunda debe estar entre 0 y 1")
+
+        self.perfiles = [obtener_perfil(p) for p in (perfiles or [None])]
+        if tabla is None:
+            self.nombres, self.tabla = (motor or obtener_motor()).tabla_perfiles(self.perfiles)
+        else:
+            # Tabla ya calculada (p. ej. en memoria compartida entre procesos)
+            self.nombres, self.tabla = [p.nombre for p in self.perfiles], tabla
+        self.ultimos = np.array([p.ultimo_dia_siembra for p in self.perfiles])
+
+        self.usa_perfil = len(self.perfiles) > 1
+        self.segunda_siembra = segunda_siembra
+        self.fraccion_segunda = float(fraccion_segunda)
+        self.separacion_minima = int(separacion_minima)
+
+    @property
+    def num_genes(self) -> int:
+        return 1 + int(self.usa_perfil) + int(self.segunda_siembra)
+
+    @property
+    def dia_maximo(self) -> int:
+        return int(self.ultimos.max())
+
+    def gene_space(self) -> List:
+        """Espacio de cada gen en el formato de `pygad.GA(gene_space=...)`."""
+        espacio = [{'low': 1, 'high': self.dia_maximo}]
+        if self.usa_perfil:
+            espacio.append(list(range(len(self.perfiles))))
+        if self.segunda_siembra:
+            espacio.append({'low': 0, 'high': self.dia_maximo})
+        return espacio
+
+    def _columnas(self, soluciones):
+        soluciones = np.atleast_2d(np.asarray(soluciones)).astype(int)
+        dias = soluciones[:, 0]
+        perfiles = soluciones[:, 1] if self.usa_perfil else np.zeros_like(dias)
+        segundas = soluciones[:, -1] if self.segunda_siembra else np.zeros_like(dias)
+        return dias, perfiles, segundas
+
+    def _consultar(self, perfiles, dias):
+        """Tabla[perfil, dia-1] con PENALIZACION fuera de rango."""
+        validos = (perfiles >= 0) & (perfiles < len(self.perfiles))
+        perfiles_ok = np.where(validos, perfiles, 0)
+        validos &= (dias >= 1) & (dias <= self.ultimos[perfiles_ok])
+        valores = self.tabla[perfiles_ok, np.clip(dias - 1, 0, self.tabla.shape[1] - 1)]
+        return np.where(validos, valores, PENALIZACION)
+
+    def evaluar(self, soluciones) -> np.ndarray:
+        """
+        Fitness de toda una población en una sola pasada vectorizada.
+
+        Args:
+            soluciones (array): Matriz (individuos × num_genes).
+
+        Returns:
+            np.ndarray: Fitness de cada individuo.
+        """
+        dias, perfiles, segundas = self._columnas(soluciones)
+        primera = self._consultar(perfiles, dias)
+        if not self.segunda_siembra:
+            return primera
+
+        # Siembra escalonada: una fracción de la parcela en la segunda fecha
+        escalonada = segundas > 0
+        segunda = self._consultar(perfiles, segundas)
+        mezcla = (1 - self.fraccion_segunda) * primera + self.fraccion_segunda * segunda
+
+        invalida = escalonada & ((segundas < dias + self.separacion_minima)
+                                 | (primera == PENALIZACION) | (segunda == PENALIZACION))
+        fitness = np.where(escalonada, mezcla, primera)
+        return np.where(invalida, PENALIZACION, fitness)
+
+    def decodificar(self, solucion) -> Dict:
+        """Traduce un cromosoma a {dia_siembra, perfil, dia_segunda_siembra}."""
+        dias, perfiles, segundas = self._columnas(solucion)
+        segunda = int(segundas[0])
+        return {
+            "dia_siembra": int(dias[0]),
+            "perfil": self.nombres[int(perfiles[0])],
+            "dia_segunda_siembra": segunda if segunda > 0 else None,
+        }
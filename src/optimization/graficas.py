@@ -0,0 +1,103 @@
+"""
+Gráficas de resultados de optimización (paso opcional y separado).
+
+Se usa la API orientada a objetos de matplotlib con el lienzo Agg: no se
+abre ninguna ventana, no se llama a plt.show() y no se modifica el backend
+global de pyplot. matplotlib se importa sólo al graficar.
+"""
+
+import os
+
+from src import instrumentacion
+
+
+def _lienzo(ancho=10, alto=6):
+    """Figura nueva ligada a un lienzo Agg (sin ventana)."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figura = Figure(figsize=(ancho, alto))
+    FigureCanvasAgg(figura)
+    return figura
+
+
+@instrumentacion.cronometrado("graficas.convergencia")
+def graficar_convergencia(resultado, ruta: str, dpi: int = 150) -> str:
+    """
+    Curva de convergencia (mejor aptitud por generación) de un
+    ResultadoOptimizacion. Retorna la ruta de la imagen guardada.
+    """
+    figura = _lienzo()
+    ax = figura.add_subplot()
+    ax.plot(resultado.historial_mejor, color='blue', linewidth=2, label="Mejor Aptitud Global")
+
+    ax.set_title(f'Curva de Convergencia: {resultado.algoritmo} ({resultado.perfil})', fontsize=14)
+    ax.set_xlabel('Generaciones (Épocas)', fontsize=12)
+    ax.set_ylabel('Aptitud (Fitness)', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+
+    figura.savefig(ruta, dpi=dpi)
+    return os.path.abspath(ruta)
+
+
+@instrumentacion.cronometrado("graficas.ventana")
+def graficar_ventana(temps, lluvias, mejor_dia: int, ruta: str, dpi: int = 150) -> str:
+    """
+    Temperatura y lluvia del ciclo de cultivo seleccionado (doble eje Y).
+    Retorna la ruta de la imagen guardada.
+    """
+    dias_ciclo = list(range(1, len(temps) + 1))
+    figura = _lienzo(12, 6)
+
+    # EJE Y1 (Izquierda): Temperatura
+    ax1 = figura.add_subplot()
+    color_temp = 'tab:red'
+    ax1.set_xlabel(f'Días del Ciclo de Cultivo (1-{len(temps)})')
+    ax1.set_ylabel('Temperatura (°C)', color=color_temp, fontsize=12)
+    ax1.plot(dias_ciclo, temps, color=color_temp, linewidth=2, label='Temperatura')
+    ax1.tick_params(axis='y', labelcolor=color_temp)
+    ax1.grid(True, linestyle='--', alpha=0.5)
+
+    # EJE Y2 (Derecha): Lluvia
+    ax2 = ax1.twinx()
+    color_rain = 'tab:blue'
+    ax2.set_ylabel('Lluvia (mm)', color=color_rain, fontsize=12)
+    ax2.fill_between(dias_ciclo, lluvias, color=color_rain, alpha=0.3, label='Lluvia Acumulada')
+    ax2.tick_params(axis='y', labelcolor=color_rain)
+
+    ax1.set_title(f'Condiciones Climáticas para la Ventana de Siembra: Día {mejor_dia}', fontsize=14)
+    figura.tight_layout()
+
+    figura.savefig(ruta, dpi=dpi)
+    return os.path.abspath(ruta)
+
+
+@instrumentacion.cronometrado("graficas.paisajes")
+def graficar_paisajes(nombres, paisajes, ruta: str, dpi: int = 150) -> str:
+    """
+    Paisaje de aptitud (fitness por día de siembra) de varios perfiles, con
+    el óptimo de cada uno marcado. `paisajes` es la matriz de
+    panorama.paisaje_aptitud (NaN fuera de la ventana de siembra).
+    Retorna la ruta de la imagen guardada.
+    """
+    import numpy as np
+
+    figura = _lienzo(12, 6)
+    ax = figura.add_subplot()
+    for nombre, paisaje in zip(nombres, paisajes):
+        dias = np.arange(1, paisaje.size + 1)
+        linea, = ax.plot(dias, paisaje, linewidth=1.5, label=nombre)
+        if np.isfinite(paisaje).any():
+            mejor = int(np.nanargmax(paisaje))
+            ax.plot(dias[mejor], paisaje[mejor], 'o', color=linea.get_color())
+
+    ax.set_title('Panorama de Aptitud de Siembra', fontsize=14)
+    ax.set_xlabel('Día de Inicio de Siembra (Día del Año)', fontsize=12)
+    ax.set_ylabel('Puntaje Total (Fitness)', fontsize=12)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.legend()
+    figura.tight_layout()
+
+    figura.savefig(ruta, dpi=dpi)
+    return os.path.abspath(ruta)
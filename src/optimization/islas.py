@@ -0,0 +1,230 @@
+"""
+Algoritmo Genético en modelo de islas (varios procesos).
+
+`pygad.GA` evoluciona una sola población en un solo núcleo. Aquí varias
+poblaciones (islas) evolucionan en procesos separados y cada cierto número de
+generaciones (una "época") intercambian a sus mejores individuos en anillo:
+
+    isla 0 → isla 1 → ... → isla n-1 → isla 0
+
+La tabla de fitness (perfil × día de siembra) del espacio de decisión se
+calcula UNA vez en el proceso principal y se publica en memoria compartida;
+cada proceso la adjunta sin copiarla ni recalcular clima o lógica difusa.
+
+Cada isla usa una semilla derivada de (semilla, época, isla) y los resultados
+se recogen en orden, así que la corrida es reproducible bajo una semilla sin
+importar cuántos procesos haya.
+"""
+
+import os
+import time
+from multiprocessing import Pool, shared_memory
+from typing import Dict
+
+import numpy as np
+
+from src.optimization.algoritmo_genetico import crear_ga
+from src.optimization.arranque import poblacion_inicial
+from src.optimization.espacio_decision import EspacioDecision
+
+# Estado de cada proceso trabajador (se llena en _iniciar_trabajador)
+_espacio_isla = None
+_memoria_isla = None
+
+
+def _publicar_tabla(tabla):
+    """Copia la tabla a un bloque de memoria compartida. Retorna (shm, descriptor)."""
+    tabla = np.ascontiguousarray(tabla, dtype=float)
+    shm = shared_memory.SharedMemory(create=True, size=max(tabla.nbytes, 1))
+    np.ndarray(tabla.shape, dtype=tabla.dtype, buffer=shm.buf)[:] = tabla
+    return shm, (shm.name, tabla.shape, tabla.dtype.str)
+
+
+def _iniciar_trabajador(descriptor, opciones_espacio):
+    """Adjunta la tabla compartida y arma el espacio de decisión del proceso."""
+    global _espacio_isla, _memoria_isla
+
+    nombre, forma, dtype = descriptor
+    _memoria_isla = shared_memory.SharedMemory(name=nombre)
+    tabla = np.ndarray(forma, dtype=dtype, buffer=_memoria_isla.buf)
+    _espacio_isla = EspacioDecision(tabla=tabla, **opciones_espacio)
+
+
+def _cerrar_trabajador():
+    """Suelta la tabla compartida del proceso actual (modo en serie)."""
+    global _espacio_isla, _memoria_isla
+
+    _espacio_isla = None
+    if _memoria_isla is not None:
+        _memoria_isla.close()
+        _memoria_isla = None
+
+
+def _evolucionar_isla(tarea):
+    """
+    Corre una época de una isla.
+
+    Args:
+        tarea (tuple): (poblacion, generaciones, semilla, opciones_ga).
+
+    Returns:
+        tuple: (poblacion_final, fitness_final, evaluaciones)
+    """
+    poblacion, generaciones, semilla, opciones_ga = tarea
+    ga_instance = crear_ga(_espacio_isla, initial_population=poblacion,
+                           num_generations=generaciones, random_seed=semilla,
+                           **opciones_ga)
+    ga_instance.run()
+
+    poblacion = np.asarray(ga_instance.population)
+    fitness = _espacio_isla.evaluar(poblacion)
+    evaluaciones = (generaciones + 1) * len(poblacion)
+    return poblacion, fitness, evaluaciones
+
+
+def _migrar(poblaciones, aptitudes, n_migrantes):
+    """
+    Migración en anillo: los `n_migrantes` mejores de la isla i reemplazan a
+    los peores de la isla i+1. Modifica las poblaciones en sitio.
+    """
+    emigrantes = [pob[np.argsort(apt)[::-1][:n_migrantes]].copy()
+                  for pob, apt in zip(poblaciones, aptitudes)]
+    n_islas = len(poblaciones)
+    for i in range(n_islas):
+        destino = (i + 1) % n_islas
+        peores = np.argsort(aptitudes[destino])[:n_migrantes]
+        poblaciones[destino][peores] = emigrantes[i]
+
+
+def correr_islas(perfiles=None, n_islas: int = 4, sol_per_pop: int = 20,
+                 generaciones: int = 50, intervalo_migracion: int = 10,
+                 n_migrantes: int = 2, semilla: int = 42, procesos=None,
+                 segunda_siembra: bool = False, fraccion_segunda: float = 0.5,
+                 separacion_minima: int = 15, motor=None, **opciones_ga) -> Dict:
+    """
+    AG en modelo de islas sobre el espacio de decisión de `perfiles`.
+
+    Args:
+        perfiles (list | None): Perfiles candidatos (ver EspacioDecision).
+        n_islas (int): Número de poblaciones independientes.
+        sol_per_pop (int): Individuos por isla.
+        generaciones (int): Generaciones totales de cada isla.
+        intervalo_migracion (int): Generaciones entre migraciones (una época).
+        n_migrantes (int): Élites que cada isla envía a la siguiente.
+        semilla (int): Semilla de la corrida completa.
+        procesos (int | None): Procesos trabajadores (default: min(n_islas,
+            núcleos)). Con 0 las islas corren en serie en este proceso.
+        segunda_siembra, fraccion_segunda, separacion_minima: Ver EspacioDecision.
+        motor (MotorPuntuacion | None): Motor para calcular la tabla.
+        **opciones_ga: Parámetros extra para pygad.GA.
+
+    Returns:
+        dict: {"mejor": cromosoma decodificado + "aptitud", "solucion",
+               "aptitud_por_isla", "historial" (mejor global por época),
+               "evaluaciones", "tiempo"}
+    """
+    if n_migrantes >= sol_per_pop:
+        raise ValueError("❌ n_migrantes debe ser menor que sol_per_pop")
+
+    opciones_espacio = dict(perfiles=perfiles, segunda_siembra=segunda_siembra,
+                            fraccion_segunda=fraccion_segunda,
+                            separacion_minima=separacion_minima)
+    espacio = EspacioDecision(motor=motor, **opciones_espacio)
+
+    # Poblaciones iniciales reproducibles, una por isla
+    rng = np.random.default_rng(semilla)
+    poblaciones = [poblacion_inicial(espacio, sol_per_pop, semilla_aleatoria=rng)
+                   for _ in range(n_islas)]
+
+    if procesos is None:
+        procesos = min(n_islas, os.cpu_count() or 1)
+
+    inicio = time.perf_counter()
+    shm, descriptor = _publicar_tabla(espacio.tabla)
+    pool = None
+    try:
+        if procesos > 0:
+            pool = Pool(procesos, initializer=_iniciar_trabajador,
+                        initargs=(descriptor, opciones_espacio))
+            mapear = pool.map
+        else:
+            _iniciar_trabajador(descriptor, opciones_espacio)
+            mapear = lambda funcion, tareas: list(map(funcion, tareas))
+
+        historial = []
+        evaluaciones = 0
+        restantes = generaciones
+        epoca = 0
+        while restantes > 0:
+            gens = min(intervalo_migracion, restantes)
+            tareas = [(pob, gens, semilla + 1000 * epoca + i, opciones_ga)
+                      for i, pob in enumerate(poblaciones)]
+            salidas = mapear(_evolucionar_isla, tareas)
+
+            poblaciones = [s[0] for s in salidas]
+            aptitudes = [s[1] for s in salidas]
+            evaluaciones += sum(s[2] for s in salidas)
+            historial.append(float(max(a.max() for a in aptitudes)))
+
+            restantes -= gens
+            epoca += 1
+            if restantes > 0 and n_islas > 1:
+                _migrar(poblaciones, aptitudes, n_migrantes)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if procesos == 0:
+            _cerrar_trabajador()
+        shm.close()
+        shm.unlink()
+    tiempo = time.perf_counter() - inicio
+
+    mejores = [int(np.argmax(a)) for a in aptitudes]
+    isla = int(np.argmax([a[m] for a, m in zip(aptitudes, mejores)]))
+    solucion = poblaciones[isla][mejores[isla]]
+
+    mejor = espacio.decodificar(solucion)
+    mejor["aptitud"] = float(aptitudes[isla][mejores[isla]])
+    return {
+        "mejor": mejor,
+        "solucion": solucion,
+        "aptitud_por_isla": [float(a.max()) for a in aptitudes],
+        "historial": historial,
+        "evaluaciones": evaluaciones,
+        "tiempo": tiempo,
+    }
+
+
+def medir_aceleracion(perfiles=None, n_islas: int = 4, sol_per_pop: int = 20,
+                      generaciones: int = 50, semilla: int = 42, **opciones) -> Dict:
+    """
+    Compara el modelo de islas contra una sola isla con la misma población
+    total (n_islas × sol_per_pop) y las mismas generaciones, en un proceso.
+
+    Returns:
+        dict: {"tiempo_una_isla", "tiempo_islas", "aceleracion",
+               "aptitud_una_isla", "aptitud_islas"}
+    """
+    una = correr_islas(perfiles, n_islas=1, sol_per_pop=n_islas * sol_per_pop,
+                       generaciones=generaciones, semilla=semilla, procesos=0, **opciones)
+    islas = correr_islas(perfiles, n_islas=n_islas, sol_per_pop=sol_per_pop,
+                         generaciones=generaciones, semilla=semilla, **opciones)
+
+    resultado = {
+        "tiempo_una_isla": una["tiempo"],
+        "tiempo_islas": islas["tiempo"],
+        "aceleracion": una["tiempo"] / islas["tiempo"] if islas["tiempo"] > 0 else float("inf"),
+        "aptitud_una_isla": una["mejor"]["aptitud"],
+        "aptitud_islas": islas["mejor"]["aptitud"],
+    }
+
+    print("-" * 50)
+    print(" Modelo de islas vs. una sola isla")
+    print(f" Una isla ({n_islas * sol_per_pop} individuos): {resultado['tiempo_una_isla']:.2f} s"
+          f" | aptitud {resultado['aptitud_una_isla']:.2f}")
+    print(f" {n_islas} islas ({sol_per_pop} c/u):         {resultado['tiempo_islas']:.2f} s"
+          f" | aptitud {resultado['aptitud_islas']:.2f}")
+    print(f" Aceleración: {resultado['aceleracion']:.2f}x")
+    print("-" * 50)
+    return resultado
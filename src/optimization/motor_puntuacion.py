@@ -0,0 +1,244 @@
+"""
+Motor de puntuación compartido por los optimizadores.
+
+Antes, cada evaluación del fitness pedía 120 días a `obtener_clima_real` y
+corría 120 inferencias difusas. Aquí la aptitud de cada día del pronóstico se
+calcula UNA sola vez (motor difuso vectorizado) y se guardan sus sumas
+prefijo. Con eso:
+
+    - La suma de cualquier ventana cuesta O(1):  P[fin] - P[inicio].
+    - Un perfil con etapas ponderadas es una suma de pocas ventanas.
+    - La tabla completa (día de inicio → fitness) de un perfil cuesta O(días),
+      así que evaluar diez perfiles cuesta casi lo mismo que uno.
+    - Un kernel de pesos diarios arbitrario (germinación, floración...) se
+      aplica a TODOS los días de inicio con una sola correlación (FFT para
+      kernels largos o muchos sitios).
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from src import instrumentacion
+from src.optimization.perfiles_cultivo import PerfilCultivo, obtener_perfil
+
+# Fitness asignado a fechas inválidas o sin datos climáticos
+PENALIZACION = -999999
+
+# A partir de este largo de kernel conviene la correlación por FFT
+LARGO_KERNEL_FFT = 64
+
+
+def correlacionar_kernel(aptitud, kernel, n_inicios: int, metodo: str = "auto") -> np.ndarray:
+    """
+    Puntúa todos los días de inicio con un kernel de pesos diarios.
+
+        puntaje[s] = Σ_j kernel[j] · aptitud[s + j]
+
+    Los días más allá del final del pronóstico cuentan como 0 (ventana
+    truncada, igual que `obtener_clima_real`).
+
+    Args:
+        aptitud (array): Aptitud diaria, 1-D (días) o 2-D (sitios × días).
+        kernel (array): Peso de cada día del ciclo.
+        n_inicios (int): Número de días de inicio a puntuar (desde el índice 0).
+        metodo (str): "directo", "fft" o "auto" (FFT si el kernel es largo o
+            hay varios sitios).
+
+    Returns:
+        np.ndarray: (n_inicios,) o (sitios, n_inicios).
+    """
+    aptitud = np.asarray(aptitud, dtype=float)
+    kernel = np.asarray(kernel, dtype=float)
+    largo = kernel.size
+
+    # Relleno con ceros para que toda ventana de inicio tenga `largo` días
+    total = max(aptitud.shape[-1], n_inicios + largo - 1)
+    relleno = [(0, 0)] * (aptitud.ndim - 1) + [(0, total - aptitud.shape[-1])]
+    serie = np.pad(aptitud, relleno)
+
+    if metodo == "auto":
+        metodo = "fft" if (largo >= LARGO_KERNEL_FFT or aptitud.ndim > 1) else "directo"
+
+    if metodo == "directo":
+        ventanas = np.lib.stride_tricks.sliding_window_view(serie, largo, axis=-1)
+        return ventanas[..., :n_inicios, :] @ kernel
+
+    if metodo == "fft":
+        # Correlación = convolución con el kernel invertido
+        n_fft = serie.shape[-1] + largo - 1
+        espectro = np.fft.rfft(serie, n_fft, axis=-1) * np.fft.rfft(kernel[::-1], n_fft)
+        convolucion = np.fft.irfft(espectro, n_fft, axis=-1)
+        return convolucion[..., largo - 1:largo - 1 + n_inicios]
+
+    raise ValueError(f"❌ Método de correlación desconocido: {metodo}")
+
+
+def puntuar_aptitud(aptitud, perfil=None, n_inicios: int = None) -> np.ndarray:
+    """
+    Fitness de cada día de inicio para un perfil, directo sobre la aptitud.
+
+    Args:
+        aptitud (array): Aptitud diaria, 1-D (días) o 2-D (sitios × días).
+        perfil (PerfilCultivo | str | None): Perfil de cultivo.
+        n_inicios (int | None): Días de inicio a puntuar (default: el último
+            día de siembra del perfil).
+
+    Returns:
+        np.ndarray: (n_inicios,) o (sitios, n_inicios); la posición `i` es
+                    sembrar el día `i + 1`. Ventanas truncadas al final del
+                    pronóstico.
+    """
+    perfil = obtener_perfil(perfil)
+    aptitud = np.asarray(aptitud, dtype=float)
+    n_inicios = perfil.ultimo_dia_siembra if n_inicios is None else n_inicios
+
+    if perfil.pesos:
+        # Kernel diario arbitrario: una correlación para todos los inicios
+        return correlacionar_kernel(aptitud, perfil.pesos, n_inicios)
+
+    # Pesos constantes por etapa: unas cuantas restas de sumas prefijo
+    n_dias = aptitud.shape[-1]
+    ceros = np.zeros(aptitud.shape[:-1] + (1,))
+    prefijo = np.concatenate((ceros, np.cumsum(aptitud, axis=-1)), axis=-1)
+    inicios = np.arange(n_inicios)
+    tabla = np.zeros(aptitud.shape[:-1] + (n_inicios,))
+    for desde, hasta, peso in perfil.segmentos():
+        inicio = np.minimum(inicios + desde, n_dias)
+        fin = np.minimum(inicios + hasta, n_dias)
+        tabla += peso * (prefijo[..., fin] - prefijo[..., inicio])
+    return tabla
+
+
+class MotorPuntuacion:
+    """
+    Vector de aptitud diaria + sumas prefijo para puntuar ventanas de cultivo.
+
+    Args:
+        aptitud (array): Aptitud difusa de cada día del pronóstico
+            (índice 0 = día 1 del año).
+        temps (array): (opcional) Temperatura diaria usada para la aptitud.
+        lluvias (array): (opcional) Lluvia diaria; la necesitan objetivos
+            como la racha seca (ver multiobjetivo.py).
+    """
+
+    def __init__(self, aptitud, temps=None, lluvias=None):
+        self.aptitud = np.asarray(aptitud, dtype=float)
+        self.prefijo = np.concatenate(([0.0], np.cumsum(self.aptitud)))
+        self.temps = None if temps is None else np.asarray(temps, dtype=float)
+        self.lluvias = None if lluvias is None else np.asarray(lluvias, dtype=float)
+        self._tablas: Dict[PerfilCultivo, np.ndarray] = {}
+
+    @classmethod
+    def desde_clima(cls, temps, lluvias, politica: str = "clip", motor_difuso=None):
+        """
+        Construye el motor con una sola pasada difusa vectorizada.
+
+        `motor_difuso` (ver src/fuzzy/motores.py) permite usar otro motor de
+        inferencia; por defecto se usa el de `calcular_aptitud_lote`.
+        """
+        temps = np.asarray(temps, dtype=float)
+        lluvias = np.asarray(lluvias, dtype=float)
+        with instrumentacion.medir("puntuacion.aptitud_diaria"):
+            if motor_difuso is None:
+                from src.fuzzy.fuzzy_system import calcular_aptitud_lote
+
+                aptitud, _ = calcular_aptitud_lote(lluvias, temps, politica=politica)
+            else:
+                aptitud, _ = motor_difuso.evaluar_lote(temps, lluvias, politica=politica,
+                                                       sin_activacion="cero")
+        return cls(aptitud, temps=temps, lluvias=lluvias)
+
+    @property
+    def n_dias(self) -> int:
+        return self.aptitud.size
+
+    def sumas_ventana(self, inicios, duracion: int) -> np.ndarray:
+        """
+        Suma de la aptitud en [inicio, inicio + duracion) para cada inicio
+        (índices base 0). Las ventanas que pasan del final del pronóstico se
+        truncan, igual que `obtener_clima_real`.
+        """
+        inicios = np.asarray(inicios, dtype=int)
+        fin = np.minimum(inicios + duracion, self.n_dias)
+        inicio = np.minimum(inicios, self.n_dias)
+        return self.prefijo[fin] - self.prefijo[inicio]
+
+    def puntuar_perfil(self, perfil=None) -> np.ndarray:
+        """
+        Fitness de cada día de siembra permitido por el perfil.
+
+        Returns:
+            np.ndarray: Arreglo de longitud `ultimo_dia_siembra`; la posición
+                        `dia - 1` es el fitness de sembrar ese día.
+        """
+        perfil = obtener_perfil(perfil)
+        if perfil in self._tablas:
+            return self._tablas[perfil]
+
+        instrumentacion.contar("puntuacion.tablas")
+        inicios = np.arange(perfil.ultimo_dia_siembra)
+        tabla = puntuar_aptitud(self.aptitud, perfil)
+
+        # Sin datos climáticos para esa fecha: misma penalización que antes
+        tabla[inicios >= self.n_dias] = PENALIZACION
+
+        self._tablas[perfil] = tabla
+        return tabla
+
+    def tabla_perfiles(self, perfiles: Iterable) -> Tuple[List[str], np.ndarray]:
+        """
+        Tabla (perfil × día de siembra) para varios perfiles a la vez.
+
+        Returns:
+            tuple: (nombres, matriz). La matriz tiene una fila por perfil y
+                   tantas columnas como el mayor `ultimo_dia_siembra`; los
+                   días no permitidos valen PENALIZACION.
+        """
+        perfiles = [obtener_perfil(p) for p in perfiles]
+        columnas = max(p.ultimo_dia_siembra for p in perfiles)
+        matriz = np.full((len(perfiles), columnas), float(PENALIZACION))
+        for i, perfil in enumerate(perfiles):
+            matriz[i, :perfil.ultimo_dia_siembra] = self.puntuar_perfil(perfil)
+        return [p.nombre for p in perfiles], matriz
+
+    def fitness(self, dia_siembra: int, perfil=None) -> float:
+        """Fitness de un día de siembra (1-365) para un perfil."""
+        perfil = obtener_perfil(perfil)
+        if dia_siembra < 1 or dia_siembra > perfil.ultimo_dia_siembra:
+            return PENALIZACION
+        return float(self.puntuar_perfil(perfil)[dia_siembra - 1])
+
+    def mejores_dias(self, perfiles: Iterable) -> Dict[str, Tuple[int, float]]:
+        """Óptimo exacto (búsqueda exhaustiva en la tabla) de cada perfil."""
+        resultado = {}
+        for perfil in perfiles:
+            perfil = obtener_perfil(perfil)
+            tabla = self.puntuar_perfil(perfil)
+            idx = int(np.argmax(tabla))
+            resultado[perfil.nombre] = (idx + 1, float(tabla[idx]))
+        return resultado
+
+
+# Instancia global construida con el pronóstico de gestor_climatico
+_motor_global = None
+
+
+def obtener_motor() -> MotorPuntuacion:
+    """
+    Motor compartido con el pronóstico cargado por gestor_climatico.
+
+    Se construye al primer uso y después se reutiliza en todas las
+    evaluaciones de fitness, de todos los perfiles y de ambos optimizadores.
+    """
+    global _motor_global
+
+    if _motor_global is None:
+        from src.neural.gestor_climatico import df_clima
+
+        if df_clima.empty or not {'temp', 'lluvia'} <= set(df_clima.columns):
+            _motor_global = MotorPuntuacion(np.empty(0))
+        else:
+            _motor_global = MotorPuntuacion.desde_clima(df_clima['temp'].to_numpy(),
+                                                        df_clima['lluvia'].to_numpy())
+    return _motor_global
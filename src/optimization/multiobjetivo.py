@@ -0,0 +1,140 @@
+"""
+Optimización multiobjetivo de la fecha de siembra.
+
+El fitness original es un solo número (suma de aptitud). Para decidir entre
+fechas hace falta ver los compromisos entre varios criterios:
+
+    aptitud_total     Suma (ponderada por perfil) de la aptitud difusa.  MAX
+    dias_malos        Días del ciclo con categoría "MALO" (score < 30).  MIN
+    racha_seca_max    Racha más larga de días secos dentro del ciclo.    MIN
+    dias_tras_limite  Días que la cosecha se pasa de la fecha límite.    MIN
+
+Todos los objetivos se precalculan UNA vez para cada día de inicio posible
+(sumas prefijo y ventanas deslizantes sobre los arreglos diarios del motor de
+puntuación); evaluar una población entera es sólo indexar esa tabla.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from src.optimization.motor_puntuacion import obtener_motor, PENALIZACION
+from src.optimization.perfiles_cultivo import obtener_perfil
+
+OBJETIVOS = ("aptitud_total", "dias_malos", "racha_seca_max", "dias_tras_limite")
+
+# +1 = maximizar, -1 = minimizar (mismo orden que OBJETIVOS)
+SENTIDOS = np.array([1.0, -1.0, -1.0, -1.0])
+
+
+def frente_pareto(objetivos, sentidos=SENTIDOS) -> np.ndarray:
+    """
+    Máscara de las filas no dominadas.
+
+    Args:
+        objetivos (array): Matriz (soluciones × objetivos).
+        sentidos (array): +1 para maximizar, -1 para minimizar cada columna.
+
+    Returns:
+        np.ndarray: Arreglo booleano; True = la solución está en el frente.
+    """
+    f = np.asarray(objetivos, dtype=float) * sentidos
+    # domina[i, j]: i es al menos igual en todo y mejor en algo que j
+    al_menos_igual = (f[:, None, :] >= f[None, :, :]).all(axis=-1)
+    mejor_en_algo = (f[:, None, :] > f[None, :, :]).any(axis=-1)
+    domina = al_menos_igual & mejor_en_algo
+    return ~domina.any(axis=0)
+
+
+def _racha_hasta(indicador) -> np.ndarray:
+    """Longitud de la racha de True que termina en cada posición."""
+    posiciones = np.arange(indicador.size)
+    ultimo_falso = np.maximum.accumulate(np.where(indicador, -1, posiciones))
+    return posiciones - ultimo_falso
+
+
+class ProblemaMultiobjetivo:
+    """
+    Tabla de objetivos (día de inicio × objetivo) para un perfil de cultivo.
+
+    Args:
+        perfil (PerfilCultivo | str | None): Perfil a evaluar.
+        motor (MotorPuntuacion | None): Motor con aptitud y lluvia diarias.
+        umbral_seco (float): Lluvia (mm) por debajo de la cual un día es seco.
+        dia_limite_cosecha (int): Día del año en que la cosecha debería estar lista.
+    """
+
+    def __init__(self, perfil=None, motor=None, umbral_seco: float = 1.0,
+                 dia_limite_cosecha: int = 365):
+        from src.fuzzy.fuzzy_system import CATEGORIAS
+
+        self.perfil = perfil = obtener_perfil(perfil)
+        motor = motor or obtener_motor()
+        if motor.lluvias is None:
+            raise ValueError("❌ El motor de puntuación no tiene la serie de lluvia diaria")
+
+        n_inicios = perfil.ultimo_dia_siembra
+        duracion = perfil.duracion
+        inicios = np.arange(n_inicios)
+
+        # 1. Aptitud total (tabla ya cacheada por el motor)
+        aptitud_total = motor.puntuar_perfil(perfil)
+
+        # 2. Días MALO: sumas prefijo de la indicadora score < umbral de REGULAR
+        umbral_malo = CATEGORIAS[-2][0]
+        malos = (np.round(motor.aptitud, 2) < umbral_malo).astype(float)
+        prefijo_malos = np.concatenate(([0.0], np.cumsum(malos)))
+        fin = np.minimum(inicios + duracion, motor.n_dias)
+        dias_malos = prefijo_malos[fin] - prefijo_malos[np.minimum(inicios, motor.n_dias)]
+
+        # 3. Racha seca más larga: la racha que termina en el día i, recortada
+        #    al inicio de la ventana, y el máximo dentro de cada ventana
+        rachas = _racha_hasta(motor.lluvias < umbral_seco)
+        rachas = np.pad(rachas, (0, max(0, n_inicios + duracion - 1 - rachas.size)))
+        ventanas = np.lib.stride_tricks.sliding_window_view(rachas, duracion)[:n_inicios]
+        racha_max = np.minimum(ventanas, np.arange(1, duracion + 1)).max(axis=1)
+
+        # 4. Retraso de la cosecha respecto a la fecha límite
+        dia_cosecha = inicios + 1 + duracion
+        dias_tarde = np.maximum(0, dia_cosecha - dia_limite_cosecha)
+
+        self.tabla = np.column_stack([aptitud_total, dias_malos, racha_max, dias_tarde]).astype(float)
+        self.validos = aptitud_total != PENALIZACION
+
+        # Fila para días inválidos: el peor valor posible en cada objetivo
+        self._peor = np.array([PENALIZACION, duracion, duracion, 365.0])
+
+    def evaluar(self, dias) -> np.ndarray:
+        """
+        Objetivos de muchos días de siembra en una sola pasada.
+
+        Args:
+            dias (array): Días de siembra (1-365); se truncan a entero.
+
+        Returns:
+            np.ndarray: Matriz (len(dias) × 4) en el orden de OBJETIVOS.
+        """
+        dias = np.asarray(dias).astype(int).ravel()
+        idx = np.clip(dias - 1, 0, self.tabla.shape[0] - 1)
+        resultado = self.tabla[idx]
+        invalidos = (dias < 1) | (dias > self.perfil.ultimo_dia_siembra) | ~self.validos[idx]
+        resultado[invalidos] = self._peor
+        return resultado
+
+    def frente(self, dias=None) -> Dict:
+        """
+        Frente de Pareto exacto entre los días dados (default: todos los
+        días de siembra válidos del perfil).
+
+        Returns:
+            dict: {"dias": arreglo de días, "objetivos": matriz, "nombres": OBJETIVOS}
+        """
+        if dias is None:
+            dias = np.flatnonzero(self.validos) + 1
+        dias = np.unique(np.asarray(dias).astype(int))
+        objetivos = self.evaluar(dias)
+
+        validos = objetivos[:, 0] != PENALIZACION
+        dias, objetivos = dias[validos], objetivos[validos]
+        mascara = frente_pareto(objetivos)
+        return {"dias": dias[mascara], "objetivos": objetivos[mascara], "nombres": OBJETIVOS}
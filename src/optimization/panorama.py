@@ -0,0 +1,94 @@
+"""
+Panorama (paisaje) de aptitud de siembra.
+
+`graficar_panorama.py` calculaba 240 × 120 = 28,800 inferencias difusas, una
+llamada a `obtener_clima_real` por día de inicio. Aquí el paisaje sale de UNA
+pasada difusa vectorizada sobre la aptitud diaria más sumas por ventana
+(sumas prefijo o correlación con el kernel del perfil):
+
+    paisaje_clima(temps, lluvias, perfiles)   clima → aptitud → paisajes
+    paisaje_aptitud(aptitud, perfiles)        aptitud ya calculada → paisajes
+
+Ambas aceptan uno o varios sitios (arreglos 2-D sitios × días) y varios
+perfiles o duraciones de ciclo en la misma llamada.
+"""
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from src.optimization.motor_puntuacion import puntuar_aptitud
+from src.optimization.perfiles_cultivo import PerfilCultivo, obtener_perfil
+
+
+def _perfiles_panorama(perfiles) -> List[PerfilCultivo]:
+    """Perfiles a partir de perfiles, nombres o duraciones (int, en días)."""
+    if perfiles is None:
+        return [obtener_perfil()]
+
+    resultado = []
+    for perfil in perfiles:
+        if isinstance(perfil, (int, np.integer)):
+            # Duración suelta: cosecha dentro del año
+            perfil = PerfilCultivo(f"ciclo_{perfil}", duracion=int(perfil),
+                                   ultimo_dia_siembra=max(1, 365 - int(perfil)))
+        resultado.append(obtener_perfil(perfil))
+    return resultado
+
+
+def paisaje_aptitud(aptitud, perfiles: Iterable = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Paisajes de aptitud a partir de la aptitud diaria.
+
+    Args:
+        aptitud (array): Aptitud diaria, 1-D (días) o 2-D (sitios × días).
+        perfiles (iterable | None): Perfiles, nombres o duraciones en días
+            (default: maíz 120 días).
+
+    Returns:
+        tuple: (nombres, paisajes). `paisajes` tiene forma
+               (perfiles, días de inicio) o (sitios, perfiles, días de inicio);
+               la columna `i` es sembrar el día `i + 1`. Los días después del
+               último día de siembra de cada perfil, o sin datos climáticos,
+               valen NaN.
+    """
+    perfiles = _perfiles_panorama(perfiles)
+    aptitud = np.asarray(aptitud, dtype=float)
+    n_inicios = max(p.ultimo_dia_siembra for p in perfiles)
+    inicios = np.arange(n_inicios)
+
+    paisajes = np.full(aptitud.shape[:-1] + (len(perfiles), n_inicios), np.nan)
+    for i, perfil in enumerate(perfiles):
+        validos = (inicios < perfil.ultimo_dia_siembra) & (inicios < aptitud.shape[-1])
+        tabla = puntuar_aptitud(aptitud, perfil, n_inicios)
+        paisajes[..., i, :] = np.where(validos, tabla, np.nan)
+    return [p.nombre for p in perfiles], paisajes
+
+
+def paisaje_clima(temps, lluvias, perfiles: Iterable = None,
+                  politica: str = "clip") -> Tuple[List[str], np.ndarray]:
+    """
+    Paisajes de aptitud directamente del clima diario.
+
+    Todos los sitios se evalúan en una sola pasada del motor difuso
+    vectorizado; después se delega en `paisaje_aptitud`.
+
+    Args:
+        temps (array): Temperatura diaria, 1-D o 2-D (sitios × días).
+        lluvias (array): Lluvia diaria, misma forma que `temps`.
+        perfiles (iterable | None): Ver `paisaje_aptitud`.
+        politica (str): Política para entradas fuera de rango
+            (ver motor_vectorizado.POLITICAS_RANGO).
+
+    Returns:
+        tuple: (nombres, paisajes), ver `paisaje_aptitud`.
+    """
+    from src.fuzzy.fuzzy_system import calcular_aptitud_lote
+
+    temps = np.asarray(temps, dtype=float)
+    lluvias = np.asarray(lluvias, dtype=float)
+    if temps.shape != lluvias.shape:
+        raise ValueError(f"❌ Formas distintas: temps {temps.shape} vs lluvias {lluvias.shape}")
+
+    aptitud, _ = calcular_aptitud_lote(lluvias.ravel(), temps.ravel(), politica=politica)
+    return paisaje_aptitud(aptitud.reshape(temps.shape), perfiles)
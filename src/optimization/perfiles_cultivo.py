@@ -0,0 +1,125 @@
+"""
+Perfiles de cultivo para la optimización de la fecha de siembra.
+
+Hasta ahora los optimizadores y `main.py` asumían un maíz de 120 días con
+siembra a más tardar el día 240. Un perfil agrupa esos parámetros:
+
+    - duracion:            días del ciclo (siembra → cosecha).
+    - ultimo_dia_siembra:  último día del año en que se permite sembrar.
+    - etapas:              (días, peso) consecutivos que cubren el ciclo; el
+                           peso multiplica la aptitud diaria de esa etapa.
+                           Sin etapas, todos los días pesan 1.0.
+    - pesos:               (opcional) un peso POR DÍA del ciclo (kernel). Si se
+                           da, reemplaza a las etapas; permite transiciones
+                           suaves entre etapas (p. ej. campana en floración).
+
+El perfil por defecto (`maiz_120`) reproduce exactamente el fitness original.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class PerfilCultivo:
+    """
+    Parámetros de un cultivo/variedad.
+
+    Attributes:
+        nombre (str): Identificador del perfil.
+        duracion (int): Días del ciclo de cultivo.
+        ultimo_dia_siembra (int): Día del año más tardío permitido (1-365).
+        etapas (tuple): Pares (dias, peso) que suman `duracion`.
+        pesos (tuple): Kernel de pesos diarios de longitud `duracion`.
+    """
+    nombre: str
+    duracion: int = 120
+    ultimo_dia_siembra: int = 240
+    etapas: Tuple[Tuple[int, float], ...] = ()
+    pesos: Tuple[float, ...] = ()
+
+    def __post_init__(self):
+        if self.duracion < 1:
+            raise ValueError(f"❌ Duración inválida para '{self.nombre}': {self.duracion}")
+        if not 1 <= self.ultimo_dia_siembra <= 365:
+            raise ValueError(f"❌ Último día de siembra fuera de 1-365: {self.ultimo_dia_siembra}")
+        if self.etapas and sum(dias for dias, _ in self.etapas) != self.duracion:
+            raise ValueError(
+                f"❌ Las etapas de '{self.nombre}' suman "
+                f"{sum(dias for dias, _ in self.etapas)} días, se esperaban {self.duracion}"
+            )
+        if self.pesos and len(self.pesos) != self.duracion:
+            raise ValueError(
+                f"❌ El kernel de '{self.nombre}' tiene {len(self.pesos)} pesos, "
+                f"se esperaban {self.duracion}"
+            )
+
+    def segmentos(self) -> List[Tuple[int, int, float]]:
+        """
+        Etapas como desplazamientos dentro del ciclo.
+
+        Returns:
+            list: Tuplas (inicio, fin, peso) con `fin` exclusivo.
+        """
+        if not self.etapas:
+            return [(0, self.duracion, 1.0)]
+
+        segmentos = []
+        inicio = 0
+        for dias, peso in self.etapas:
+            segmentos.append((inicio, inicio + dias, float(peso)))
+            inicio += dias
+        return segmentos
+
+    def pesos_diarios(self) -> np.ndarray:
+        """Peso de cada día del ciclo (arreglo de longitud `duracion`)."""
+        if self.pesos:
+            return np.asarray(self.pesos, dtype=float)
+
+        pesos = np.empty(self.duracion)
+        for inicio, fin, peso in self.segmentos():
+            pesos[inicio:fin] = peso
+        return pesos
+
+
+# Perfiles predefinidos. El último día de siembra deja la cosecha dentro del año.
+PERFILES = {
+    "maiz_120": PerfilCultivo("maiz_120", duracion=120, ultimo_dia_siembra=240),
+    "maiz_precoz_90": PerfilCultivo("maiz_precoz_90", duracion=90, ultimo_dia_siembra=270),
+    "maiz_tardio_150": PerfilCultivo("maiz_tardio_150", duracion=150, ultimo_dia_siembra=210),
+    "frijol_90": PerfilCultivo("frijol_90", duracion=90, ultimo_dia_siembra=270),
+}
+
+PERFIL_DEFAULT = PERFILES["maiz_120"]
+
+
+def kernel_etapas(etapas, transicion: int = 0) -> Tuple[float, ...]:
+    """
+    Kernel diario a partir de etapas (dias, peso), opcionalmente suavizando
+    los saltos entre etapas con una media móvil de `transicion` días.
+
+    Útil para construir `PerfilCultivo(..., pesos=kernel_etapas(...))`.
+    """
+    pesos = np.concatenate([np.full(dias, float(peso)) for dias, peso in etapas])
+    if transicion > 1:
+        # Extender los bordes para que el suavizado no reduzca los extremos
+        borde = transicion // 2
+        extendido = np.pad(pesos, (borde, transicion - 1 - borde), mode='edge')
+        pesos = np.convolve(extendido, np.ones(transicion) / transicion, mode='valid')
+    return tuple(float(p) for p in pesos)
+
+
+def obtener_perfil(perfil=None) -> PerfilCultivo:
+    """Acepta un PerfilCultivo, el nombre de uno predefinido o None (default)."""
+    if perfil is None:
+        return PERFIL_DEFAULT
+    if isinstance(perfil, PerfilCultivo):
+        return perfil
+    try:
+        return PERFILES[perfil]
+    except KeyError:
+        raise KeyError(
+            f"❌ Perfil desconocido: '{perfil}'. Disponibles: {', '.join(PERFILES)}"
+        ) from None
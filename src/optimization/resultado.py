@@ -0,0 +1,127 @@
+"""
+Resultado de una corrida de optimización.
+
+Las funciones `optimizar` de ambos backends (AG y PSO) no imprimen ni
+grafican: regresan este objeto. Graficar es un paso aparte y opcional
+(ver graficas.py), así el rendimiento en lotes no depende de matplotlib.
+
+El resultado guarda todo lo que antes había que recalcular para reportar:
+historial por generación (mejor y media), evaluaciones, fracción de
+evaluaciones repetidas, tiempo de reloj y, opcionalmente, el paisaje
+completo de aptitud.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.optimization.motor_puntuacion import PENALIZACION
+
+
+@dataclass
+class ResultadoOptimizacion:
+    """
+    Attributes:
+        algoritmo (str): "AG" o "PSO".
+        perfil (str): Nombre del perfil de cultivo optimizado.
+        mejor_dia (int): Mejor día de siembra encontrado (1-365).
+        aptitud (float): Fitness del mejor día.
+        historial_mejor (np.ndarray): Mejor aptitud encontrada al final de cada generación.
+        historial_media (np.ndarray): Aptitud media de la población en cada
+            generación (sin contar individuos penalizados).
+        motivo_paro (str): Motivo de paro (ver convergencia.MOTIVOS).
+        evaluaciones (int): Evaluaciones de fitness realizadas.
+        fraccion_repetidas (float): Fracción de evaluaciones que repitieron
+            un cromosoma ya evaluado en la corrida (no se consulta ninguna caché;
+            indica cuánto ahorraría una).
+        tiempo (float): Tiempo de reloj de la corrida (s).
+        paisaje (np.ndarray | None): Fitness de cada día de siembra del
+            perfil (posición `dia - 1`), si se pidió.
+    """
+    algoritmo: str
+    perfil: str
+    mejor_dia: int
+    aptitud: float
+    historial_mejor: np.ndarray = field(default_factory=lambda: np.empty(0))
+    historial_media: np.ndarray = field(default_factory=lambda: np.empty(0))
+    motivo_paro: str = "generaciones"
+    evaluaciones: int = 0
+    fraccion_repetidas: float = 0.0
+    tiempo: float = 0.0
+    paisaje: Optional[np.ndarray] = None
+
+    @property
+    def generaciones(self) -> int:
+        return int(self.historial_mejor.size)
+
+    def a_dict(self, incluir_paisaje: bool = False) -> Dict:
+        """Versión serializable (JSON) del resultado."""
+        datos = {
+            "algoritmo": self.algoritmo,
+            "perfil": self.perfil,
+            "mejor_dia": int(self.mejor_dia),
+            "aptitud": float(self.aptitud),
+            "generaciones": self.generaciones,
+            "historial_mejor": [float(v) for v in self.historial_mejor],
+            "historial_media": [None if np.isnan(v) else float(v) for v in self.historial_media],
+            "motivo_paro": self.motivo_paro,
+            "evaluaciones": int(self.evaluaciones),
+            "fraccion_repetidas": float(self.fraccion_repetidas),
+            "tiempo": float(self.tiempo),
+        }
+        if incluir_paisaje and self.paisaje is not None:
+            datos["paisaje"] = [float(v) for v in self.paisaje]
+        return datos
+
+
+class RegistroCorrida:
+    """
+    Acumula las estadísticas de una corrida mientras el optimizador avanza.
+    Ambos backends lo alimentan igual: `registrar` en cada evaluación de
+    fitness y `cerrar_generacion` al final de cada generación/época.
+    """
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.evaluaciones = 0
+        self.mejor = []
+        self.media = []
+        self._evaluados = []
+
+    def registrar(self, soluciones):
+        """Anota soluciones evaluadas (individuos × genes; genes como enteros)."""
+        soluciones = np.atleast_2d(np.asarray(soluciones)).astype(int)
+        self.evaluaciones += soluciones.shape[0]
+        self._evaluados.append(soluciones)
+
+    def cerrar_generacion(self, aptitudes):
+        """Anota la mejor aptitud acumulada y la media válida de la población."""
+        aptitudes = np.asarray(aptitudes, dtype=float)
+        previo = self.mejor[-1] if self.mejor else -np.inf
+        self.mejor.append(max(previo, float(aptitudes.max())))
+        validas = aptitudes[aptitudes != PENALIZACION]
+        self.media.append(float(validas.mean()) if validas.size else np.nan)
+
+    def fraccion_repetidas(self) -> float:
+        if not self.evaluaciones:
+            return 0.0
+        distintas = np.unique(np.vstack(self._evaluados), axis=0).shape[0]
+        return 1.0 - distintas / self.evaluaciones
+
+    def resultado(self, algoritmo: str, perfil: str, mejor_dia: int, aptitud: float,
+                  motivo_paro: str, paisaje=None) -> ResultadoOptimizacion:
+        return ResultadoOptimizacion(
+            algoritmo=algoritmo,
+            perfil=perfil,
+            mejor_dia=int(mejor_dia),
+            aptitud=float(aptitud),
+            historial_mejor=np.asarray(self.mejor, dtype=float),
+            historial_media=np.asarray(self.media, dtype=float),
+            motivo_paro=motivo_paro,
+            evaluaciones=self.evaluaciones,
+            fraccion_repetidas=self.fraccion_repetidas(),
+            tiempo=time.perf_counter() - self.inicio,
+            paisaje=paisaje,
+        )
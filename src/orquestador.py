@@ -0,0 +1,336 @@
+"""
+Orquestador del pipeline con caché de artefactos (al estilo de make).
+
+Las fases producen artefactos en cadena:
+
+    prepare   → Reporte_Humano_Huajuapan.csv, Serie_Diaria_IA.npy, Dataset_Entrenamiento_IA.csv
+    train     → mejor_modelo_clima.h5
+    forecast  → data/processed/Pronostico_2026_IA.csv
+    score     → data/artefactos/aptitud_diaria.npy, evaluacion_diaria.csv
+    optimize  → data/artefactos/optimizacion.json
+    report    → data/artefactos/panorama.json, panorama.png
+
+Para cada etapa se registra (en data/artefactos/manifiesto.json) el hash
+SHA-256 de sus entradas, de su código fuente, de sus parámetros y de sus
+salidas. Una etapa se omite si todo coincide y sus salidas siguen intactas;
+si no, se vuelve a correr y se dice por qué. Como se comparan CONTENIDOS y no
+fechas, cambiar un punto de quiebre en fuzzy_system.py vuelve a correr
+`score` y, sólo si la aptitud diaria cambió, `optimize` y `report`; el
+entrenamiento y el pronóstico no se tocan.
+
+Las etapas neuronales (prepare, train, forecast) trabajan en src/neural,
+igual que al correr esos scripts a mano.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+RUTA_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIR_NEURAL = os.path.join("src", "neural")
+DIR_ARTEFACTOS = os.path.join("data", "artefactos")
+RUTA_PRONOSTICO = os.path.join("data", "processed", "Pronostico_2026_IA.csv")
+
+PARAMETROS_DEFAULT = {
+    "motor": "vectorizado",
+    "politica": "clip",
+    "backend": "ag",
+    "perfil": "maiz_120",
+    "semilla": 2026,
+}
+
+
+def hash_archivo(ruta: str, tam_bloque: int = 1 << 20) -> Optional[str]:
+    """SHA-256 del contenido de un archivo (None si no existe)."""
+    if not os.path.isfile(ruta):
+        return None
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(tam_bloque), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+@contextmanager
+def _en_directorio(ruta: str):
+    anterior = os.getcwd()
+    os.chdir(ruta)
+    try:
+        yield
+    finally:
+        os.chdir(anterior)
+
+
+@dataclass
+class Etapa:
+    """
+    Una etapa del pipeline.
+
+    Args:
+        nombre (str): Nombre (igual al subcomando de la CLI).
+        entradas (list): Archivos que lee (relativos a la raíz del proyecto).
+        salidas (list): Archivos que produce.
+        codigo (list): Fuentes cuyo cambio invalida la etapa.
+        claves (list): Parámetros del pipeline que usa la etapa.
+        ejecutar (callable): ejecutar(orquestador) produce las salidas.
+    """
+    nombre: str
+    entradas: List[str]
+    salidas: List[str]
+    codigo: List[str]
+    ejecutar: Callable
+    claves: List[str] = field(default_factory=list)
+
+
+# --- EJECUCIÓN DE CADA ETAPA ---
+
+def _prepare(orq):
+    from src.neural.preparacion_datos import preparar_datos
+
+    with _en_directorio(orq.ruta(DIR_NEURAL)):
+        if preparar_datos() is None:
+            raise RuntimeError("❌ No se pudieron descargar los datos históricos")
+
+
+def _train(orq):
+    from src.neural.entrenamiento_modelo import entrenar
+
+    with _en_directorio(orq.ruta(DIR_NEURAL)):
+        if entrenar(graficar=False) is None:
+            raise RuntimeError("❌ No se pudo entrenar el modelo")
+
+
+def _forecast(orq):
+    from src.neural.generar_pronostico import generar_pronostico
+
+    with _en_directorio(orq.ruta(DIR_NEURAL)):
+        if generar_pronostico(orq.ruta(RUTA_PRONOSTICO)) is None:
+            raise RuntimeError("❌ No se pudo generar el pronóstico")
+
+
+def _score(orq):
+    import numpy as np
+    from src.fuzzy.flujo_evaluacion import escribir_resultados_csv, evaluar_bloques
+    from src.fuzzy.motores import crear_motor
+    from src.neural.gestor_climatico import iterar_pronostico
+    from src.optimization.motor_puntuacion import MotorPuntuacion
+
+    p = orq.parametros
+    motor_difuso = None if p["motor"] == "vectorizado" else crear_motor(p["motor"])
+    bloques = list(iterar_pronostico(orq.ruta(RUTA_PRONOSTICO)))
+    temps = np.concatenate([t for _, t, _ in bloques])
+    lluvias = np.concatenate([l for _, _, l in bloques])
+
+    motor = MotorPuntuacion.desde_clima(temps, lluvias, p["politica"], motor_difuso)
+    np.save(orq.artefacto("aptitud_diaria.npy"), motor.aptitud)
+    escribir_resultados_csv(evaluar_bloques(bloques, politica=p["politica"], motor=motor_difuso),
+                            orq.artefacto("evaluacion_diaria.csv"))
+
+
+def _optimize(orq):
+    import numpy as np
+    from src.optimization.motor_puntuacion import MotorPuntuacion
+
+    p = orq.parametros
+    motor = MotorPuntuacion(np.load(orq.artefacto("aptitud_diaria.npy")))
+    if p["backend"] == "islas":
+        from src.optimization.islas import correr_islas
+
+        salida = correr_islas([p["perfil"]], motor=motor, semilla=p["semilla"], procesos=0)
+        resultado = {"algoritmo": "AG-islas", "perfil": p["perfil"],
+                     "mejor_dia": salida["mejor"]["dia_siembra"],
+                     "aptitud": salida["mejor"]["aptitud"],
+                     "evaluaciones": salida["evaluaciones"]}
+    else:
+        if p["backend"] == "pso":
+            from src.optimization.algoritmo_pso import optimizar
+        else:
+            from src.optimization.algoritmo_genetico import optimizar
+        resultado = optimizar(p["perfil"], motor=motor, semilla=p["semilla"]).a_dict()
+        # El tiempo cambia en cada corrida; fuera del artefacto para que su
+        # hash sólo dependa del resultado
+        resultado.pop("tiempo", None)
+
+    with open(orq.artefacto("optimizacion.json"), 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+
+
+def _report(orq):
+    import numpy as np
+    from src.optimization.graficas import graficar_paisajes
+    from src.optimization.panorama import paisaje_aptitud
+    from src.optimization.perfiles_cultivo import PERFILES
+
+    nombres, paisajes = paisaje_aptitud(np.load(orq.artefacto("aptitud_diaria.npy")),
+                                        PERFILES.values())
+    with open(orq.artefacto("optimizacion.json"), encoding='utf-8') as f:
+        optimizacion = json.load(f)
+
+    reporte = {"optimizacion": optimizacion, "perfiles": {}}
+    for nombre, paisaje in zip(nombres, paisajes):
+        mejor = int(np.nanargmax(paisaje))
+        reporte["perfiles"][nombre] = {"mejor_dia": mejor + 1, "aptitud": float(paisaje[mejor])}
+
+    with open(orq.artefacto("panorama.json"), 'w', encoding='utf-8') as f:
+        json.dump(reporte, f, indent=2, ensure_ascii=False)
+    graficar_paisajes(nombres, paisajes, orq.artefacto("panorama.png"))
+
+
+def _fuentes(*rutas):
+    return [os.path.join("src", *r.split("/")) for r in rutas]
+
+
+ETAPAS = [
+    Etapa("prepare", [],
+          [os.path.join(DIR_NEURAL, "Reporte_Humano_Huajuapan.csv"),
+           os.path.join(DIR_NEURAL, "Serie_Diaria_IA.npy"),
+           os.path.join(DIR_NEURAL, "Dataset_Entrenamiento_IA.csv")],
+          _fuentes("neural/preparacion_datos.py"), _prepare),
+    Etapa("train", [os.path.join(DIR_NEURAL, "Serie_Diaria_IA.npy")],
+          [os.path.join(DIR_NEURAL, "mejor_modelo_clima.h5")],
+          # La serie diaria y su normalización vienen de preparacion_datos.py
+          _fuentes("neural/entrenamiento_modelo.py", "neural/preparacion_datos.py"), _train),
+    Etapa("forecast", [os.path.join(DIR_NEURAL, "Reporte_Humano_Huajuapan.csv"),
+                       os.path.join(DIR_NEURAL, "mejor_modelo_clima.h5")],
+          [RUTA_PRONOSTICO],
+          _fuentes("neural/generar_pronostico.py", "neural/preparacion_datos.py"), _forecast),
+    Etapa("score", [RUTA_PRONOSTICO],
+          [os.path.join(DIR_ARTEFACTOS, "aptitud_diaria.npy"),
+           os.path.join(DIR_ARTEFACTOS, "evaluacion_diaria.csv")],
+          # resultados.py tiene los umbrales de las categorías y gestor_climatico.py
+          # el lector del pronóstico: también cambian evaluacion_diaria.csv
+          _fuentes("fuzzy/fuzzy_system.py", "fuzzy/motor_vectorizado.py",
+                   "fuzzy/motor_tabulado.py", "fuzzy/motores.py", "fuzzy/memo_difuso.py",
+                   "fuzzy/flujo_evaluacion.py", "fuzzy/resultados.py",
+                   "neural/gestor_climatico.py", "optimization/motor_puntuacion.py",
+                   "optimization/perfiles_cultivo.py"),
+          _score, ["motor", "politica"]),
+    Etapa("optimize", [os.path.join(DIR_ARTEFACTOS, "aptitud_diaria.npy")],
+          [os.path.join(DIR_ARTEFACTOS, "optimizacion.json")],
+          _fuentes("optimization/algoritmo_genetico.py", "optimization/algoritmo_pso.py",
+                   "optimization/islas.py", "optimization/arranque.py",
+                   "optimization/convergencia.py", "optimization/espacio_decision.py",
+                   "optimization/motor_puntuacion.py", "optimization/perfiles_cultivo.py",
+                   "optimization/resultado.py"),
+          _optimize, ["backend", "perfil", "semilla"]),
+    Etapa("report", [os.path.join(DIR_ARTEFACTOS, "aptitud_diaria.npy"),
+                     os.path.join(DIR_ARTEFACTOS, "optimizacion.json")],
+          [os.path.join(DIR_ARTEFACTOS, "panorama.json"),
+           os.path.join(DIR_ARTEFACTOS, "panorama.png")],
+          # El paisaje se calcula con las sumas prefijo y kernels de motor_puntuacion.py
+          _fuentes("optimization/panorama.py", "optimization/graficas.py",
+                   "optimization/perfiles_cultivo.py", "optimization/motor_puntuacion.py"),
+          _report),
+]
+NOMBRES_ETAPAS = [e.nombre for e in ETAPAS]
+
+
+class Orquestador:
+    """
+    Corre las etapas pendientes y omite las que están al día.
+
+    Args:
+        raiz (str): Raíz del proyecto.
+        parametros (dict): Parámetros del pipeline (ver PARAMETROS_DEFAULT).
+    """
+
+    def __init__(self, raiz: str = RUTA_PROYECTO, parametros: Dict = None):
+        self.raiz = raiz
+        self.parametros = dict(PARAMETROS_DEFAULT, **(parametros or {}))
+        self.ruta_manifiesto = self.ruta(DIR_ARTEFACTOS, "manifiesto.json")
+        self.manifiesto = self._leer_manifiesto()
+
+    def ruta(self, *partes) -> str:
+        return os.path.join(self.raiz, *partes)
+
+    def artefacto(self, nombre: str) -> str:
+        return self.ruta(DIR_ARTEFACTOS, nombre)
+
+    def _leer_manifiesto(self) -> Dict:
+        try:
+            with open(self.ruta_manifiesto, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _guardar_manifiesto(self):
+        os.makedirs(os.path.dirname(self.ruta_manifiesto), exist_ok=True)
+        with open(self.ruta_manifiesto, 'w', encoding='utf-8') as f:
+            json.dump(self.manifiesto, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    def _hashes(self, rutas) -> Dict[str, Optional[str]]:
+        return {ruta: hash_archivo(self.ruta(ruta)) for ruta in rutas}
+
+    def huella(self, etapa: Etapa) -> Dict:
+        """Hashes actuales de entradas y código, y los parámetros que usa la etapa."""
+        return {
+            "entradas": self._hashes(etapa.entradas),
+            "codigo": self._hashes(etapa.codigo),
+            "parametros": {clave: self.parametros[clave] for clave in etapa.claves},
+        }
+
+    def motivo(self, etapa: Etapa) -> Optional[str]:
+        """Por qué hay que correr la etapa (None si está al día)."""
+        registro = self.manifiesto.get(etapa.nombre)
+        if registro is None:
+            return "sin registro previo"
+        actual = self.huella(etapa)
+        for ruta, h in actual["entradas"].items():
+            if h is None:
+                return f"falta la entrada {ruta}"
+            if registro["entradas"].get(ruta) != h:
+                return f"cambió la entrada {ruta}"
+        for ruta, h in actual["codigo"].items():
+            if registro["codigo"].get(ruta) != h:
+                return f"cambió el código {ruta}"
+        if registro["parametros"] != actual["parametros"]:
+            return "cambiaron los parámetros"
+        for ruta, h in self._hashes(etapa.salidas).items():
+            if h is None:
+                return f"falta la salida {ruta}"
+            if registro["salidas"].get(ruta) != h:
+                return f"la salida {ruta} fue modificada"
+        return None
+
+    def estado(self) -> List[Tuple[str, Optional[str]]]:
+        """[(etapa, motivo o None)] de todas las etapas."""
+        return [(etapa.nombre, self.motivo(etapa)) for etapa in ETAPAS]
+
+    def correr(self, desde: str = "prepare", hasta: str = "report", forzar=()) -> Dict[str, str]:
+        """
+        Corre en orden las etapas de `desde` a `hasta`, omitiendo las que
+        están al día (salvo las de `forzar`). Las etapas anteriores a `desde`
+        no se corren: sus salidas se toman como están.
+
+        Returns:
+            dict: {etapa: "omitida" | "ejecutada"}
+        """
+        for nombre in (desde, hasta, *forzar):
+            if nombre not in NOMBRES_ETAPAS:
+                raise ValueError(f"❌ Etapa desconocida: {nombre}. "
+                                 f"Opciones: {', '.join(NOMBRES_ETAPAS)}")
+        inicio, fin = NOMBRES_ETAPAS.index(desde), NOMBRES_ETAPAS.index(hasta)
+
+        resultado = {}
+        for etapa in ETAPAS[inicio:fin + 1]:
+            motivo = "forzada" if etapa.nombre in forzar else self.motivo(etapa)
+            if motivo is None:
+                print(f"⏭️  {etapa.nombre}: al día")
+                resultado[etapa.nombre] = "omitida"
+                continue
+
+            faltantes = [r for r in etapa.entradas if not os.path.isfile(self.ruta(r))]
+            if faltantes:
+                raise FileNotFoundError(f"❌ {etapa.nombre}: faltan entradas {', '.join(faltantes)}")
+
+            print(f"▶️  {etapa.nombre}: {motivo}")
+            huella = self.huella(etapa)
+            os.makedirs(self.ruta(DIR_ARTEFACTOS), exist_ok=True)
+            etapa.ejecutar(self)
+            self.manifiesto[etapa.nombre] = dict(huella, salidas=self._hashes(etapa.salidas))
+            self._guardar_manifiesto()
+            resultado[etapa.nombre] = "ejecutada"
+        return resultado
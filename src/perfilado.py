@@ -0,0 +1,134 @@
+"""
+Perfilado integrado de las etapas de optimización y pronóstico.
+
+`perfilar(base)` envuelve un bloque con dos perfiladores a la vez:
+
+    cProfile      Conteo exacto de llamadas y tiempo por función. Se guarda
+                  el binario (<base>.prof, para snakeviz/pstats) y un reporte
+                  de puntos calientes ordenado por tiempo acumulado
+                  (<base>.txt).
+    Muestreo      Un hilo toma la pila del hilo perfilado cada `intervalo`
+                  segundos y cuenta las pilas repetidas. El resultado se
+                  guarda en formato "collapsed" (<base>.folded), una línea
+                  "f1;f2;f3 N" por pila, listo para flamegraph.pl o speedscope.
+
+    from src.perfilado import perfilar
+
+    with perfilar("perfil_ag"):
+        correr_optimizacion(...)
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict
+
+
+class MuestreadorPilas:
+    """
+    Perfilador estadístico: muestrea la pila de un hilo a intervalos fijos.
+
+    Args:
+        id_hilo (int): Hilo a muestrear (default: el que crea el muestreador).
+        intervalo (float): Segundos entre muestras.
+    """
+
+    def __init__(self, id_hilo: int = None, intervalo: float = 0.005):
+        self.id_hilo = id_hilo or threading.get_ident()
+        self.intervalo = intervalo
+        self.pilas: Counter = Counter()
+        self._detener = threading.Event()
+        self._hilo = None
+
+    @staticmethod
+    def _nombre_marco(marco) -> str:
+        codigo = marco.f_code
+        return f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})"
+
+    def _muestrear(self):
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self.id_hilo)
+            pila = []
+            while marco is not None:
+                pila.append(self._nombre_marco(marco))
+                marco = marco.f_back
+            if pila:
+                self.pilas[";".join(reversed(pila))] += 1
+
+    def iniciar(self):
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._muestrear, name="muestreador-pilas",
+                                      daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+
+    def a_collapsed(self) -> str:
+        """Pilas en formato collapsed (una por línea, de mayor a menor conteo)."""
+        return "".join(f"{pila} {n}\n" for pila, n in self.pilas.most_common())
+
+
+def reporte_puntos_calientes(perfil: cProfile.Profile, limite: int = 40,
+                             orden: str = "cumulative") -> str:
+    """Tabla de pstats con las `limite` funciones más costosas según `orden`."""
+    salida = io.StringIO()
+    estadisticas = pstats.Stats(perfil, stream=salida)
+    estadisticas.strip_dirs().sort_stats(orden).print_stats(limite)
+    return salida.getvalue()
+
+
+@contextmanager
+def perfilar(base: str, intervalo: float = 0.005, limite: int = 40):
+    """
+    Perfila el bloque con cProfile y con el muestreador de pilas.
+
+    Args:
+        base (str): Ruta base de los archivos (.prof, .txt y .folded).
+        intervalo (float): Segundos entre muestras de pila.
+        limite (int): Funciones a incluir en el reporte de puntos calientes.
+
+    Yields:
+        dict: Se llena al salir con las rutas generadas, la duración y el
+              número de muestras.
+    """
+    info: Dict = {}
+    muestreador = MuestreadorPilas(intervalo=intervalo)
+    perfil = cProfile.Profile()
+
+    inicio = time.perf_counter()
+    muestreador.iniciar()
+    perfil.enable()
+    try:
+        yield info
+    finally:
+        perfil.disable()
+        muestreador.detener()
+        info["duracion_s"] = time.perf_counter() - inicio
+        info["muestras"] = sum(muestreador.pilas.values())
+
+        info["prof"] = os.path.abspath(f"{base}.prof")
+        perfil.dump_stats(info["prof"])
+
+        info["reporte"] = os.path.abspath(f"{base}.txt")
+        with open(info["reporte"], 'w', encoding='utf-8') as f:
+            f.write(reporte_puntos_calientes(perfil, limite))
+
+        info["folded"] = os.path.abspath(f"{base}.folded")
+        with open(info["folded"], 'w', encoding='utf-8') as f:
+            f.write(muestreador.a_collapsed())
+
+
+def imprimir_resumen(info: Dict):
+    print(f"\n🔬 Perfil: {info['duracion_s']:.3f} s, {info['muestras']} muestras de pila")
+    print(f"   Puntos calientes: {info['reporte']}")
+    print(f"   Pilas (flamegraph): {info['folded']}")
+    print(f"   cProfile: {info['prof']}")
@@ -0,0 +1,325 @@
+"""
+Servicio HTTP local de puntuación con estado residente.
+
+Cada consulta de la aplicación de campo ("¿cuál es el mejor día para sembrar
+este cultivo?") costaba un proceso nuevo: importar pandas, skfuzzy y pygad y
+volver a leer el CSV del pronóstico. El servicio hace todo eso UNA vez al
+arrancar y lo deja en memoria:
+
+    - el pronóstico (fechas, temperatura y lluvia de cada día),
+    - el motor difuso compilado (por defecto el vectorizado),
+    - el motor de puntuación con las tablas de fitness de todos los perfiles,
+    - el paisaje de aptitud de todos los perfiles.
+
+Rutas (GET con parámetros en la URL o POST con un objeto JSON):
+
+    /salud              Estado del servicio y perfiles disponibles.
+    /puntuar-dia        dia=N (día del pronóstico) o temperatura=T&lluvia=L
+                        (en POST, también listas) → score, categoría y
+                        recomendación.
+    /puntuar-ventana    dia=N&perfil=P → fitness de sembrar ese día.
+    /paisaje            perfil=P (opcional) → fitness de cada día de siembra.
+    /optimizar          perfil=P&backend=exacto|ag|pso&semilla=S → mejor día.
+                        "exacto" lee la tabla residente (instantáneo).
+
+    python -m src serve --puerto 8765
+
+Sólo escucha en localhost por defecto. Las consultas concurrentes se atienden
+en hilos (ThreadingHTTPServer); tablas y paisajes son de sólo lectura, y las
+llamadas al motor difuso y a los optimizadores se serializan con candados
+porque ambos guardan estado interno.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from src import instrumentacion
+
+HOST_DEFAULT = "127.0.0.1"
+PUERTO_DEFAULT = 8765
+BACKENDS_SERVICIO = ("exacto", "ag", "pso")
+
+
+class ErrorConsulta(ValueError):
+    """Parámetros inválidos en una consulta (se responde con 400)."""
+
+
+def _validar_finitos(temps, lluvias):
+    """NaN o ±inf no son entradas válidas (y no son JSON estricto)."""
+    if not (np.isfinite(temps).all() and np.isfinite(lluvias).all()):
+        raise ErrorConsulta("❌ temperatura y lluvia deben ser números finitos")
+
+
+def _valor_json(valor):
+    """float, o None para NaN (un día del pronóstico sin dato)."""
+    return None if np.isnan(valor) else float(valor)
+
+
+class EstadoServicio:
+    """
+    Todo lo que el servicio mantiene en memoria entre consultas.
+
+    Args:
+        ruta_pronostico (str | None): Pronóstico .csv o .npy (default: el de
+            gestor_climatico).
+        motor (str): Motor difuso del registro (ver src/fuzzy/motores.py).
+        politica (str): Política para entradas fuera de rango.
+    """
+
+    def __init__(self, ruta_pronostico: str = None, motor: str = "vectorizado",
+                 politica: str = "clip"):
+        from src.fuzzy.motores import crear_motor
+        from src.neural.gestor_climatico import CSV_PATH, iterar_pronostico
+        from src.optimization.motor_puntuacion import MotorPuntuacion
+        from src.optimization.panorama import paisaje_aptitud
+        from src.optimization.perfiles_cultivo import PERFILES
+
+        inicio = time.perf_counter()
+        self.ruta_pronostico = ruta_pronostico or CSV_PATH
+        self.nombre_motor = motor
+        self.politica = politica
+
+        bloques = list(iterar_pronostico(self.ruta_pronostico))
+        if not bloques:
+            raise ValueError(f"❌ El pronóstico {self.ruta_pronostico} no tiene días")
+        self.temps = np.concatenate([t for _, t, _ in bloques])
+        self.lluvias = np.concatenate([l for _, _, l in bloques])
+        self.fechas = None
+        if all(f is not None for f, _, _ in bloques):
+            self.fechas = np.concatenate([f for f, _, _ in bloques])
+
+        self.motor_difuso = crear_motor(motor)
+        self.motor = MotorPuntuacion.desde_clima(self.temps, self.lluvias, politica,
+                                                 self.motor_difuso)
+        # Tablas de todos los perfiles precalculadas: después sólo se leen
+        self.perfiles = list(PERFILES)
+        self.motor.tabla_perfiles(self.perfiles)
+        nombres, paisajes = paisaje_aptitud(self.motor.aptitud, PERFILES.values())
+        self.paisajes = dict(zip(nombres, paisajes))
+
+        self._candado_difuso = threading.Lock()
+        self._candado_optimizador = threading.Lock()
+        self._optimizaciones: Dict[Tuple, Dict] = {}
+        self.tiempo_arranque = time.perf_counter() - inicio
+
+    # --- CONSULTAS ---
+
+    def _perfil(self, perfil) -> str:
+        perfil = perfil or "maiz_120"
+        if perfil not in self.paisajes:
+            raise ErrorConsulta(f"❌ Perfil desconocido: {perfil}. "
+                                f"Opciones: {', '.join(self.perfiles)}")
+        return perfil
+
+    def _dia(self, dia, maximo: int) -> int:
+        try:
+            dia = int(dia)
+        except (TypeError, ValueError):
+            raise ErrorConsulta(f"❌ Día inválido: {dia}")
+        if not 1 <= dia <= maximo:
+            raise ErrorConsulta(f"❌ Día fuera de rango: {dia}. Debe estar entre 1 y {maximo}")
+        return dia
+
+    def _fecha(self, dia: int):
+        return None if self.fechas is None else str(self.fechas[dia - 1])
+
+    def salud(self, parametros: Dict) -> Dict:
+        return {
+            "estado": "ok",
+            "pronostico": self.ruta_pronostico,
+            "dias": int(self.motor.n_dias),
+            "motor": self.nombre_motor,
+            "politica": self.politica,
+            "perfiles": self.perfiles,
+            "tiempo_arranque_s": self.tiempo_arranque,
+        }
+
+    def puntuar_dia(self, parametros: Dict) -> Dict:
+        from src.fuzzy.fuzzy_system import clasificar_lote
+
+        if "dia" in parametros:
+            dia = self._dia(parametros["dia"], self.motor.n_dias)
+            temps, lluvias = self.temps[dia - 1:dia], self.lluvias[dia - 1:dia]
+        elif "temperatura" in parametros and "lluvia" in parametros:
+            dia = None
+            try:
+                temps = np.atleast_1d(np.asarray(parametros["temperatura"], dtype=float))
+                lluvias = np.atleast_1d(np.asarray(parametros["lluvia"], dtype=float))
+            except (TypeError, ValueError):
+                raise ErrorConsulta("❌ temperatura y lluvia deben ser numéricas")
+            if temps.shape != lluvias.shape or temps.ndim != 1:
+                raise ErrorConsulta("❌ temperatura y lluvia deben tener el mismo largo")
+            _validar_finitos(temps, lluvias)
+        else:
+            raise ErrorConsulta("❌ Indica dia, o temperatura y lluvia")
+
+        with self._candado_difuso:
+            scores, _ = self.motor_difuso.evaluar_lote(temps, lluvias, politica=self.politica)
+        # Mismo redondeo que `evaluar` y `evaluar_bloques`
+        scores = np.round(scores, 2)
+        categorias, recomendaciones = clasificar_lote(scores)
+
+        resultados = [{
+            "score_amplitud": _valor_json(s),
+            "categoria": str(c),
+            "recomendacion": str(r),
+            "inputs": {"temperatura": _valor_json(t), "precipitacion": _valor_json(p)},
+        } for s, c, r, t, p in zip(scores, categorias, recomendaciones, temps, lluvias)]
+
+        if dia is not None:
+            return dict(resultados[0], dia=dia, fecha=self._fecha(dia))
+        if np.ndim(parametros["temperatura"]) == 0:
+            return resultados[0]
+        return {"resultados": resultados}
+
+    def puntuar_ventana(self, parametros: Dict) -> Dict:
+        perfil = self._perfil(parametros.get("perfil"))
+        tabla = self.motor.puntuar_perfil(perfil)
+        dia = self._dia(parametros.get("dia"), tabla.size)
+        return {"perfil": perfil, "dia_siembra": dia, "fecha": self._fecha(dia),
+                "aptitud": float(tabla[dia - 1])}
+
+    def paisaje(self, parametros: Dict) -> Dict:
+        perfil = self._perfil(parametros.get("perfil"))
+        paisaje = self.paisajes[perfil]
+        mejor = int(np.nanargmax(paisaje))
+        return {"perfil": perfil, "mejor_dia": mejor + 1, "aptitud": float(paisaje[mejor]),
+                "paisaje": [None if np.isnan(v) else float(v) for v in paisaje]}
+
+    def optimizar(self, parametros: Dict) -> Dict:
+        perfil = self._perfil(parametros.get("perfil"))
+        backend = parametros.get("backend", "exacto")
+        if backend not in BACKENDS_SERVICIO:
+            raise ErrorConsulta(f"❌ Backend desconocido: {backend}. "
+                                f"Opciones: {', '.join(BACKENDS_SERVICIO)}")
+
+        if backend == "exacto":
+            dia, aptitud = self.motor.mejores_dias([perfil])[perfil]
+            return {"algoritmo": "exacto", "perfil": perfil, "mejor_dia": dia,
+                    "fecha": self._fecha(dia), "aptitud": aptitud}
+
+        semilla = parametros.get("semilla")
+        try:
+            semilla = None if semilla is None else int(semilla)
+        except (TypeError, ValueError):
+            raise ErrorConsulta(f"❌ Semilla inválida: {semilla}")
+        clave = (perfil, backend, semilla)
+        # Con semilla la corrida es reproducible: se responde la ya calculada
+        if semilla is not None and clave in self._optimizaciones:
+            return self._optimizaciones[clave]
+
+        if backend == "pso":
+            from src.optimization.algoritmo_pso import optimizar
+        else:
+            from src.optimization.algoritmo_genetico import optimizar
+        # PyGAD y mealpy usan el generador aleatorio global de NumPy
+        with self._candado_optimizador:
+            resultado = optimizar(perfil, motor=self.motor, semilla=semilla).a_dict()
+        resultado["fecha"] = self._fecha(resultado["mejor_dia"])
+        if semilla is not None:
+            self._optimizaciones[clave] = resultado
+        return resultado
+
+
+RUTAS = {
+    "/salud": EstadoServicio.salud,
+    "/puntuar-dia": EstadoServicio.puntuar_dia,
+    "/puntuar-ventana": EstadoServicio.puntuar_ventana,
+    "/paisaje": EstadoServicio.paisaje,
+    "/optimizar": EstadoServicio.optimizar,
+}
+
+
+class ManejadorSiembra(BaseHTTPRequestHandler):
+    """Traduce cada petición HTTP a una consulta de EstadoServicio."""
+
+    estado: EstadoServicio = None
+    protocol_version = "HTTP/1.1"
+    silencioso = False
+
+    def _responder(self, codigo: int, cuerpo: Dict):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def _atender(self, parametros: Dict):
+        ruta = urlparse(self.path).path.rstrip("/") or "/salud"
+        consulta = RUTAS.get(ruta)
+        if consulta is None:
+            self._responder(404, {"error": f"❌ Ruta desconocida: {ruta}",
+                                  "rutas": sorted(RUTAS)})
+            return
+
+        instrumentacion.contar(f"servicio.consultas{ruta.replace('/', '.')}")
+        try:
+            with instrumentacion.medir(f"servicio{ruta.replace('/', '.')}"):
+                cuerpo = consulta(self.estado, parametros)
+        except ErrorConsulta as e:
+            self._responder(400, {"error": str(e)})
+        except Exception as e:
+            self._responder(500, {"error": f"❌ {type(e).__name__}: {e}"})
+        else:
+            self._responder(200, cuerpo)
+
+    def do_GET(self):
+        parametros = {clave: valores[-1]
+                      for clave, valores in parse_qs(urlparse(self.path).query).items()}
+        self._atender(parametros)
+
+    def do_POST(self):
+        largo = int(self.headers.get("Content-Length") or 0)
+        try:
+            parametros = json.loads(self.rfile.read(largo) or b"{}")
+        except ValueError:
+            self._responder(400, {"error": "❌ El cuerpo no es JSON válido"})
+            return
+        if not isinstance(parametros, dict):
+            self._responder(400, {"error": "❌ El cuerpo debe ser un objeto JSON"})
+            return
+        self._atender(parametros)
+
+    def log_message(self, formato, *args):
+        if not self.silencioso:
+            super().log_message(formato, *args)
+
+
+def crear_servidor(estado: EstadoServicio, host: str = HOST_DEFAULT,
+                   puerto: int = PUERTO_DEFAULT, silencioso: bool = False) -> ThreadingHTTPServer:
+    """
+    Servidor HTTP (un hilo por conexión) sobre un estado ya cargado.
+
+    Con `puerto=0` el sistema elige uno libre (ver `servidor.server_address`).
+    """
+    manejador = type("Manejador", (ManejadorSiembra,),
+                     {"estado": estado, "silencioso": silencioso})
+    # La cola de escucha default (5) hace esperar ~1 s a los clientes que se
+    # conectan en ráfaga
+    clase = type("Servidor", (ThreadingHTTPServer,), {"request_queue_size": 128})
+    servidor = clase((host, puerto), manejador)
+    servidor.daemon_threads = True
+    return servidor
+
+
+def servir(host: str = HOST_DEFAULT, puerto: int = PUERTO_DEFAULT, **opciones_estado):
+    """Carga el estado y atiende consultas hasta Ctrl+C."""
+    estado = EstadoServicio(**opciones_estado)
+    servidor = crear_servidor(estado, host, puerto)
+    host, puerto = servidor.server_address[:2]
+    print(f"✅ Estado cargado en {estado.tiempo_arranque:.2f} s "
+          f"({estado.motor.n_dias} días, {len(estado.perfiles)} perfiles)")
+    print(f"🌱 Servicio de siembra en http://{host}:{puerto} (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
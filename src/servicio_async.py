@@ -0,0 +1,316 @@
+"""
+Frente asyncio del servicio de puntuación con agrupación de consultas.
+
+Con muchos clientes, casi todas las consultas son pequeñas: un día, una
+ventana. Atender cada una por separado cuesta una llamada al motor difuso
+por consulta, y el costo fijo de esa llamada (validar, preparar arreglos,
+recorrer las reglas) domina. Aquí las consultas que llegan dentro de una
+ventana corta (`ventana`, 2 ms por defecto) se juntan en UNA llamada
+vectorizada y cada resultado se entrega a quien lo pidió:
+
+    consulta ─┐
+    consulta ─┼─► Coalescedor ──(≤ ventana o max_lote)──► evaluar_lote(...)
+    consulta ─┘        ▲                                      │
+                       └────────── futuro de cada una ◄───────┘
+
+Así el trabajo crece con el número de lotes y no con el de consultas, a
+cambio de como máximo `ventana` segundos de espera extra por consulta.
+
+Las rutas y respuestas son las de src/servicio.py. /puntuar-dia (un día) y
+/puntuar-ventana pasan por el agrupador; las demás corren en un hilo aparte
+para no bloquear el ciclo de eventos.
+
+    python -m src serve --asincrono --ventana-ms 2 --max-lote 1024
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from src import instrumentacion
+from src.servicio import (HOST_DEFAULT, PUERTO_DEFAULT, RUTAS, ErrorConsulta, EstadoServicio,
+                          _validar_finitos, _valor_json)
+
+MENSAJES_HTTP = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                 413: "Payload Too Large", 500: "Internal Server Error"}
+MAX_CUERPO = 1 << 20
+
+
+class Coalescedor:
+    """
+    Junta las llamadas concurrentes a `enviar` en lotes para `funcion_lote`.
+
+    Args:
+        funcion_lote (callable): Recibe la lista de argumentos del lote y
+            regresa una lista de resultados del mismo largo y orden.
+        ventana (float): Segundos que espera el lote a más consultas desde
+            que llega la primera.
+        max_lote (int): Un lote que llega a este tamaño se despacha sin
+            esperar a que termine la ventana.
+        ejecutor (Executor): Dónde corre `funcion_lote` (default: un hilo
+            propio, así los lotes nunca se ejecutan en paralelo).
+        nombre (str): Prefijo de las métricas de instrumentación.
+    """
+
+    def __init__(self, funcion_lote: Callable[[List], Sequence], ventana: float = 0.002,
+                 max_lote: int = 1024, ejecutor=None, nombre: str = "lote"):
+        if max_lote < 1:
+            raise ValueError("❌ max_lote debe ser al menos 1")
+        self.funcion_lote = funcion_lote
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self.ejecutor = ejecutor or ThreadPoolExecutor(max_workers=1,
+                                                       thread_name_prefix=f"coalescedor-{nombre}")
+        self.nombre = nombre
+        self._pendientes: List = []
+        self._temporizador = None
+        self.lotes = 0
+        self.consultas = 0
+
+    async def enviar(self, argumento):
+        """Encola `argumento` y espera su resultado (o la excepción del lote)."""
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendientes.append((argumento, futuro))
+        if len(self._pendientes) >= self.max_lote:
+            self._despachar()
+        elif self._temporizador is None:
+            self._temporizador = loop.call_later(self.ventana, self._despachar)
+        return await futuro
+
+    def _despachar(self):
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        lote, self._pendientes = self._pendientes, []
+        if lote:
+            asyncio.get_running_loop().create_task(self._resolver(lote))
+
+    async def _resolver(self, lote):
+        argumentos = [argumento for argumento, _ in lote]
+        self.lotes += 1
+        self.consultas += len(lote)
+        instrumentacion.contar(f"{self.nombre}.lotes")
+        instrumentacion.contar(f"{self.nombre}.consultas", len(lote))
+
+        loop = asyncio.get_running_loop()
+        try:
+            resultados = await loop.run_in_executor(self.ejecutor, self.funcion_lote, argumentos)
+        except Exception as e:
+            for _, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        for (_, futuro), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+    @property
+    def tamano_medio(self) -> float:
+        return self.consultas / self.lotes if self.lotes else 0.0
+
+    def cerrar(self):
+        self.ejecutor.shutdown(wait=False)
+
+
+class FrenteAsincrono:
+    """
+    Rutas del servicio sobre un EstadoServicio, con /puntuar-dia y
+    /puntuar-ventana agrupadas en lotes.
+
+    Args:
+        estado (EstadoServicio): Estado residente ya cargado.
+        ventana (float): Ventana de agrupación en segundos.
+        max_lote (int): Tamaño máximo de lote.
+    """
+
+    def __init__(self, estado: EstadoServicio, ventana: float = 0.002, max_lote: int = 1024):
+        self.estado = estado
+        self.dias = Coalescedor(self._puntuar_dias, ventana, max_lote, nombre="servicio.dias")
+        self.ventanas = Coalescedor(self._puntuar_ventanas, ventana, max_lote,
+                                    nombre="servicio.ventanas")
+        self._ejecutor = ThreadPoolExecutor(thread_name_prefix="servicio-rutas")
+
+    # --- FUNCIONES DE LOTE ---
+
+    def _puntuar_dias(self, consultas: List) -> List[Dict]:
+        """consultas: [(dia | None, temperatura, lluvia)]."""
+        from src.fuzzy.fuzzy_system import clasificar_lote
+
+        estado = self.estado
+        temps = np.array([t for _, t, _ in consultas], dtype=float)
+        lluvias = np.array([l for _, _, l in consultas], dtype=float)
+        # Las consultas con listas siguen pasando por EstadoServicio.puntuar_dia
+        # en otro hilo: el motor difuso guarda estado y se usa con su candado
+        with estado._candado_difuso:
+            scores, _ = estado.motor_difuso.evaluar_lote(temps, lluvias, politica=estado.politica)
+        # Mismo redondeo que `evaluar` y `evaluar_bloques`
+        scores = np.round(scores, 2)
+        categorias, recomendaciones = clasificar_lote(scores)
+
+        resultados = []
+        for (dia, t, l), s, c, r in zip(consultas, scores, categorias, recomendaciones):
+            resultado = {"score_amplitud": _valor_json(s),
+                         "categoria": str(c), "recomendacion": str(r),
+                         "inputs": {"temperatura": _valor_json(t),
+                                    "precipitacion": _valor_json(l)}}
+            if dia is not None:
+                resultado.update(dia=dia, fecha=estado._fecha(dia))
+            resultados.append(resultado)
+        return resultados
+
+    def _puntuar_ventanas(self, consultas: List) -> List[Dict]:
+        """consultas: [(perfil, dia)]; una lectura vectorizada por perfil."""
+        aptitudes = np.empty(len(consultas))
+        perfiles = np.array([perfil for perfil, _ in consultas])
+        dias = np.array([dia for _, dia in consultas])
+        for perfil in set(perfiles.tolist()):
+            indices = np.flatnonzero(perfiles == perfil)
+            aptitudes[indices] = self.estado.motor.puntuar_perfil(perfil)[dias[indices] - 1]
+        return [{"perfil": perfil, "dia_siembra": int(dia), "fecha": self.estado._fecha(dia),
+                 "aptitud": float(aptitud)}
+                for (perfil, dia), aptitud in zip(consultas, aptitudes)]
+
+    # --- CONSULTAS ---
+
+    async def puntuar_dia(self, parametros: Dict) -> Dict:
+        estado = self.estado
+        if "dia" in parametros:
+            dia = estado._dia(parametros["dia"], estado.motor.n_dias)
+            consulta = (dia, estado.temps[dia - 1], estado.lluvias[dia - 1])
+        elif np.ndim(parametros.get("temperatura")) == 0 and "lluvia" in parametros:
+            try:
+                consulta = (None, float(parametros["temperatura"]), float(parametros["lluvia"]))
+            except (TypeError, ValueError):
+                raise ErrorConsulta("❌ temperatura y lluvia deben ser numéricas")
+            _validar_finitos(consulta[1], consulta[2])
+        else:
+            # Listas: ya son un lote, no hace falta agruparlas
+            return await self._en_hilo(EstadoServicio.puntuar_dia, parametros)
+        return await self.dias.enviar(consulta)
+
+    async def puntuar_ventana(self, parametros: Dict) -> Dict:
+        estado = self.estado
+        perfil = estado._perfil(parametros.get("perfil"))
+        dia = estado._dia(parametros.get("dia"), estado.motor.puntuar_perfil(perfil).size)
+        return await self.ventanas.enviar((perfil, dia))
+
+    async def _en_hilo(self, consulta, parametros: Dict) -> Dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._ejecutor, consulta, self.estado, parametros)
+
+    async def atender(self, ruta: str, parametros: Dict):
+        """(código HTTP, cuerpo) de una consulta."""
+        ruta = ruta.rstrip("/") or "/salud"
+        if ruta not in RUTAS:
+            return 404, {"error": f"❌ Ruta desconocida: {ruta}", "rutas": sorted(RUTAS)}
+
+        instrumentacion.contar(f"servicio.consultas{ruta.replace('/', '.')}")
+        try:
+            if ruta == "/puntuar-dia":
+                return 200, await self.puntuar_dia(parametros)
+            if ruta == "/puntuar-ventana":
+                return 200, await self.puntuar_ventana(parametros)
+            cuerpo = await self._en_hilo(RUTAS[ruta], parametros)
+            if ruta == "/salud":
+                cuerpo["lotes"] = {c.nombre: {"lotes": c.lotes, "consultas": c.consultas,
+                                              "tamano_medio": c.tamano_medio}
+                                   for c in (self.dias, self.ventanas)}
+            return 200, cuerpo
+        except ErrorConsulta as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            return 500, {"error": f"❌ {type(e).__name__}: {e}"}
+
+    # --- HTTP ---
+
+    async def _conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Atiende peticiones HTTP/1.1 (keep-alive) en una conexión."""
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea.strip():
+                    break
+                metodo, destino, _ = linea.decode('latin-1').split(" ", 2)
+
+                cabeceras = {}
+                while (linea := await lector.readline()) not in (b"\r\n", b"\n", b""):
+                    clave, _, valor = linea.decode('latin-1').partition(":")
+                    cabeceras[clave.strip().lower()] = valor.strip()
+
+                url = urlparse(destino)
+                codigo, cuerpo = 400, {"error": f"❌ Método no soportado: {metodo}"}
+                if metodo == "GET":
+                    parametros = {clave: valores[-1] for clave, valores in parse_qs(url.query).items()}
+                    codigo, cuerpo = await self.atender(url.path, parametros)
+                elif metodo == "POST":
+                    largo = int(cabeceras.get("content-length") or 0)
+                    if largo > MAX_CUERPO:
+                        codigo, cuerpo = 413, {"error": "❌ Cuerpo demasiado grande"}
+                    else:
+                        try:
+                            parametros = json.loads(await lector.readexactly(largo) or b"{}")
+                        except ValueError:
+                            parametros = None
+                        if isinstance(parametros, dict):
+                            codigo, cuerpo = await self.atender(url.path, parametros)
+                        else:
+                            codigo, cuerpo = 400, {"error": "❌ El cuerpo debe ser un objeto JSON"}
+
+                datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+                cerrar = cabeceras.get("connection", "").lower() == "close"
+                escritor.write(
+                    f"HTTP/1.1 {codigo} {MENSAJES_HTTP[codigo]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(datos)}\r\n"
+                    f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n".encode('latin-1')
+                    + datos)
+                await escritor.drain()
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host: str = HOST_DEFAULT, puerto: int = PUERTO_DEFAULT):
+        """Servidor asyncio ya escuchando (con `puerto=0` se elige uno libre)."""
+        return await asyncio.start_server(self._conexion, host, puerto)
+
+    def cerrar(self):
+        self.dias.cerrar()
+        self.ventanas.cerrar()
+        self._ejecutor.shutdown(wait=False)
+
+
+def servir_asincrono(host: str = HOST_DEFAULT, puerto: int = PUERTO_DEFAULT,
+                     ventana: float = 0.002, max_lote: int = 1024, **opciones_estado):
+    """Carga el estado y atiende consultas con el frente asyncio hasta Ctrl+C."""
+    estado = EstadoServicio(**opciones_estado)
+    frente = FrenteAsincrono(estado, ventana, max_lote)
+
+    async def principal():
+        servidor = await frente.iniciar(host, puerto)
+        direccion = servidor.sockets[0].getsockname()
+        print(f"✅ Estado cargado en {estado.tiempo_arranque:.2f} s "
+              f"({estado.motor.n_dias} días, {len(estado.perfiles)} perfiles)")
+        print(f"🌱 Servicio asíncrono en http://{direccion[0]}:{direccion[1]} "
+              f"(lotes de hasta {max_lote} en {ventana * 1e3:g} ms; Ctrl+C para detener)")
+        async with servidor:
+            await servidor.serve_forever()
+
+    inicio = time.perf_counter()
+    try:
+        asyncio.run(principal())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        frente.cerrar()
+        for c in (frente.dias, frente.ventanas):
+            print(f"   {c.nombre}: {c.consultas} consultas en {c.lotes} lotes "
+                  f"(media {c.tamano_medio:.1f}) en {time.perf_counter() - inicio:.0f} s")
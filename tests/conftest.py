@@ -0,0 +1,15 @@
+"""
+Configuración común de las pruebas.
+
+Se corren desde la raíz del proyecto:
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+# Agregamos la ruta del proyecto (igual que los scripts de benchmarks/)
+RUTA_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RUTA_PROYECTO not in sys.path:
+    sys.path.insert(0, RUTA_PROYECTO)
@@ -0,0 +1,89 @@
+"""Arranque en caliente de los optimizadores con semillas en varias formas."""
+
+import numpy as np
+import pytest
+
+from src.optimization.arranque import poblacion_inicial, resolver_poblacion
+from src.optimization.espacio_decision import EspacioDecision
+from src.optimization.motor_puntuacion import MotorPuntuacion
+from src.optimization.perfiles_cultivo import PERFILES
+
+
+@pytest.fixture(scope="module")
+def motor():
+    return MotorPuntuacion(np.random.default_rng(3).uniform(0, 100, 365))
+
+
+@pytest.fixture(scope="module")
+def espacio(motor):
+    return EspacioDecision([PERFILES["maiz_120"]], motor=motor)
+
+
+@pytest.mark.parametrize("semillas", [
+    [80, 90],
+    (80, 90),
+    np.array([80, 90]),
+    np.atleast_1d(np.array([80, 90])),
+    np.array([[80], [90]]),
+])
+def test_semillas_en_la_poblacion(espacio, semillas):
+    poblacion = resolver_poblacion(espacio, 20, semillas=semillas)
+    assert poblacion.shape == (20, 1)
+    assert {80, 90} <= set(poblacion[:2, 0].tolist())
+    assert poblacion.min() >= 1 and poblacion.max() <= espacio.dia_maximo
+
+
+@pytest.mark.parametrize("semillas", [None, (), [], np.array([], dtype=int),
+                                      np.atleast_1d([])])
+def test_sin_semillas_arranque_aleatorio(espacio, semillas):
+    assert resolver_poblacion(espacio, 20, semillas=semillas) is None
+
+
+def test_picos_sin_semillas(espacio):
+    poblacion = resolver_poblacion(espacio, 20, semillas=np.array([], dtype=int), picos=3)
+    assert poblacion.shape == (20, 1)
+
+
+def test_cromosomas_completos(motor):
+    espacio = EspacioDecision([PERFILES["maiz_120"], PERFILES["frijol_90"]],
+                              segunda_siembra=True, motor=motor)
+    semillas = np.array([[80, 1, 0], [100, 0, 130]])
+    poblacion = poblacion_inicial(espacio, 10, semillas, semilla_aleatoria=0)
+    np.testing.assert_array_equal(poblacion[:2], semillas)
+
+
+def test_poblacion_explicita_con_forma_incorrecta(espacio):
+    with pytest.raises(ValueError):
+        resolver_poblacion(espacio, 20, poblacion=np.ones((5, 1)))
+
+
+@pytest.mark.parametrize("modulo", ["src.optimization.algoritmo_genetico",
+                                    "src.optimization.algoritmo_pso"])
+def test_optimizadores_con_semillas_de_numpy(motor, modulo):
+    import importlib
+
+    optimizar = importlib.import_module(modulo).optimizar
+    for semillas in (np.atleast_1d([80, 90]), np.atleast_1d([])):
+        resultado = optimizar("maiz_120", semillas=semillas, motor=motor, semilla=1)
+        assert 1 <= resultado.mejor_dia <= PERFILES["maiz_120"].ultimo_dia_siembra
+
+
+def _sin_tiempo(resultado):
+    datos = resultado.a_dict(incluir_paisaje=True)
+    datos.pop("tiempo")
+    return datos
+
+
+@pytest.mark.parametrize("modulo", ["src.optimization.algoritmo_genetico",
+                                    "src.optimization.algoritmo_pso"])
+def test_arranque_sembrado_reproducible(motor, modulo):
+    import importlib
+
+    from src.optimization.convergencia import CriterioParada
+
+    optimizar = importlib.import_module(modulo).optimizar
+    # Con paro temprano el número de evaluaciones depende de toda la población
+    corridas = [optimizar("maiz_120", CriterioParada(), semillas=[100], motor=motor, semilla=3,
+                          con_paisaje=True)
+                for _ in range(2)]
+    assert _sin_tiempo(corridas[0]) == _sin_tiempo(corridas[1])
@@ -0,0 +1,24 @@
+"""Validación de argumentos de la línea de comandos."""
+
+import pytest
+
+from src.cli import main
+
+
+@pytest.mark.parametrize("argv", [
+    ["score", "--motor", "skfuzzy", "--politica", "extrapolate"],
+    ["score", "--motor", "memo", "--politica", "extrapolate"],
+    ["score", "--motor", "tabulado", "--politica", "extrapolate"],
+    ["pipeline", "--motor", "skfuzzy", "--politica", "extrapolate", "--estado"],
+    ["serve", "--motor", "memo", "--politica", "extrapolate"],
+])
+def test_politica_no_soportada_por_el_motor(argv, capsys):
+    with pytest.raises(SystemExit) as salida:
+        main(argv)
+    assert salida.value.code == 2
+    assert "no admite --politica extrapolate" in capsys.readouterr().err
+
+
+def test_extrapolate_con_motor_vectorizado(capsys):
+    assert main(["pipeline", "--politica", "extrapolate", "--estado"]) == 0
+    assert "score" in capsys.readouterr().out
@@ -0,0 +1,85 @@
+"""Exportación en flujo de resultados (.npy con encabezado reescrito, NDJSON, CSV)."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.fuzzy.flujo_evaluacion import (escribir_resultados_npy, evaluar_bloques,
+                                        exportar_resultados)
+from src.fuzzy.resultados import DTYPE_RESULTADO, crear_lote, lote_a_dicts
+
+
+@pytest.fixture(scope="module")
+def bloques():
+    rng = np.random.default_rng(11)
+    salida = []
+    for n in (5, 0, 7):
+        fechas = np.arange('2026-01-01', n + 1, dtype='datetime64[D]')[:n] if n else \
+            np.array([], dtype='datetime64[D]')
+        temps = rng.uniform(5, 45, n)
+        lluvias = rng.uniform(0, 45, n)
+        salida.append((fechas, temps, lluvias))
+    return salida
+
+
+def test_npy_se_recarga_completo(tmp_path, bloques):
+    ruta = str(tmp_path / "resultados.npy")
+    resultados = list(evaluar_bloques(bloques))
+    assert escribir_resultados_npy(resultados, ruta) == 12
+
+    lote = np.load(ruta)
+    assert lote.dtype == DTYPE_RESULTADO and lote.shape == (12,)
+    np.testing.assert_allclose(lote['score_amplitud'],
+                               np.concatenate([r["score_amplitud"] for r in resultados]))
+    np.testing.assert_array_equal(lote['codigo'],
+                                  np.concatenate([r["codigo"] for r in resultados]))
+    # Lectura con memmap: el encabezado describe exactamente los datos
+    assert np.load(ruta, mmap_mode='r').shape == (12,)
+
+
+def test_npy_legible_mientras_se_escribe(tmp_path):
+    ruta = str(tmp_path / "parcial.npy")
+    vistos = []
+
+    def bloques_con_lectura():
+        for i in range(3):
+            if i:
+                # Antes de cada bloque, el archivo ya tiene el encabezado al día
+                vistos.append(np.load(ruta).shape[0])
+            yield crear_lote(np.full(4, 50.0 + i), np.full(4, 20.0), np.full(4, 5.0))
+
+    assert escribir_resultados_npy(bloques_con_lectura(), ruta) == 12
+    assert vistos == [4, 8]
+    assert np.load(ruta).shape == (12,)
+
+
+def test_npy_vacio(tmp_path):
+    ruta = str(tmp_path / "vacio.npy")
+    assert escribir_resultados_npy([], ruta) == 0
+    lote = np.load(ruta)
+    assert lote.shape == (0,) and lote.dtype == DTYPE_RESULTADO
+
+
+def test_ndjson_igual_a_lote_a_dicts(tmp_path, bloques):
+    ruta = str(tmp_path / "resultados.ndjson")
+    resultados = list(evaluar_bloques(bloques))
+    exportar_resultados(resultados, ruta)
+
+    with open(ruta, encoding='utf-8') as f:
+        lineas = [json.loads(linea) for linea in f]
+    lote = crear_lote(np.concatenate([r["score_amplitud"] for r in resultados]),
+                      np.concatenate([r["temperatura"] for r in resultados]),
+                      np.concatenate([r["precipitacion"] for r in resultados]),
+                      np.concatenate([r["fecha"] for r in resultados]))
+    esperado = lote_a_dicts(lote)
+    assert len(lineas) == len(esperado) == 12
+    for linea, dia in zip(lineas, esperado):
+        assert linea["categoria"] == dia["categoria"]
+        assert linea["fecha"] == dia["fecha"]
+        assert linea["score_amplitud"] == pytest.approx(dia["score_amplitud"])
+
+
+def test_formato_desconocido(tmp_path):
+    with pytest.raises(ValueError):
+        exportar_resultados([], str(tmp_path / "resultados.xyz"))
@@ -0,0 +1,42 @@
+"""Memo cuantizado de la evaluación difusa de un día contra la referencia skfuzzy."""
+
+import numpy as np
+import pytest
+
+from src.fuzzy.motor_vectorizado import RANGO_LLUVIA, RANGO_TEMPERATURA
+from src.fuzzy.motores import MotorReferencia, crear_motor
+
+
+@pytest.fixture(scope="module")
+def sistema():
+    from src.fuzzy.fuzzy_system import SistemaDifusoSiembra
+    return SistemaDifusoSiembra()
+
+
+@pytest.fixture(scope="module")
+def muestras():
+    """Días al azar en todo el dominio (semilla fija)."""
+    rng = np.random.default_rng(2026)
+    return rng.uniform(*RANGO_TEMPERATURA, 300), rng.uniform(*RANGO_LLUVIA, 300)
+
+
+def test_memo_dentro_de_tolerancia(sistema, muestras):
+    temps, lluvias = muestras
+    referencia, _ = MotorReferencia(sistema).evaluar_lote(temps, lluvias)
+    memo = crear_motor("memo", sistema)
+    scores, _ = memo.evaluar_lote(temps, lluvias)
+    # Cota documentada en memo_difuso.py para la rejilla por defecto
+    assert np.abs(scores - referencia).max() <= 0.1
+    # Segunda pasada: todo sale de la caché y da lo mismo
+    de_nuevo, _ = memo.evaluar_lote(temps, lluvias)
+    np.testing.assert_array_equal(de_nuevo, scores)
+
+
+def test_memo_nodos_exactos(sistema):
+    # En un nodo de la rejilla no hay interpolación: coincide con evaluar
+    sistema.activar_memo()
+    try:
+        memo = sistema.evaluar(24.0, 30.0)["score_amplitud"]
+    finally:
+        sistema.desactivar_memo()
+    assert memo == pytest.approx(sistema.evaluar(24.0, 30.0)["score_amplitud"], abs=0.01)
@@ -0,0 +1,91 @@
+"""Sumas por ventana, tablas de fitness y correlación por kernel del motor de puntuación."""
+
+import numpy as np
+import pytest
+
+from src.optimization.motor_puntuacion import (PENALIZACION, MotorPuntuacion,
+                                               correlacionar_kernel, puntuar_aptitud)
+from src.optimization.perfiles_cultivo import PERFILES, PerfilCultivo
+
+
+@pytest.fixture(scope="module")
+def aptitud():
+    return np.random.default_rng(7).uniform(0, 100, 365)
+
+
+def test_sumas_ventana_contra_suma_explicita(aptitud):
+    motor = MotorPuntuacion(aptitud)
+    inicios = np.array([0, 17, 240, 300, 364, 400])
+    # Las ventanas que pasan del final se truncan; las que empiezan después suman 0
+    esperado = [aptitud[s:s + 120].sum() for s in inicios]
+    np.testing.assert_allclose(motor.sumas_ventana(inicios, 120), esperado)
+
+
+def test_puntuar_perfil_igual_a_sumas_ventana(aptitud):
+    motor = MotorPuntuacion(aptitud)
+    perfil = PERFILES["maiz_120"]
+    tabla = motor.puntuar_perfil(perfil)
+    assert tabla.size == perfil.ultimo_dia_siembra
+    np.testing.assert_allclose(tabla, motor.sumas_ventana(np.arange(tabla.size), perfil.duracion))
+    dia = int(np.argmax(tabla)) + 1
+    assert motor.mejores_dias([perfil])[perfil.nombre] == (dia, float(tabla[dia - 1]))
+
+
+def test_fitness_fuera_de_rango_y_sin_datos():
+    motor = MotorPuntuacion(np.ones(100))
+    perfil = PERFILES["maiz_120"]
+    assert motor.fitness(0, perfil) == PENALIZACION
+    assert motor.fitness(perfil.ultimo_dia_siembra + 1, perfil) == PENALIZACION
+    # Días de siembra sin pronóstico: misma penalización
+    assert motor.fitness(150, perfil) == PENALIZACION
+    assert motor.fitness(1, perfil) == 100.0
+
+
+def test_tabla_perfiles_rellena_con_penalizacion(aptitud):
+    motor = MotorPuntuacion(aptitud)
+    nombres, matriz = motor.tabla_perfiles(["maiz_120", "maiz_precoz_90"])
+    assert nombres == ["maiz_120", "maiz_precoz_90"]
+    assert matriz.shape == (2, 270)
+    assert (matriz[0, 240:] == PENALIZACION).all()
+    np.testing.assert_array_equal(matriz[1], motor.puntuar_perfil("maiz_precoz_90"))
+
+
+@pytest.mark.parametrize("largo", [5, 63, 64, 150])
+def test_fft_igual_a_directo(aptitud, largo):
+    kernel = np.random.default_rng(largo).uniform(0, 2, largo)
+    directo = correlacionar_kernel(aptitud, kernel, 300, metodo="directo")
+    fft = correlacionar_kernel(aptitud, kernel, 300, metodo="fft")
+    np.testing.assert_allclose(fft, directo, rtol=1e-9, atol=1e-7)
+
+
+def test_fft_igual_a_directo_varios_sitios(aptitud):
+    sitios = np.vstack([aptitud, aptitud[::-1], np.zeros_like(aptitud)])
+    kernel = np.linspace(0.5, 1.5, 120)
+    directo = correlacionar_kernel(sitios, kernel, 240, metodo="directo")
+    fft = correlacionar_kernel(sitios, kernel, 240, metodo="fft")
+    assert fft.shape == (3, 240)
+    np.testing.assert_allclose(fft, directo, rtol=1e-9, atol=1e-7)
+
+
+def test_correlacion_contra_suma_explicita(aptitud):
+    kernel = np.arange(1.0, 11.0)
+    # Inicios cerca del final: la ventana se trunca (los días faltantes valen 0)
+    n_inicios = aptitud.size
+    esperado = [sum(k * aptitud[s + j] for j, k in enumerate(kernel) if s + j < aptitud.size)
+                for s in range(n_inicios)]
+    for metodo in ("directo", "fft"):
+        np.testing.assert_allclose(correlacionar_kernel(aptitud, kernel, n_inicios, metodo),
+                                   esperado, atol=1e-7)
+
+
+def test_metodo_desconocido(aptitud):
+    with pytest.raises(ValueError):
+        correlacionar_kernel(aptitud, [1.0], 10, metodo="otro")
+
+
+def test_kernel_igual_a_etapas(aptitud):
+    # Mismos pesos por etapa: sumas prefijo vs. correlación con el kernel diario
+    por_etapas = PerfilCultivo("etapas", duracion=100, etapas=((30, 0.5), (40, 1.5), (30, 1.0)))
+    por_kernel = PerfilCultivo("kernel", duracion=100, pesos=tuple(por_etapas.pesos_diarios()))
+    np.testing.assert_allclose(puntuar_aptitud(aptitud, por_kernel),
+                               puntuar_aptitud(aptitud, por_etapas), atol=1e-7)
@@ -0,0 +1,60 @@
+"""Equivalencia del motor vectorizado contra la referencia skfuzzy."""
+
+import numpy as np
+import pytest
+
+from src.fuzzy.motor_vectorizado import RANGO_LLUVIA, RANGO_TEMPERATURA
+from src.fuzzy.motores import MotorReferencia, crear_motor
+
+
+@pytest.fixture(scope="module")
+def sistema():
+    from src.fuzzy.fuzzy_system import SistemaDifusoSiembra
+    return SistemaDifusoSiembra()
+
+
+@pytest.fixture(scope="module")
+def muestras():
+    """Rejilla gruesa de todo el dominio más días al azar (semilla fija)."""
+    malla_t, malla_p = np.meshgrid(np.linspace(*RANGO_TEMPERATURA, 21),
+                                   np.linspace(*RANGO_LLUVIA, 19), indexing='ij')
+    rng = np.random.default_rng(2026)
+    temps = np.concatenate([malla_t.ravel(), rng.uniform(*RANGO_TEMPERATURA, 200)])
+    lluvias = np.concatenate([malla_p.ravel(), rng.uniform(*RANGO_LLUVIA, 200)])
+    return temps, lluvias
+
+
+@pytest.mark.parametrize("sin_activacion", ["fallback", "cero"])
+def test_vectorizado_igual_a_skfuzzy(sistema, muestras, sin_activacion):
+    temps, lluvias = muestras
+    referencia, _ = MotorReferencia(sistema).evaluar_lote(temps, lluvias,
+                                                          sin_activacion=sin_activacion)
+    scores, _ = crear_motor("vectorizado", sistema).evaluar_lote(temps, lluvias,
+                                                                 sin_activacion=sin_activacion)
+    np.testing.assert_allclose(scores, referencia, atol=1e-6)
+
+
+def test_vectorizado_igual_a_evaluar(sistema, muestras):
+    temps, lluvias = muestras
+    esperados = [sistema.evaluar(t, p)["score_amplitud"] for t, p in zip(temps[:60], lluvias[:60])]
+    scores, _ = sistema.evaluar_lote(temps[:60], lluvias[:60])
+    np.testing.assert_allclose(scores, esperados, atol=1e-9)
+
+
+def test_politicas_fuera_de_rango(sistema):
+    motor = crear_motor("vectorizado", sistema)
+    temps = np.array([2.0, 25.0, 50.0, np.nan])
+    lluvias = np.array([10.0, 60.0, 10.0, 10.0])
+
+    recortado, contadores = motor.evaluar_lote(temps, lluvias, politica="clip")
+    borde, _ = motor.evaluar_lote(np.array([5.0, 25.0, 45.0]), np.array([10.0, 45.0, 10.0]))
+    np.testing.assert_allclose(recortado[:3], borde)
+    assert np.isnan(recortado[3])
+    assert contadores["evaluados"] == 4
+
+    cero, _ = motor.evaluar_lote(temps, lluvias, politica="zero")
+    np.testing.assert_array_equal(cero[:3], 0.0)
+
+    sin_dato, _ = motor.evaluar_lote(temps, lluvias, politica="nan")
+    assert np.isnan(sin_dato).all()
+
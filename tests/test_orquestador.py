@@ -0,0 +1,121 @@
+"""Invalidación de etapas del orquestador por contenido de entradas y código."""
+
+import inspect
+import os
+import re
+
+import pytest
+
+from src import orquestador
+from src.orquestador import Etapa, Orquestador
+
+
+def _escribir(ruta, texto):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(texto)
+
+
+@pytest.fixture
+def proyecto(tmp_path, monkeypatch):
+    """Proyecto mínimo con dos etapas encadenadas: doble → suma."""
+    raiz = str(tmp_path)
+    _escribir(os.path.join(raiz, "entrada.txt"), "1 2 3")
+    _escribir(os.path.join(raiz, "src", "doble.py"), "FACTOR = 2\n")
+    _escribir(os.path.join(raiz, "src", "suma.py"), "# suma\n")
+    corridas = []
+
+    def doble(orq):
+        corridas.append("doble")
+        with open(orq.ruta("entrada.txt"), encoding='utf-8') as f:
+            numeros = [2 * int(x) for x in f.read().split()]
+        _escribir(orq.ruta("doble.txt"), " ".join(map(str, numeros)))
+
+    def suma(orq):
+        corridas.append("suma")
+        with open(orq.ruta("doble.txt"), encoding='utf-8') as f:
+            total = sum(int(x) for x in f.read().split())
+        _escribir(orq.ruta("suma.txt"), str(total + orq.parametros["extra"]))
+
+    etapas = [
+        Etapa("doble", ["entrada.txt"], ["doble.txt"], [os.path.join("src", "doble.py")], doble),
+        Etapa("suma", ["doble.txt"], ["suma.txt"], [os.path.join("src", "suma.py")], suma,
+              ["extra"]),
+    ]
+    monkeypatch.setattr(orquestador, "ETAPAS", etapas)
+    monkeypatch.setattr(orquestador, "NOMBRES_ETAPAS", [e.nombre for e in etapas])
+    monkeypatch.setattr(orquestador, "PARAMETROS_DEFAULT", {"extra": 0})
+    return raiz, corridas
+
+
+def test_segunda_corrida_omite_todo(proyecto):
+    raiz, corridas = proyecto
+    assert Orquestador(raiz).correr("doble", "suma") == {"doble": "ejecutada", "suma": "ejecutada"}
+    assert Orquestador(raiz).correr("doble", "suma") == {"doble": "omitida", "suma": "omitida"}
+    assert corridas == ["doble", "suma"]
+
+
+def test_cambio_de_codigo_invalida_la_etapa(proyecto):
+    raiz, corridas = proyecto
+    Orquestador(raiz).correr("doble", "suma")
+
+    _escribir(os.path.join(raiz, "src", "suma.py"), "# suma, versión 2\n")
+    orq = Orquestador(raiz)
+    assert orq.motivo(orquestador.ETAPAS[0]) is None
+    assert "cambió el código" in orq.motivo(orquestador.ETAPAS[1])
+    assert orq.correr("doble", "suma") == {"doble": "omitida", "suma": "ejecutada"}
+
+
+def test_salida_identica_no_propaga(proyecto):
+    raiz, corridas = proyecto
+    Orquestador(raiz).correr("doble", "suma")
+
+    # Cambia el código de `doble` pero no su salida: `suma` sigue al día
+    _escribir(os.path.join(raiz, "src", "doble.py"), "FACTOR = 2  # mismo resultado\n")
+    assert Orquestador(raiz).correr("doble", "suma") == {"doble": "ejecutada", "suma": "omitida"}
+
+
+def test_cambio_de_entrada_y_parametros(proyecto):
+    raiz, corridas = proyecto
+    Orquestador(raiz).correr("doble", "suma")
+
+    _escribir(os.path.join(raiz, "entrada.txt"), "1 2 4")
+    assert Orquestador(raiz).correr("doble", "suma") == {"doble": "ejecutada", "suma": "ejecutada"}
+    with open(os.path.join(raiz, "suma.txt"), encoding='utf-8') as f:
+        assert f.read() == "14"
+
+    orq = Orquestador(raiz, {"extra": 1})
+    assert orq.motivo(orquestador.ETAPAS[1]) == "cambiaron los parámetros"
+
+
+def test_salida_modificada_a_mano(proyecto):
+    raiz, _ = proyecto
+    Orquestador(raiz).correr("doble", "suma")
+    _escribir(os.path.join(raiz, "suma.txt"), "0")
+    assert "fue modificada" in Orquestador(raiz).motivo(orquestador.ETAPAS[1])
+
+
+def test_etapa_score_cubre_umbrales_y_lector():
+    score = next(e for e in orquestador.ETAPAS if e.nombre == "score")
+    assert os.path.join("src", "fuzzy", "resultados.py") in score.codigo
+    assert os.path.join("src", "neural", "gestor_climatico.py") in score.codigo
+    for ruta in score.codigo:
+        assert os.path.isfile(os.path.join(orquestador.RUTA_PROYECTO, ruta)), ruta
+
+
+@pytest.mark.parametrize("etapa", orquestador.ETAPAS, ids=lambda e: e.nombre)
+def test_codigo_cubre_los_modulos_de_la_etapa(etapa):
+    # Cada módulo de src que importa la etapa (y lo que importa ese módulo
+    # de src al nivel superior) debe invalidarla; `from src import
+    # instrumentacion` sólo mide y no cambia las salidas
+    pendientes = re.findall(r"from src\.([\w.]+) import", inspect.getsource(etapa.ejecutar))
+    vistos = set()
+    while pendientes:
+        modulo = pendientes.pop()
+        ruta = os.path.join("src", *modulo.split(".")) + ".py"
+        if ruta in vistos:
+            continue
+        vistos.add(ruta)
+        assert ruta in etapa.codigo, f"{etapa.nombre}: falta {ruta}"
+        with open(os.path.join(orquestador.RUTA_PROYECTO, ruta), encoding='utf-8') as f:
+            pendientes += re.findall(r"^from src\.([\w.]+) import", f.read(), re.M)
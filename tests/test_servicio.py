@@ -0,0 +1,52 @@
+"""Consultas al estado del servicio HTTP con un pronóstico sintético."""
+
+import json
+
+import pytest
+
+from src.mocks import guardar_pronosticos_sinteticos
+from src.servicio import ErrorConsulta, EstadoServicio
+
+
+@pytest.fixture(scope="module")
+def estado(tmp_path_factory):
+    directorio = tmp_path_factory.mktemp("pronostico")
+    ruta, = guardar_pronosticos_sinteticos(str(directorio), semilla=5)
+    return EstadoServicio(ruta)
+
+
+def test_puntuar_dia_del_pronostico(estado):
+    resultado = estado.puntuar_dia({"dia": "10"})
+    assert resultado["dia"] == 10
+    assert resultado["inputs"]["temperatura"] == pytest.approx(estado.temps[9])
+    json.dumps(resultado, allow_nan=False)
+
+
+@pytest.mark.parametrize("temperatura", ["nan", "inf", "-inf", [20.0, "nan"]])
+def test_entradas_no_finitas_se_rechazan(estado, temperatura):
+    lluvia = [10.0, 10.0] if isinstance(temperatura, list) else "10"
+    with pytest.raises(ErrorConsulta):
+        estado.puntuar_dia({"temperatura": temperatura, "lluvia": lluvia})
+
+
+def test_puntuar_lista_es_json_estricto(estado):
+    resultado = estado.puntuar_dia({"temperatura": [2.0, 24.0], "lluvia": [10.0, 30.0]})
+    assert len(resultado["resultados"]) == 2
+    json.dumps(resultado, allow_nan=False)
+
+
+def test_frente_asincrono_rechaza_no_finitos(estado):
+    import asyncio
+
+    from src.servicio_async import FrenteAsincrono
+
+    async def principal():
+        frente = FrenteAsincrono(estado)
+        try:
+            with pytest.raises(ErrorConsulta):
+                await frente.puntuar_dia({"temperatura": "nan", "lluvia": "10"})
+            return await frente.puntuar_dia({"temperatura": "24", "lluvia": "30"})
+        finally:
+            frente.cerrar()
+
+    json.dumps(asyncio.run(principal()), allow_nan=False)
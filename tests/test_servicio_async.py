@@ -0,0 +1,86 @@
+"""Agrupación de consultas concurrentes del frente asyncio."""
+
+import asyncio
+
+import pytest
+
+from src.servicio_async import Coalescedor
+
+
+def _correr(corrutina):
+    return asyncio.run(corrutina)
+
+
+def test_cada_consulta_recibe_su_resultado():
+    lotes = []
+
+    def cuadrados(argumentos):
+        lotes.append(list(argumentos))
+        return [x * x for x in argumentos]
+
+    async def principal():
+        coalescedor = Coalescedor(cuadrados, ventana=0.05, max_lote=1000)
+        try:
+            return await asyncio.gather(*(coalescedor.enviar(i) for i in range(50))), coalescedor
+        finally:
+            coalescedor.cerrar()
+
+    resultados, coalescedor = _correr(principal())
+    assert resultados == [i * i for i in range(50)]
+    # Todas llegaron dentro de la ventana: un solo lote
+    assert len(lotes) == 1 and sorted(lotes[0]) == list(range(50))
+    assert coalescedor.lotes == 1 and coalescedor.tamano_medio == 50
+
+
+def test_max_lote_despacha_sin_esperar():
+    lotes = []
+
+    def identidad(argumentos):
+        lotes.append(len(argumentos))
+        return list(argumentos)
+
+    async def principal():
+        # Ventana larga: sólo el tamaño máximo puede despachar a tiempo
+        coalescedor = Coalescedor(identidad, ventana=10.0, max_lote=4)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(coalescedor.enviar(i) for i in range(8))), timeout=5)
+        finally:
+            coalescedor.cerrar()
+
+    assert _correr(principal()) == list(range(8))
+    assert lotes == [4, 4]
+
+
+def test_excepcion_del_lote_llega_a_todas():
+    def falla(argumentos):
+        raise ValueError("❌ lote inválido")
+
+    async def principal():
+        coalescedor = Coalescedor(falla, ventana=0.01)
+        try:
+            return await asyncio.gather(*(coalescedor.enviar(i) for i in range(3)),
+                                        return_exceptions=True)
+        finally:
+            coalescedor.cerrar()
+
+    errores = _correr(principal())
+    assert len(errores) == 3 and all(isinstance(e, ValueError) for e in errores)
+
+
+def test_lotes_sucesivos():
+    async def principal():
+        coalescedor = Coalescedor(lambda argumentos: [-x for x in argumentos], ventana=0.005)
+        try:
+            primero = await asyncio.gather(*(coalescedor.enviar(i) for i in range(3)))
+            segundo = await coalescedor.enviar(10)
+            return primero, segundo, coalescedor.lotes
+        finally:
+            coalescedor.cerrar()
+
+    assert _correr(principal()) == ([0, -1, -2], -10, 2)
+
+
+def test_max_lote_invalido():
+    with pytest.raises(ValueError):
+        Coalescedor(lambda argumentos: argumentos, max_lote=0)
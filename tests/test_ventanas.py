@@ -0,0 +1,54 @@
+"""Ventanas de entrenamiento armadas desde la serie diaria vs. el CSV de ventanas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.neural.preparacion_datos import (COLUMNAS_SERIE, VENTANA_DIAS, crear_dataset_ia,
+                                          indices_ventanas)
+
+
+def _serie(n_dias, semilla):
+    valores = np.random.default_rng(semilla).uniform(-1, 1, (n_dias, len(COLUMNAS_SERIE)))
+    return pd.DataFrame(valores.astype(np.float32), columns=COLUMNAS_SERIE)
+
+
+def _ventanas(serie, inicios):
+    """Lo mismo que arma crear_dataset_ventanas con tf.gather, en NumPy."""
+    dias = serie[inicios[:, None] + np.arange(VENTANA_DIAS + 1)]
+    return dias[:, :VENTANA_DIAS, :], dias[:, VENTANA_DIAS, :2]
+
+
+def test_ventanas_igual_al_csv():
+    df = _serie(200, 1)
+    csv = crear_dataset_ia(df, VENTANA_DIAS).to_numpy()
+    entrenamiento, validacion = indices_ventanas([len(df)])
+
+    # Mismo 80/20 cronológico que cargar_y_formatear_datos
+    corte = int(len(csv) * 0.8)
+    np.testing.assert_array_equal(entrenamiento, np.arange(corte))
+    np.testing.assert_array_equal(validacion, np.arange(corte, len(csv)))
+
+    x, y = _ventanas(df[COLUMNAS_SERIE].to_numpy(), np.concatenate([entrenamiento, validacion]))
+    np.testing.assert_allclose(x.reshape(len(x), -1), csv[:, :-2])
+    np.testing.assert_allclose(y, csv[:, -2:])
+
+
+def test_varias_series_no_cruzan_fronteras():
+    dfs = [_serie(100, 2), _serie(60, 3), _serie(10, 4)]
+    entrenamiento, validacion = indices_ventanas([len(df) for df in dfs])
+    inicios = np.sort(np.concatenate([entrenamiento, validacion]))
+    # La serie de 10 días no alcanza una ventana completa
+    assert inicios.size == (100 - VENTANA_DIAS) + (60 - VENTANA_DIAS)
+
+    serie = np.vstack([df[COLUMNAS_SERIE].to_numpy() for df in dfs])
+    x, y = _ventanas(serie, inicios)
+    esperado = np.vstack([crear_dataset_ia(df, VENTANA_DIAS).to_numpy() for df in dfs[:2]])
+    np.testing.assert_allclose(np.hstack([x.reshape(len(x), -1), y]), esperado)
+
+
+@pytest.mark.parametrize("fraccion", [0.0, 0.5, 1.0])
+def test_fraccion_por_serie(fraccion):
+    entrenamiento, validacion = indices_ventanas([50, 40], fraccion=fraccion)
+    assert entrenamiento.size == int(35 * fraccion) + int(25 * fraccion)
+    assert entrenamiento.size + validacion.size == 60